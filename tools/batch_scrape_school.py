@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """
 Batch scrape all teams for a school: teams → schedules → opponents → contacts → match
+
+Schedules for every team and the school's staff directory are loaded in one
+browser context, several pages at a time (see scrape_all_for_school).
 """
 
 import argparse
+import asyncio
 import json
 import subprocess
 import sys
 from pathlib import Path
 
+from playwright.async_api import async_playwright
+
+import scrape_schedule
+import scrape_staff_directory
+from scrape_common import USER_AGENT, block_heavy_resources_async
+
+# Pages open at once in the shared per-school context. Every page hits the same
+# athletics host, so use the same per-host limit as scrape_schedule.
+PAGES_PER_SCHOOL = scrape_schedule.PER_DOMAIN_CONCURRENCY
+
 def run_command(cmd, desc):
     """Run a command and return JSON output."""
     print(f"\n{desc}...", file=sys.stderr)
@@ -24,6 +38,92 @@ def run_command(cmd, desc):
         print(f"Failed to parse JSON output", file=sys.stderr)
         return None
 
+async def _scrape_all_for_school_async(school_name, base_url, teams, max_pages, use_cache):
+    """Scrape the staff directory and every schedule in one context; see scrape_all_for_school."""
+    sem = asyncio.Semaphore(max_pages)
+
+    async def staff_task(context):
+        if use_cache:
+            result = await asyncio.to_thread(scrape_staff_directory._scrape_from_cache,
+                                             base_url, school_name, None)
+            if result is not None:
+                return result
+        async with sem:
+            page = await context.new_page()
+            try:
+                html_content, directory_url, ready = \
+                    await scrape_staff_directory._render_staff_directory_async(page, base_url)
+            finally:
+                await page.close()
+        return await scrape_staff_directory._staff_from_render_async(
+            base_url, html_content, directory_url, ready, school_name)
+
+    async def schedule_task(context, team):
+        team_url = team.get('url', '')
+        sport = team.get('sport', 'Unknown')
+        gender = team.get('gender', 'Unknown')
+        if use_cache:
+            result = await asyncio.to_thread(scrape_schedule._scrape_from_cache,
+                                             team_url, sport, gender, school_name)
+            if result is not None:
+                return result
+        async with sem:
+            page = await context.new_page()
+            try:
+                html_content, schedule_url, ready = \
+                    await scrape_schedule._render_schedule_async(page, team_url)
+            finally:
+                await page.close()
+        return await scrape_schedule._schedule_from_render_async(
+            team_url, html_content, schedule_url, ready, sport, gender, school_name)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            # One context for the whole school: UA and resource blocking set once
+            context = await browser.new_context(user_agent=USER_AGENT)
+            await context.route("**/*", block_heavy_resources_async)
+            outcomes = await asyncio.gather(
+                staff_task(context),
+                *[schedule_task(context, team) for team in teams],
+                return_exceptions=True,
+            )
+        finally:
+            await browser.close()
+
+    staff_outcome, schedule_outcomes = outcomes[0], outcomes[1:]
+    if isinstance(staff_outcome, Exception):
+        staff_outcome = scrape_staff_directory._error_result(school_name, staff_outcome)
+    schedules = [scrape_schedule._error_result(team.get('sport', 'Unknown'), school_name, outcome)
+                 if isinstance(outcome, Exception) else outcome
+                 for team, outcome in zip(teams, schedule_outcomes)]
+    return {'staff': staff_outcome, 'schedules': schedules}
+
+
+def scrape_all_for_school(school_name, base_url, teams, max_pages=PAGES_PER_SCHOOL,
+                          use_cache=True):
+    """
+    Scrape a school's staff directory and all team schedules in one browser context.
+
+    Launches Chromium once and opens up to `max_pages` pages in parallel,
+    instead of one browser per scrape_schedule.py / scrape_staff_directory.py
+    invocation. Fresh cached renders are reused (see html_cache.py).
+
+    Args:
+        school_name (str): School name
+        base_url (str): Athletics website URL
+        teams (list): Team dicts with 'url', 'sport', 'gender' (scrape_team_list.py output)
+        max_pages (int): Maximum number of pages loading at once
+        use_cache (bool): Reuse fresh cached renders
+
+    Returns:
+        dict: {'staff': scrape_staff_directory result,
+               'schedules': one scrape_schedule result per team, in input order}
+    """
+    return asyncio.run(_scrape_all_for_school_async(school_name, base_url, teams,
+                                                    max_pages, use_cache))
+
+
 def batch_scrape_school(school_name, athletics_url):
     """Scrape all data for a school."""
 
@@ -44,29 +144,30 @@ def batch_scrape_school(school_name, athletics_url):
     teams = teams_data.get('teams', [])
     print(f"Found {len(teams)} teams", file=sys.stderr)
 
-    # Step 2: Scrape schedules for each team
+    # Step 2: Scrape schedules for each team (plus the staff directory) in one browser
+    print(f"\nScraping {len(teams)} schedules and the staff directory...", file=sys.stderr)
+    scraped = scrape_all_for_school(school_name, athletics_url, teams)
+
+    staff_file = f".tmp/{school_name.lower().replace(' ', '_')}_staff.json"
+    with open(staff_file, 'w') as f:
+        json.dump(scraped['staff'], f, indent=2)
+    print(f"Found {scraped['staff'].get('staff_found', 0)} staff members", file=sys.stderr)
+
     all_games = []
 
-    for team in teams:
-        sport = team.get('sport')
+    for team, schedule_data in zip(teams, scraped['schedules']):
+        sport = team.get('sport', 'Unknown')
         gender = team.get('gender', 'Unknown')
-        team_url = team.get('url')
 
-        print(f"\nScraping {gender}'s {sport}...", file=sys.stderr)
+        print(f"\n{gender}'s {sport}:", file=sys.stderr)
 
         schedule_file = f".tmp/{school_name.lower().replace(' ', '_')}_{gender.lower()}_{sport.lower().replace(' ', '_')}_schedule.json"
+        with open(schedule_file, 'w') as f:
+            json.dump(schedule_data, f, indent=2)
 
-        schedule_data = run_command(
-            ['python3', 'tools/scrape_schedule.py',
-             '--team-url', team_url,
-             '--sport', sport,
-             '--gender', gender,
-             '--school', school_name,
-             '--output', schedule_file],
-            f"  Scraping schedule"
-        )
-
-        if schedule_data and schedule_data.get('success'):
+        if not schedule_data.get('success'):
+            print(f"  Error: {schedule_data.get('error')}", file=sys.stderr)
+        else:
             games = schedule_data.get('games', [])
             if games:
                 print(f"  Found {len(games)} home games", file=sys.stderr)
@@ -92,6 +193,7 @@ def batch_scrape_school(school_name, athletics_url):
         'school': school_name,
         'total_games': len(all_games),
         'output_file': output_file,
+        'staff_file': staff_file,
         'success': True
     }, indent=2))
 
@@ -81,7 +81,7 @@ def detect_platform(url):
         response.raise_for_status()
 
         html_content = response.text.lower()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml')
 
         # Extract meta tags
         meta_tags = []
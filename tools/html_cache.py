@@ -0,0 +1,102 @@
+"""
+Disk cache for rendered athletics pages (schedules, staff directories).
+
+Stores the rendered HTML per page as gzipped JSON so repeat scrapes within
+the TTL skip Playwright entirely. Keys are whatever URL the caller starts
+from (team URL, athletics base URL); the entry also records the page that
+was actually rendered (schedule URL, directory URL).
+
+Usage:
+    from html_cache import get_cached_page, cache_page
+
+    cached = get_cached_page(team_url)
+    if cached is None:
+        html = page.content()
+        cache_page(team_url, html, schedule_url)
+    else:
+        html, schedule_url = cached['html'], cached['page_url']
+
+Config:
+    SCRAPE_CACHE_TTL_HOURS (env, default 12) - 0 disables cache reads
+    Cache location: .tmp/cache/html/<sha1 of key>.json.gz
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Root of every scraper cache (rendered pages, URL registry, browser profile)
+CACHE_ROOT = os.path.join(PROJECT_ROOT, '.tmp', 'cache')
+CACHE_DIR = os.path.join(CACHE_ROOT, 'html')
+DEFAULT_TTL_HOURS = 12
+
+
+def _cache_path(key):
+    """Return the cache file path for a key."""
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json.gz")
+
+
+def get_cached_page(key, ttl_hours=None):
+    """
+    Return the cached entry for `key` if it is younger than the TTL.
+
+    Args:
+        key (str): URL the scrape started from
+        ttl_hours (float): Max age in hours (default: SCRAPE_CACHE_TTL_HOURS)
+
+    Returns:
+        dict or None: {'html', 'page_url', 'fetched_at'} or None on miss/stale
+    """
+    if ttl_hours is None:
+        # Read at call time so a .env loaded by the calling tool applies
+        ttl_hours = float(os.getenv('SCRAPE_CACHE_TTL_HOURS', DEFAULT_TTL_HOURS))
+    if ttl_hours <= 0:
+        return None
+
+    path = _cache_path(key)
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get('fetched_at', 0) > ttl_hours * 3600:
+        return None
+    return entry
+
+
+def cache_page(key, html, page_url):
+    """
+    Store rendered HTML for `key` (atomic replace, safe for parallel scrapes).
+
+    Callers only store renders that are worth reusing: the page's ready
+    selector matched and parsing it yielded data (not empty pages, timeouts
+    or bot-check interstitials).
+
+    Args:
+        key (str): URL the scrape started from
+        html (str): Rendered page HTML
+        page_url (str): URL of the page the HTML came from
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    os.close(fd)
+    entry = {
+        'key': key,
+        'page_url': page_url,
+        'fetched_at': time.time(),
+        'html': html,
+    }
+    try:
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _cache_path(key))
+    finally:
+        # Left behind only if the write or rename failed
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
@@ -23,9 +23,16 @@ from urllib.parse import urljoin, urlparse
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from scrape_common import wait_for, wait_for_async
 
 load_dotenv()
 
+# Markup each page needs before it is parsed, waited on instead of a fixed
+# sleep; each wait is capped at the sleep it replaced
+TEAM_READY_SELECTOR = 'a[href*="roster"]'
+ROSTER_READY_SELECTOR = 'a[href*="/coach/"], a[href*="/staff/"]'
+BIO_READY_SELECTOR = 'a[href^="mailto:"]'
+
 
 def find_email_in_text(text, school_domain=None):
     """
@@ -133,10 +140,29 @@ def scrape_bio_page(page, bio_url, sport_name):
     """
     try:
         page.goto(bio_url, wait_until='domcontentloaded', timeout=20000)
-        page.wait_for_timeout(2000)
+        wait_for(page, BIO_READY_SELECTOR, 2000)
+
+        return _staff_from_bio_html(page.content(), bio_url, sport_name)
+
+    except Exception as e:
+        print(f"  Error scraping {bio_url}: {e}", file=sys.stderr)
+        return None
+
+
+def _staff_from_bio_html(html, bio_url, sport_name):
+    """
+    Parse a rendered coach bio page (shared by the sync and async scrapers).
 
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+    Args:
+        html (str): Bio page HTML
+        bio_url (str): Bio page URL
+        sport_name (str): Sport name
+
+    Returns:
+        dict: Staff member data or None
+    """
+    try:
+        soup = BeautifulSoup(html, 'lxml')
 
         # Get page text for searching
         page_text = soup.get_text()
@@ -210,10 +236,23 @@ def discover_roster_url(page, team_url):
     """
     try:
         page.goto(team_url, wait_until='domcontentloaded', timeout=20000)
-        page.wait_for_timeout(2000)
+        wait_for(page, TEAM_READY_SELECTOR, 2000)
+
+        roster_url = _roster_link_from_html(page.content(), team_url)
+        if roster_url:
+            return roster_url
 
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+    except Exception as e:
+        print(f"  Could not auto-discover roster URL: {e}", file=sys.stderr)
+
+    # Fallback: construct from team URL
+    return f"{team_url}/roster/"
+
+
+def _roster_link_from_html(html, team_url):
+    """Return this sport's "Roster" nav link from a team page's HTML, or None."""
+    try:
+        soup = BeautifulSoup(html, 'lxml')
 
         # Get the sport path from team_url for matching
         sport_path = team_url.split('/sports/')[-1].split('/')[0] if '/sports/' in team_url else ''
@@ -233,8 +272,7 @@ def discover_roster_url(page, team_url):
     except Exception as e:
         print(f"  Could not auto-discover roster URL: {e}", file=sys.stderr)
 
-    # Fallback: construct from team URL
-    return f"{team_url}/roster/"
+    return None
 
 
 def find_coach_bio_links(page, roster_url):
@@ -250,29 +288,33 @@ def find_coach_bio_links(page, roster_url):
     """
     try:
         page.goto(roster_url, wait_until='networkidle', timeout=60000)
-        page.wait_for_timeout(3000)
+        wait_for(page, ROSTER_READY_SELECTOR, 3000)
 
-        html = page.content()
-        soup = BeautifulSoup(html, 'html.parser')
+        return _bio_links_from_html(page.content(), roster_url)
 
-        # Find all links
-        all_links = soup.find_all('a', href=True)
+    except Exception as e:
+        print(f"Error finding bio links: {e}", file=sys.stderr)
+        return []
 
-        bio_urls = set()
-        for link in all_links:
-            href = link.get('href', '')
 
-            # Look for coach/staff bio URLs
-            if '/coach/' in href or '/staff/' in href:
-                # Make absolute URL
-                absolute_url = urljoin(roster_url, href)
-                bio_urls.add(absolute_url)
+def _bio_links_from_html(html, roster_url):
+    """Absolute coach/staff bio URLs linked from a roster page's HTML."""
+    soup = BeautifulSoup(html, 'lxml')
 
-        return list(bio_urls)
+    # Find all links
+    all_links = soup.find_all('a', href=True)
 
-    except Exception as e:
-        print(f"Error finding bio links: {e}", file=sys.stderr)
-        return []
+    bio_urls = set()
+    for link in all_links:
+        href = link.get('href', '')
+
+        # Look for coach/staff bio URLs
+        if '/coach/' in href or '/staff/' in href:
+            # Make absolute URL
+            absolute_url = urljoin(roster_url, href)
+            bio_urls.add(absolute_url)
+
+    return list(bio_urls)
 
 
 def scrape_coach_bios(roster_url, sport_name, school_name, team_url=None):
@@ -303,21 +345,13 @@ def scrape_coach_bios(roster_url, sport_name, school_name, team_url=None):
                 roster_url = discover_roster_url(page, team_url)
 
             # Find coach bio links
-            print(f"Finding coach bio links on roster page...", file=sys.stderr)
+            print("Finding coach bio links on roster page...", file=sys.stderr)
             bio_urls = find_coach_bio_links(page, roster_url)
             print(f"Found {len(bio_urls)} bio pages", file=sys.stderr)
 
             if not bio_urls:
                 browser.close()
-                return {
-                    "school": school_name,
-                    "sport": sport_name,
-                    "roster_url": roster_url,
-                    "staff_found": 0,
-                    "staff": [],
-                    "success": True,
-                    "timestamp": str(datetime.now()),
-                }
+                return _coach_bios_result(school_name, sport_name, roster_url, [])
 
             # Scrape each bio page
             staff_members = []
@@ -330,40 +364,121 @@ def scrape_coach_bios(roster_url, sport_name, school_name, team_url=None):
 
             browser.close()
 
-        # Remove duplicates by name
-        unique_staff = {}
-        for staff in staff_members:
-            if staff['name'] not in unique_staff:
-                unique_staff[staff['name']] = staff
-
-        staff_list = list(unique_staff.values())
-
-        result = {
-            "school": school_name,
-            "sport": sport_name,
-            "roster_url": roster_url,
-            "staff_found": len(staff_list),
-            "staff": staff_list,
-            "success": True,
-            "timestamp": str(datetime.now()),
-        }
-
-        return result
-
-    except PlaywrightTimeout:
-        return {
-            "school": school_name,
-            "sport": sport_name,
-            "error": "Timeout loading roster page",
-            "success": False,
-        }
+        return _coach_bios_result(school_name, sport_name, roster_url, staff_members)
+
+    except Exception as e:
+        return _coach_bios_error(school_name, sport_name, e)
+
+
+async def scrape_coach_bios_async(context, roster_url, sport_name, school_name, team_url=None,
+                                  page_cache=None):
+    """
+    Async counterpart of scrape_coach_bios on a caller's open browser.
+
+    Lets another scraper run this fallback in-process on the browser it
+    already has instead of spawning this tool. Bio pages are visited in turn
+    on one tab, as in the sync version.
+
+    Args:
+        context: Anything with an async new_page() - a Playwright async
+            BrowserContext, or scrape_team_staff's BrowserSession
+        roster_url (str): Roster page URL (or team page URL if team_url is provided)
+        sport_name (str): Sport name
+        school_name (str): School name
+        team_url (str, optional): Team page URL for auto-discovering roster URL
+        page_cache (dict, optional): {url without trailing slash: HTML} of pages
+            the caller already loaded; a cached roster page with bio links
+            isn't navigated to again
+
+    Returns:
+        dict: Result with staff list (same shape as scrape_coach_bios)
+    """
+    try:
+        page = await context.new_page()
+        try:
+            # If team_url provided, try to discover actual roster URL
+            if team_url:
+                discovered = None
+                try:
+                    await page.goto(team_url, wait_until='domcontentloaded', timeout=20000)
+                    await wait_for_async(page, TEAM_READY_SELECTOR, 2000)
+                    discovered = _roster_link_from_html(await page.content(), team_url)
+                except Exception as e:
+                    print(f"  Could not auto-discover roster URL: {e}", file=sys.stderr)
+                roster_url = discovered or f"{team_url}/roster/"
+
+            # Find coach bio links
+            print("Finding coach bio links on roster page...", file=sys.stderr)
+            try:
+                # The caller's snapshot was taken without waiting for the bio
+                # links, so it only stands in for the roster when it has them
+                roster_html = (page_cache or {}).get(roster_url.rstrip('/'))
+                bio_urls = _bio_links_from_html(roster_html, roster_url) if roster_html else []
+                if not bio_urls:
+                    await page.goto(roster_url, wait_until='networkidle', timeout=60000)
+                    await wait_for_async(page, ROSTER_READY_SELECTOR, 3000)
+                    bio_urls = _bio_links_from_html(await page.content(), roster_url)
+            except Exception as e:
+                print(f"Error finding bio links: {e}", file=sys.stderr)
+                bio_urls = []
+            print(f"Found {len(bio_urls)} bio pages", file=sys.stderr)
+
+            # Scrape each bio page
+            staff_members = []
+            for i, bio_url in enumerate(bio_urls, 1):
+                print(f"  Scraping bio {i}/{len(bio_urls)}: {bio_url}", file=sys.stderr)
+                try:
+                    await page.goto(bio_url, wait_until='domcontentloaded', timeout=20000)
+                    await wait_for_async(page, BIO_READY_SELECTOR, 2000)
+                    staff = _staff_from_bio_html(await page.content(), bio_url, sport_name)
+                except Exception as e:
+                    print(f"  Error scraping {bio_url}: {e}", file=sys.stderr)
+                    staff = None
+                if staff:
+                    staff_members.append(staff)
+                    print(f"    ✓ Found: {staff['name']} ({staff['title']})", file=sys.stderr)
+        finally:
+            await page.close()
+
+        return _coach_bios_result(school_name, sport_name, roster_url, staff_members)
+
     except Exception as e:
-        return {
-            "school": school_name,
-            "sport": sport_name,
-            "error": f"Error scraping coach bios: {str(e)}",
-            "success": False,
-        }
+        return _coach_bios_error(school_name, sport_name, e)
+
+
+def _coach_bios_result(school_name, sport_name, roster_url, staff_members):
+    """Build the tool's result dict, keeping the first staff entry per name."""
+    # Remove duplicates by name
+    unique_staff = {}
+    for staff in staff_members:
+        if staff['name'] not in unique_staff:
+            unique_staff[staff['name']] = staff
+
+    staff_list = list(unique_staff.values())
+
+    return {
+        "school": school_name,
+        "sport": sport_name,
+        "roster_url": roster_url,
+        "staff_found": len(staff_list),
+        "staff": staff_list,
+        "success": True,
+        "timestamp": str(datetime.now()),
+    }
+
+
+def _coach_bios_error(school_name, sport_name, error):
+    """Failure result (same shape for the sync and async scrapers)."""
+    if isinstance(error, PlaywrightTimeout):
+        message = "Timeout loading roster page"
+    else:
+        message = f"Error scraping coach bios: {str(error)}"
+    return {
+        "school": school_name,
+        "sport": sport_name,
+        "error": message,
+        "success": False,
+    }
 
 
 def main():
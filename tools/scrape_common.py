@@ -0,0 +1,178 @@
+"""
+Browser settings shared by the athletics scrapers (team list, schedules,
+staff directories, team staff).
+
+Usage:
+    from scrape_common import (USER_AGENT, block_heavy_resources, dump_json,
+                               persistent_context, wait_for)
+
+    context = browser.new_context(user_agent=USER_AGENT)
+    context.route("**/*", block_heavy_resources)
+
+    with sync_playwright() as p, persistent_context(p) as context:
+        page = context.new_page()
+        page.goto(url)
+        wait_for(page, '.s-person-card')
+
+    sys.stdout.buffer.write(dump_json(result))
+
+Config:
+    SCRAPE_ALLOW_STYLESHEETS (env) - 1/true/yes stops aborting CSS, for sites
+        that only render their content once stylesheets load
+"""
+
+import json
+import os
+import re
+import sys
+from contextlib import asynccontextmanager, contextmanager
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+from html_cache import CACHE_ROOT
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+USER_AGENT = ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+              "AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/120.0.0.0 Safari/537.36")
+
+# Resource types aborted before navigation - the scrapers only read the DOM
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+if os.getenv('SCRAPE_ALLOW_STYLESHEETS', '').lower() in ('1', 'true', 'yes'):
+    BLOCKED_RESOURCE_TYPES.discard('stylesheet')
+# Analytics/ad hosts aborted whatever the resource type (their beacons never idle)
+BLOCKED_HOST_SUBSTRINGS = (
+    'googletagmanager', 'google-analytics', 'doubleclick', 'sentry',
+    'hotjar', 'facebook.net', 'sidearmstats',
+)
+_BLOCKED_HOST_RE = re.compile('|'.join(map(re.escape, BLOCKED_HOST_SUBSTRINGS)))
+
+# Persistent Chromium profile shared by the single-page scrapers. Only its HTTP
+# cache and cookies carry over between runs (DNS and TLS sessions do not).
+BROWSER_PROFILE_DIR = os.path.join(CACHE_ROOT, 'chromium_profile')
+
+
+def _is_blocked(request):
+    """True if a request is a heavy resource or goes to a tracking host."""
+    return (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or _BLOCKED_HOST_RE.search(request.url) is not None)
+
+
+def block_heavy_resources(route):
+    """Playwright route handler: abort images/fonts/media (and CSS by default) and trackers."""
+    if _is_blocked(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def block_heavy_resources_async(route):
+    """Async counterpart of block_heavy_resources."""
+    if _is_blocked(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@contextmanager
+def persistent_context(p, **options):
+    """
+    Open the persistent Chromium profile (BROWSER_PROFILE_DIR) as a context.
+
+    Falls back to a throwaway browser context when the profile is locked by
+    another running scrape; that browser is closed together with the context.
+
+    Args:
+        p: Started sync Playwright instance
+        **options: Extra BrowserContext options (e.g. java_script_enabled)
+
+    Yields:
+        BrowserContext: Context to scrape in (closed on exit)
+    """
+    browser = None
+    try:
+        context = p.chromium.launch_persistent_context(BROWSER_PROFILE_DIR, headless=True,
+                                                       user_agent=USER_AGENT, **options)
+    except Exception as e:
+        print(f"Browser profile unavailable, using a fresh one: {str(e)}", file=sys.stderr)
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context(user_agent=USER_AGENT, **options)
+    try:
+        yield context
+    finally:
+        context.close()
+        if browser is not None:
+            browser.close()
+
+
+@asynccontextmanager
+async def persistent_context_async(p, **options):
+    """Async counterpart of persistent_context (p is a started async Playwright)."""
+    browser = None
+    try:
+        context = await p.chromium.launch_persistent_context(BROWSER_PROFILE_DIR, headless=True,
+                                                             user_agent=USER_AGENT, **options)
+    except Exception as e:
+        print(f"Browser profile unavailable, using a fresh one: {str(e)}", file=sys.stderr)
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(user_agent=USER_AGENT, **options)
+    try:
+        yield context
+    finally:
+        await context.close()
+        if browser is not None:
+            await browser.close()
+
+
+def wait_for(page, selector, timeout=10000, fallback_delay=0):
+    """
+    Wait until `selector` is in the DOM, or `timeout` ms at most.
+
+    Args:
+        page: Playwright (sync) page object
+        selector (str): CSS selector signalling the content is rendered
+        timeout (int): Upper bound in milliseconds
+        fallback_delay (int): Extra fixed delay in milliseconds when the
+            selector never appears (e.g. content carried as embedded JSON)
+
+    Returns:
+        bool: True if the selector appeared, False if the wait timed out
+    """
+    try:
+        page.wait_for_selector(selector, state='attached', timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        if fallback_delay:
+            page.wait_for_timeout(fallback_delay)
+        return False
+
+
+async def wait_for_async(page, selector, timeout=10000, fallback_delay=0):
+    """Async counterpart of wait_for."""
+    try:
+        await page.wait_for_selector(selector, state='attached', timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        if fallback_delay:
+            await page.wait_for_timeout(fallback_delay)
+        return False
+
+
+def dump_json(result):
+    """
+    Serialize a tool result as indented JSON, for both --output and stdout.
+
+    Args:
+        result (dict or list): Tool result(s)
+
+    Returns:
+        bytes: UTF-8 JSON (orjson when installed, else the stdlib encoder)
+    """
+    if orjson:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2)
+    # Same bytes as orjson: non-ASCII characters are written as UTF-8, not escaped
+    return json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
@@ -7,27 +7,106 @@ Usage:
     python tools/scrape_schedule.py --team-url "https://bceagles.com/sports/mens-soccer" \
         --sport "Soccer" --gender "Men" --school "Boston College"
 
+    # Batch mode: every team from scrape_team_list.py output, loaded in parallel
+    python tools/scrape_schedule.py --teams-file .tmp/boston_college_teams.json \
+        --school "Boston College" --concurrency 8
+
 Output: JSON list of home games with date, time, opponent, venue
 Filters: Home games only, current academic year (Aug-May), future dates only
 """
 
 import argparse
+import asyncio
+import calendar
 import json
 import sys
 import re
 from datetime import datetime, timedelta
-from urllib.parse import urljoin, urlparse
+from collections import defaultdict
+from urllib.parse import urljoin, urlparse, urlsplit
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
 import os
 
+from html_cache import get_cached_page, cache_page
+from scrape_common import (USER_AGENT, block_heavy_resources, block_heavy_resources_async,
+                           dump_json, persistent_context, wait_for, wait_for_async)
+
 load_dotenv()
 
 # Academic year configuration
 ACADEMIC_YEAR_START_MONTH = int(os.getenv('ACADEMIC_YEAR_START_MONTH', 8))  # August
 ACADEMIC_YEAR_END_MONTH = int(os.getenv('ACADEMIC_YEAR_END_MONTH', 5))      # May
 
+# Batch mode (--teams-file): pages loaded in parallel, overall and per athletics site
+DEFAULT_CONCURRENCY = 8
+PER_DOMAIN_CONCURRENCY = 4
+
+# Markup that signals a rendered schedule (containers used by the parsers below)
+SCHEDULE_READY_SELECTOR = ', '.join([
+    '.s-game-card',
+    '.sidearm-schedule-game',
+    '.sidearm-schedule-game-row',
+    '.schedule-game',
+    '.game-item',
+    '.schedule-item',
+    '[data-game-id]',
+    '.event-row',
+    'table.sidearm-table',
+    'table.schedule',
+    # Plain <table> schedules (parse_schedule_table): a data row has rendered
+    'table tbody tr td',
+])
+# Extra wait (ms) when no schedule markup appears, e.g. pages that only carry
+# the schedule as embedded JSON
+SCHEDULE_FALLBACK_DELAY = 1500
+
+# Modern Sidearm card tokens, matched against the pipe-joined card text. A date
+# part names a month, abbreviated or not ("Feb 24", "March 3", "Sept. 5").
+_DATE_TOKEN_RE = re.compile(
+    r'[^|]*\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?(?![a-z])[^|]*')
+_TIME_TOKEN_RE = re.compile(r'\b\d{1,2}:\d{2}\s*(?:AM|PM)\b', re.IGNORECASE)
+
+# Sidearm nextgen "events" array scanning (see _scan_events_arrays)
+_BRACKET_RE = re.compile(r'[\[\]]')
+
+# parse_game_date pre-cleaning: "(Sat)" suffixes and "Sat." prefixes
+_PAREN_RE = re.compile(r'\s*\([^)]+\)')
+# Every accepted date shape has a digit; prose cells ("TBA", "Postponed") bail out early
+_HAS_DIGIT_RE = re.compile(r'\d')
+_WEEKDAY_RE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s+', re.IGNORECASE)
+
+# Schedule date shapes accepted by parse_game_date (after weekday stripping):
+# "2/24", "2/24/2026", "2-24-26", "2026-02-24", "Feb 24", "February 24, 2026"
+_DATE_RE = re.compile(
+    r'^(?:(?P<m1>\d{1,2})(?P<sep>[/-])(?P<d1>\d{1,2})(?:(?P=sep)(?P<y1>\d{4}|\d{2}))?'
+    r'|(?P<y2>\d{4})-(?P<m2>\d{1,2})-(?P<d2>\d{1,2})'
+    r'|(?P<mon>[A-Za-z]{3,9})\s+(?P<d3>\d{1,2})(?:,\s*(?P<y3>\d{4}))?)$'
+)
+# Month number by full name and every prefix of 3+ letters ("feb", "sept",
+# "february"). calendar names follow LC_TIME, which these tools never change
+# from the C locale, so they are always English.
+_MONTHS = {name[:n].lower(): number
+           for number, name in enumerate(calendar.month_name) if name
+           for n in range(3, len(name) + 1)}
+
+# Characters that mark a result cell as a completed game
+_WIN_LOSS_CHARS = frozenset('WL-')    # schedule tables
+_RESULT_CHARS = frozenset('WLT-')     # list/card layouts
+_PRESTO_RESULT_CHARS = frozenset('WLT')  # PrestoSports (scores checked separately)
+
+# PrestoSports URL patterns (see find_schedule_page)
+_BOXSCORE_RE = re.compile(r'(/sports/[a-z]+/\d{4}-\d{2})/(boxscores|releases|stats|recap)/')
+_PRESTO_RE = re.compile(r'/sports/([a-z]+)(?:/(\d{4}-\d{2}))?$')
+_PRESTO_SPORT_CODES = frozenset({
+    'bsb', 'sball', 'mbkb', 'wbkb', 'msoc', 'wsoc', 'mlax', 'wlax',
+    'mten', 'wten', 'mvball', 'wvball', 'mih', 'wih', 'fh', 'fball',
+    'base', 'soft', 'golf', 'mgolf', 'wgolf', 'mswim', 'wswim',
+    'track', 'xc', 'mxc', 'wxc', 'wres', 'row', 'crew',
+})
+
 
 def get_academic_year_range():
     """
@@ -56,10 +135,10 @@ def get_academic_year_range():
 
 def find_schedule_page(page, team_url):
     """
-    Navigate to the schedule page from a team's main page.
+    Build the schedule page URL for a team (no page load needed).
 
     Args:
-        page: Playwright page object
+        page: Playwright page object (unused; the URL comes from team_url alone)
         team_url (str): Team's main page URL
 
     Returns:
@@ -78,23 +157,19 @@ def find_schedule_page(page, team_url):
     # Handle PrestoSports boxscore/release URLs (Lasell bug: team discovery returns these)
     # e.g., /sports/bsb/2025-26/boxscores/20260228_eoph.xml -> /sports/bsb/2025-26
     # e.g., /sports/mlax/2025-26/releases/20260221_4vsh -> /sports/mlax/2025-26
-    boxscore_match = re.search(r'(/sports/[a-z]+/\d{4}-\d{2})/(boxscores|releases|stats|recap)/', base_url)
+    boxscore_match = _BOXSCORE_RE.search(base_url)
     if boxscore_match:
         base_url = base_url[:boxscore_match.end(1)]
 
     # Check if this is a PrestoSports URL pattern (e.g., /sports/bsb or /sports/bsb/2025-26)
     # PrestoSports uses short sport codes (2-5 chars): bsb, sball, mbkb, wbkb, etc.
     # Sidearm uses descriptive names: baseball, softball, mens-soccer, etc.
-    presto_match = re.search(r'/sports/([a-z]+)(?:/(\d{4}-\d{2}))?$', base_url)
+    presto_match = _PRESTO_RE.search(base_url)
     # Only treat as PrestoSports if sport code is short (<=5 chars) or already has a season year
-    presto_sport_codes = {'bsb', 'sball', 'mbkb', 'wbkb', 'msoc', 'wsoc', 'mlax', 'wlax',
-                          'mten', 'wten', 'mvball', 'wvball', 'mih', 'wih', 'fh', 'fball',
-                          'base', 'soft', 'golf', 'mgolf', 'wgolf', 'mswim', 'wswim',
-                          'track', 'xc', 'mxc', 'wxc', 'wres', 'row', 'crew'}
     if presto_match:
         sport_code = presto_match.group(1)
         season = presto_match.group(2)
-        if not season and sport_code not in presto_sport_codes and len(sport_code) > 5:
+        if not season and sport_code not in _PRESTO_SPORT_CODES and len(sport_code) > 5:
             # Long sport name = Sidearm, just append /schedule
             return f"{base_url}/schedule"
         if not season:
@@ -105,26 +180,193 @@ def find_schedule_page(page, team_url):
             else:
                 season = f"{today.year - 1}-{str(today.year)[-2:]}"
             # Return PrestoSports URL with season
-            parsed = urlparse(base_url)
-            return f"{parsed.scheme}://{parsed.netloc}/sports/{sport_code}/{season}/schedule"
+            parts = urlsplit(base_url)
+            return f"{parts.scheme}://{parts.netloc}/sports/{sport_code}/{season}/schedule"
 
     # Default: Sidearm Sports pattern (just append /schedule)
     return f"{base_url}/schedule"
 
 
-def extract_schedule_from_scripts(soup, base_url):
+def _build_soup(html, parser='lxml', targets=None):
+    """
+    Parse HTML, optionally keeping only the given tags (and their subtrees).
+
+    Args:
+        html (str): Page HTML
+        parser (str): BeautifulSoup parser backend
+        targets (list): Tag names to keep, or None for the full tree
+
+    Returns:
+        BeautifulSoup: Parsed document
+    """
+    if targets:
+        return BeautifulSoup(html, parser, parse_only=SoupStrainer(targets))
+    return BeautifulSoup(html, parser)
+
+
+def _fast_text(el):
+    """
+    Stripped text of an element, skipping the subtree walk for leaf elements.
+
+    Equivalent to el.get_text(strip=True) when the element wraps a single
+    string; composite elements fall back to get_text.
+    """
+    s = el.string
+    return s.strip() if s is not None else el.get_text(strip=True)
+
+
+def _add_game(games, seen, game):
+    """
+    Append a game unless one with the same (date, time, opponent) was already added.
+
+    Pages often expose the same schedule twice (embedded JSON plus a visible
+    table, or one card per viewport), so duplicates are dropped on insert.
+
+    Args:
+        games (list): Games collected so far
+        seen (set): Keys of games already in `games`
+        game (dict): Game to add
+    """
+    key = (game['date'], game['time'], game['opponent'])
+    if key not in seen:
+        seen.add(key)
+        games.append(game)
+
+
+def _scan_events_arrays(text):
+    """
+    Find every "events": [...] array in a script and decode it.
+
+    Uses bracket counting to find the end of each array.
+
+    Args:
+        text (str): Script or page text
+
+    Returns:
+        list: Decoded events (all arrays concatenated)
+    """
+    events_list = []
+    search_start = 0
+    while True:
+        idx = text.find('"events":', search_start)
+        if idx == -1:
+            break
+        # Find the opening bracket
+        bracket_start = text.find('[', idx)
+        if bracket_start == -1:
+            break
+        # Count brackets to find the end
+        depth = 0
+        end = -1
+        for m in _BRACKET_RE.finditer(text, bracket_start):
+            if m.group(0) == '[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    end = m.end()
+                    break
+        if end == -1:
+            break
+        try:
+            events_list.extend(json.loads(text[bracket_start:end]))
+        except ValueError:
+            pass
+        search_start = end
+
+    return events_list
+
+
+def _games_from_sidearm_events(events_list):
+    """
+    Convert Sidearm nextgen event objects into home game dictionaries.
+
+    Args:
+        events_list (list): Decoded "events" entries
+
+    Returns:
+        list: List of game dictionaries (upcoming home games only)
+    """
+    games = []
+    seen = set()
+
+    for event in events_list:
+        try:
+            if not isinstance(event, dict):
+                continue
+
+            # Sidearm nextgen format
+            opponent_data = event.get('opponent', {})
+            if isinstance(opponent_data, dict):
+                opponent = opponent_data.get('name', '')
+            elif isinstance(opponent_data, str):
+                opponent = opponent_data
+            else:
+                opponent = ''
+
+            date_str = event.get('date', '')
+            time_str = event.get('time', '')
+            location_indicator = event.get('location_indicator', '').upper()
+            is_home = location_indicator == 'H'
+
+            # Check result - skip completed games
+            result_data = event.get('result', {})
+            if isinstance(result_data, dict) and result_data.get('status'):
+                continue  # Has a result, game is completed
+
+            # Get facility/venue
+            facility = event.get('game_facility', {})
+            venue = ''
+            if isinstance(facility, dict):
+                venue = facility.get('title', '')
+            location = event.get('location', '')
+            if location and venue:
+                venue = f"{venue}, {location}"
+            elif location:
+                venue = location
+
+            if opponent and is_home:
+                # Parse ISO date format if present
+                if 'T' in date_str:
+                    try:
+                        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                        date_display = dt.strftime('%b %d')
+                    except (ValueError, TypeError):
+                        date_display = date_str
+                else:
+                    date_display = date_str
+
+                _add_game(games, seen, {
+                    'date': date_display,
+                    'time': time_str,
+                    'opponent': clean_opponent_name(str(opponent)),
+                    'venue': venue,
+                    'is_home': True,
+                })
+
+        except (TypeError, KeyError):
+            continue
+
+    return games
+
+
+def extract_schedule_from_scripts(html, base_url):
     """
     Extract schedule data from embedded JSON/JavaScript (for dynamically rendered pages).
     Handles both standard JSON script tags and Sidearm nextgen window.sidearmComponents.
 
+    Only <script> tags are parsed, so the rest of the page tree is never built.
+
     Args:
-        soup: BeautifulSoup object
+        html (str): Page HTML
         base_url (str): Base URL
 
     Returns:
         list: List of game dictionaries
     """
     games = []
+    seen = set()
+    soup = _build_soup(html, targets=['script'])
 
     # === Strategy 1: Sidearm nextgen window.sidearmComponents ===
     # Modern Sidearm sites store schedule data as JS objects in script tags
@@ -136,93 +378,8 @@ def extract_schedule_from_scripts(soup, base_url):
 
         # Try to extract JSON from window.sidearmComponents
         try:
-            # Strategy: Find "events": and use bracket counting to extract the full array
-            events_list = []
-            search_start = 0
-            while True:
-                idx = script_text.find('"events":', search_start)
-                if idx == -1:
-                    break
-                # Find the opening bracket
-                bracket_start = script_text.find('[', idx)
-                if bracket_start == -1:
-                    break
-                # Count brackets to find the end
-                depth = 0
-                pos = bracket_start
-                while pos < len(script_text):
-                    if script_text[pos] == '[':
-                        depth += 1
-                    elif script_text[pos] == ']':
-                        depth -= 1
-                        if depth == 0:
-                            break
-                    pos += 1
-                if depth == 0:
-                    array_text = script_text[bracket_start:pos+1]
-                    try:
-                        events_list.extend(json.loads(array_text))
-                    except json.JSONDecodeError:
-                        pass
-                search_start = pos + 1
-
-            for event in events_list:
-                try:
-                    if not isinstance(event, dict):
-                        continue
-
-                    # Sidearm nextgen format
-                    opponent_data = event.get('opponent', {})
-                    if isinstance(opponent_data, dict):
-                        opponent = opponent_data.get('name', '')
-                    elif isinstance(opponent_data, str):
-                        opponent = opponent_data
-                    else:
-                        opponent = ''
-
-                    date_str = event.get('date', '')
-                    time_str = event.get('time', '')
-                    location_indicator = event.get('location_indicator', '').upper()
-                    is_home = location_indicator == 'H'
-
-                    # Check result - skip completed games
-                    result_data = event.get('result', {})
-                    if isinstance(result_data, dict) and result_data.get('status'):
-                        continue  # Has a result, game is completed
-
-                    # Get facility/venue
-                    facility = event.get('game_facility', {})
-                    venue = ''
-                    if isinstance(facility, dict):
-                        venue = facility.get('title', '')
-                    location = event.get('location', '')
-                    if location and venue:
-                        venue = f"{venue}, {location}"
-                    elif location:
-                        venue = location
-
-                    if opponent and is_home:
-                        # Parse ISO date format if present
-                        if 'T' in date_str:
-                            try:
-                                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                                date_display = dt.strftime('%b %d')
-                            except (ValueError, TypeError):
-                                date_display = date_str
-                        else:
-                            date_display = date_str
-
-                        games.append({
-                            'date': date_display,
-                            'time': time_str,
-                            'opponent': clean_opponent_name(str(opponent)),
-                            'venue': venue,
-                            'is_home': True,
-                        })
-
-                except (TypeError, KeyError):
-                    continue
-
+            for game in _games_from_sidearm_events(_scan_events_arrays(script_text)):
+                _add_game(games, seen, game)
         except Exception as e:
             import sys
             print(f"  Warning: Failed to parse script tag for games: {e}", file=sys.stderr)
@@ -291,7 +448,7 @@ def extract_schedule_from_scripts(soup, base_url):
                     result = game_data.get('result') or game_data.get('score') or ''
 
                     if opponent and is_home and not result:
-                        games.append({
+                        _add_game(games, seen, {
                             'date': str(date),
                             'time': str(time),
                             'opponent': clean_opponent_name(str(opponent)),
@@ -317,6 +474,7 @@ def parse_schedule_table(soup, base_url):
         list: List of game dictionaries
     """
     games = []
+    seen = set()
 
     # Find tables that might contain schedule
     tables = soup.find_all('table')
@@ -369,7 +527,7 @@ def parse_schedule_table(soup, base_url):
                 # Skip completed games (if result column exists and has data)
                 if result_col is not None and len(cols) > result_col:
                     result_text = cols[result_col].get_text(strip=True)
-                    if result_text and any(c in result_text for c in ['W', 'L', '-']):
+                    if result_text and not _WIN_LOSS_CHARS.isdisjoint(result_text):
                         continue  # Skip completed games
 
                 # Determine if it's a home game
@@ -383,7 +541,7 @@ def parse_schedule_table(soup, base_url):
                         'venue': location_text,
                         'is_home': True,
                     }
-                    games.append(game)
+                    _add_game(games, seen, game)
 
             except (IndexError, AttributeError) as e:
                 continue
@@ -403,6 +561,7 @@ def parse_schedule_list(soup, base_url):
         list: List of game dictionaries
     """
     games = []
+    seen = set()
 
     # Look for game containers/cards
     game_selectors = [
@@ -441,24 +600,21 @@ def parse_schedule_list(soup, base_url):
                 venue_text = parts[2] if len(parts) > 2 else ''
                 location_text = parts[3] if len(parts) > 3 else ''
 
-                # Find date and time (usually after location)
-                date_text = ''
-                time_text = ''
-                for i, part in enumerate(parts[4:], start=4):
-                    # Date is usually something like "Feb 24" or contains numbers
-                    if any(month in part for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
-                        date_text = part
-                    # Time contains ':'
-                    if ':' in part and ('AM' in part.upper() or 'PM' in part.upper()):
-                        time_text = part
-                        break
+                # Find date and time (usually after location) - e.g. "Feb 24", "2:00 PM".
+                # The date is the last month part before the first time.
+                tail_text = '|'.join(parts[4:])
+                time_match = _TIME_TOKEN_RE.search(tail_text)
+                date_parts = _DATE_TOKEN_RE.findall(
+                    tail_text[:time_match.start()] if time_match else tail_text)
+                date_text = date_parts[-1].strip() if date_parts else ''
+                time_text = time_match.group(0) if time_match else ''
 
                 full_location = f"{venue_text}, {location_text}".strip(', ')
 
             else:
                 # Fallback to traditional parsing for other formats
                 opponent_elem = card.select_one('.sidearm-schedule-game-opponent-name, .opponent-name, .opponent')
-                opponent_text = opponent_elem.get_text(strip=True) if opponent_elem else ''
+                opponent_text = _fast_text(opponent_elem) if opponent_elem else ''
 
                 date_elem = card.select_one('.sidearm-schedule-game-opponent-date, .sidearm-schedule-game-date, .game-date, .date, time')
                 # Tufts format has date and time in same element with spans
@@ -477,10 +633,10 @@ def parse_schedule_list(soup, base_url):
                 # Fallback to separate time element if not found in date element
                 if not time_text:
                     time_elem = card.select_one('.sidearm-schedule-game-time, .game-time, .time')
-                    time_text = time_elem.get_text(strip=True) if time_elem else ''
+                    time_text = _fast_text(time_elem) if time_elem else ''
 
                 location_elem = card.select_one('.sidearm-schedule-game-location, .game-location, .location, .venue')
-                location_text = location_elem.get_text(strip=True) if location_elem else ''
+                location_text = _fast_text(location_elem) if location_elem else ''
                 full_location = location_text
 
                 # Check for home/away
@@ -513,8 +669,8 @@ def parse_schedule_list(soup, base_url):
             # Skip completed games (look for result indicators)
             result_elem = card.select_one('.sidearm-schedule-game-result, .game-result, .result, .score')
             if result_elem:
-                result_text = result_elem.get_text(strip=True)
-                if result_text and any(indicator in result_text.upper() for indicator in ['W', 'L', 'T', '-']):
+                result_text = _fast_text(result_elem)
+                if result_text and not _RESULT_CHARS.isdisjoint(result_text.upper()):
                     continue
 
             # Also check if 'W' or 'L' appears in the text
@@ -528,7 +684,7 @@ def parse_schedule_list(soup, base_url):
                 'venue': full_location,
                 'is_home': True,
             }
-            games.append(game)
+            _add_game(games, seen, game)
 
         except Exception as e:
             continue
@@ -555,6 +711,7 @@ def parse_prestosports_schedule(soup, base_url):
         list: List of game dictionaries
     """
     games = []
+    seen = set()
 
     # Find all event rows
     event_rows = soup.select('.event-row')
@@ -607,7 +764,7 @@ def parse_prestosports_schedule(soup, base_url):
 
             # Extract opponent name
             team_name_elem = row.select_one('.team-name')
-            opponent = team_name_elem.get_text(strip=True) if team_name_elem else ''
+            opponent = _fast_text(team_name_elem) if team_name_elem else ''
             if not opponent:
                 opponent_elem = row.select_one('.opponent, .event-opponent-name')
                 opponent = opponent_elem.get_text(strip=True) if opponent_elem else ''
@@ -635,7 +792,7 @@ def parse_prestosports_schedule(soup, base_url):
             if not date_text:
                 e_date_elem = row.select_one('.e_date')
                 if e_date_elem:
-                    day_text = e_date_elem.get_text(strip=True)
+                    day_text = _fast_text(e_date_elem)
                     # Strip day-of-week prefix: "Sun. 8" -> "8"
                     day_num = re.sub(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s*', '', day_text, flags=re.IGNORECASE).strip()
                     # Get month from context map
@@ -662,7 +819,7 @@ def parse_prestosports_schedule(soup, base_url):
             # Try multiple selectors: .status (Suffolk), .e_status (Fisher), .event-time (modern)
             time_elem = row.select_one('.status span, .status, .e_status, .event-time')
             if time_elem:
-                time_text = time_elem.get_text(strip=True)
+                time_text = _fast_text(time_elem)
                 # Remove timezone suffixes like "EST"
                 time_text = re.sub(r'\s*(EST|CST|MST|PST|EDT|CDT|MDT|PDT)\s*$', '', time_text).strip()
 
@@ -670,15 +827,15 @@ def parse_prestosports_schedule(soup, base_url):
             venue_text = ''
             venue_elem = row.select_one('.venue, .event-neutralsite, .location, .e_notes')
             if venue_elem:
-                venue_text = venue_elem.get_text(strip=True)
+                venue_text = _fast_text(venue_elem)
                 # Clean up venue prefix
                 venue_text = re.sub(r'^@\s*', '', venue_text)
 
             # Skip completed games - check for result
             result_elem = row.select_one('.result, .event-result, .e_result')
             if result_elem:
-                result_text = result_elem.get_text(strip=True)
-                if result_text and any(c in result_text.upper() for c in ['W', 'L', 'T']):
+                result_text = _fast_text(result_elem)
+                if result_text and not _PRESTO_RESULT_CHARS.isdisjoint(result_text.upper()):
                     continue
                 # Also check for score patterns like "5-3"
                 if re.search(r'\d+\s*-\s*\d+', result_text):
@@ -691,7 +848,7 @@ def parse_prestosports_schedule(soup, base_url):
                 'venue': venue_text,
                 'is_home': True,
             }
-            games.append(game)
+            _add_game(games, seen, game)
 
         except Exception:
             continue
@@ -765,68 +922,49 @@ def parse_game_date(date_text, time_text=None):
     Returns:
         datetime or None: Parsed datetime
     """
+    if not _HAS_DIGIT_RE.search(date_text):
+        return None
+
     # Clean date text - remove day of week in parentheses (e.g., "Feb 28 (Sat)" -> "Feb 28")
-    date_text = re.sub(r'\s*\([^)]+\)', '', date_text).strip()
+    date_text = _PAREN_RE.sub('', date_text).strip()
 
     # Strip day-of-week prefix (e.g., "Sat. February 28, 2026" -> "February 28, 2026")
-    date_text = re.sub(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\.?\s+', '', date_text, flags=re.IGNORECASE).strip()
-
-    # Common date formats in NCAA schedules
-    date_formats_with_year = [
-        "%m/%d/%Y",
-        "%m/%d/%y",
-        "%B %d, %Y",
-        "%b %d, %Y",
-        "%m-%d-%Y",
-        "%Y-%m-%d",
-    ]
+    date_text = _WEEKDAY_RE.sub('', date_text).strip()
 
-    # Try parsing with explicit year first
-    for fmt in date_formats_with_year:
-        try:
-            parsed_date = datetime.strptime(date_text, fmt)
-            return parsed_date
-        except ValueError:
-            continue
+    match = _DATE_RE.match(date_text)
+    if not match:
+        return None
 
-    # If no year in date, try formats without year and infer year
-    date_formats_no_year = [
-        "%b %d",    # "Feb 24"
-        "%B %d",    # "February 24"
-        "%m/%d",    # "2/24"
-        "%m-%d",    # "2-24"
-    ]
-
-    for fmt in date_formats_no_year:
-        try:
-            # Parse without year (will default to 1900)
-            parsed_date = datetime.strptime(date_text, fmt)
-
-            # Infer year based on academic calendar
-            # If month is Aug-Dec, use current year; if Jan-May, use next year
+    groups = match.groupdict()
+    try:
+        if groups['y2']:
+            # "2026-02-24"
+            year, month, day = int(groups['y2']), int(groups['m2']), int(groups['d2'])
+        elif groups['mon']:
+            # "Feb 24", "February 24, 2026"
+            month = _MONTHS.get(groups['mon'].lower())
+            if month is None:
+                return None
+            day = int(groups['d3'])
+            year = int(groups['y3']) if groups['y3'] else None
+        else:
+            # "2/24", "2/24/26", "2-24-2026"
+            month, day = int(groups['m1']), int(groups['d1'])
+            year = int(groups['y1']) if groups['y1'] else None
+            if year is not None and year < 100:
+                # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+                year += 1900 if year >= 69 else 2000
+
+        if year is None:
+            # Infer year based on academic calendar: Aug-Dec is this year, and
+            # Jan-Jul is next year once the fall semester has started
             today = datetime.now()
-            current_year = today.year
-
-            if parsed_date.month >= 8:  # Aug-Dec (fall semester)
-                # If we're currently in spring (Jan-July), this refers to next fall
-                if today.month < 8:
-                    year = current_year
-                else:
-                    year = current_year
-            else:  # Jan-July (spring semester)
-                # If we're currently in fall (Aug-Dec), this refers to next spring
-                if today.month >= 8:
-                    year = current_year + 1
-                else:
-                    year = current_year
+            year = today.year + (1 if month < 8 <= today.month else 0)
 
-            parsed_date = parsed_date.replace(year=year)
-            return parsed_date
+        return datetime(year, month, day)
 
-        except ValueError:
-            continue
-
-    return None
+    except ValueError:
+        return None
 
 
 def filter_games_by_academic_year(games):
@@ -840,7 +978,8 @@ def filter_games_by_academic_year(games):
         list: Filtered games
     """
     start_date, end_date = get_academic_year_range()
-    today = datetime.now()
+    # "In the academic year and not in the past" is a single window
+    lo = max(start_date, datetime.now())
 
     filtered_games = []
 
@@ -848,16 +987,131 @@ def filter_games_by_academic_year(games):
         # Parse game date
         game_date = parse_game_date(game['date'], game.get('time'))
 
-        if game_date:
-            # Check if in academic year range and future
-            if start_date <= game_date <= end_date and game_date >= today:
-                game['parsed_date'] = game_date.isoformat()
-                filtered_games.append(game)
+        if game_date and lo <= game_date <= end_date:
+            game['parsed_date'] = game_date.isoformat()
+            filtered_games.append(game)
 
     return filtered_games
 
 
-def scrape_schedule(team_url, sport, gender, school):
+def extract_games_from_html(html_content, schedule_url, sport, gender, school):
+    """
+    Run the parser cascade over a rendered schedule page.
+
+    Args:
+        html_content (str): Rendered page HTML
+        schedule_url (str): Schedule page URL
+        sport (str): Sport name
+        gender (str): Gender (Men/Women)
+        school (str): School name
+
+    Returns:
+        list: Upcoming home games in the current academic year
+    """
+    # Try to find schedule data in script tags (for JS-rendered pages)
+    games = extract_schedule_from_scripts(html_content, schedule_url)
+
+    # If no games found, build the full tree and try the HTML parsers
+    if not games:
+        soup = _build_soup(html_content)
+        games = parse_schedule_table(soup, schedule_url)
+
+        # If still no games, try list/card format (Sidearm)
+        if not games:
+            games = parse_schedule_list(soup, schedule_url)
+
+        # If still no games, try PrestoSports div-based format
+        if not games:
+            games = parse_prestosports_schedule(soup, schedule_url)
+
+    # Filter for academic year and future games
+    filtered_games = filter_games_by_academic_year(games)
+
+    # Add metadata to each game
+    for game in filtered_games:
+        game['school'] = school
+        game['sport'] = sport
+        game['gender'] = gender
+
+    return filtered_games
+
+
+def _schedule_result(team_url, schedule_url, sport, gender, school, games):
+    """Success result for a team (same shape for single and batch runs)."""
+    return {
+        "school": school,
+        "sport": sport,
+        "gender": gender,
+        "team_url": team_url,
+        "schedule_url": schedule_url,
+        "games_found": len(games),
+        "games": games,
+        "success": True,
+    }
+
+
+def _error_result(sport, school, error):
+    """Failure result for a team (same shape for single and batch runs)."""
+    if isinstance(error, PlaywrightTimeout):
+        message = "Timeout loading schedule page"
+    else:
+        message = f"Error scraping schedule: {str(error)}"
+    return {
+        "school": school,
+        "sport": sport,
+        "error": message,
+        "success": False,
+    }
+
+
+def _scrape_with_browser(browser, team_url, sport, gender, school):
+    """Scrape one team's schedule in a fresh context on an existing browser."""
+    context = browser.new_context(user_agent=USER_AGENT)
+    try:
+        return _scrape_in_context(context, team_url, sport, gender, school)
+    finally:
+        context.close()
+
+
+def _scrape_in_context(context, team_url, sport, gender, school):
+    """Scrape one team's schedule on a new page in an open browser context."""
+    page = context.new_page()
+    try:
+        page.route("**/*", block_heavy_resources)
+
+        # Schedule URL is derived from the team URL alone, so go straight there
+        schedule_url = find_schedule_page(page, team_url) or team_url
+        print(f"Loading schedule: {schedule_url}", file=sys.stderr)
+        page.goto(schedule_url, wait_until='domcontentloaded', timeout=30000)
+
+        # Wait for schedule markup to render (networkidle stalls on trackers/long-polls)
+        ready = wait_for(page, SCHEDULE_READY_SELECTOR, fallback_delay=SCHEDULE_FALLBACK_DELAY)
+
+        # Get page content (after JS rendering)
+        html_content = page.content()
+    finally:
+        page.close()
+
+    filtered_games = extract_games_from_html(html_content, schedule_url, sport, gender, school)
+    # Timeouts, empty pages and interstitials are not cached
+    if ready and filtered_games:
+        cache_page(team_url, html_content, schedule_url)
+    return _schedule_result(team_url, schedule_url, sport, gender, school, filtered_games)
+
+
+def _scrape_from_cache(team_url, sport, gender, school):
+    """Build the result from a fresh cached render of the schedule, or None on miss."""
+    cached = get_cached_page(team_url)
+    if cached is None:
+        return None
+
+    schedule_url = cached['page_url']
+    print(f"Using cached schedule page: {schedule_url}", file=sys.stderr)
+    filtered_games = extract_games_from_html(cached['html'], schedule_url, sport, gender, school)
+    return _schedule_result(team_url, schedule_url, sport, gender, school, filtered_games)
+
+
+def scrape_schedule(team_url, sport, gender, school, browser=None, use_cache=True):
     """
     Main function to scrape schedule for a team.
 
@@ -866,107 +1120,154 @@ def scrape_schedule(team_url, sport, gender, school):
         sport (str): Sport name
         gender (str): Gender (Men/Women)
         school (str): School name
+        browser: Optional running Playwright (sync) Browser to reuse; when
+            omitted the persistent Chromium profile is launched for this call
+        use_cache (bool): Reuse a rendered page from the disk cache when
+            fresh (see html_cache.py); usable renders are written back
 
     Returns:
         dict: Result with games list and metadata
     """
     try:
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
+        if use_cache:
+            result = _scrape_from_cache(team_url, sport, gender, school)
+            if result is not None:
+                return result
 
-            # Navigate to team page
-            print(f"Loading {team_url}...", file=sys.stderr)
-            try:
-                # Use networkidle for JavaScript-heavy sites (Sidearm Sports, etc.)
-                # This waits for all network requests to finish (like Puppeteer's networkidle0)
-                page.goto(team_url, wait_until='networkidle', timeout=60000)
-            except Exception as e:
-                # Fallback to domcontentloaded if networkidle times out
-                print(f"networkidle timeout, trying domcontentloaded: {str(e)}", file=sys.stderr)
-                page.goto(team_url, wait_until='domcontentloaded', timeout=30000)
-                page.wait_for_timeout(5000)  # Give JS time to render
-
-            # Find schedule page
-            schedule_url = find_schedule_page(page, team_url)
-
-            if schedule_url and schedule_url != team_url:
-                print(f"Navigating to schedule: {schedule_url}", file=sys.stderr)
-                try:
-                    # Critical: Use networkidle to wait for JavaScript rendering
-                    page.goto(schedule_url, wait_until='networkidle', timeout=60000)
-                    print("Page fully loaded (networkidle)", file=sys.stderr)
-                except Exception as e:
-                    print(f"networkidle timeout, trying domcontentloaded: {str(e)}", file=sys.stderr)
-                    page.goto(schedule_url, wait_until='domcontentloaded', timeout=30000)
-                    page.wait_for_timeout(5000)
-            else:
-                schedule_url = team_url
+        if browser is not None:
+            return _scrape_with_browser(browser, team_url, sport, gender, school)
+
+        # Persistent profile: Chromium's HTTP cache carries over between runs
+        with sync_playwright() as p, persistent_context(p) as context:
+            return _scrape_in_context(context, team_url, sport, gender, school)
+
+    except Exception as e:
+        return _error_result(sport, school, e)
+
+
+async def _scrape_schedule_async(browser, sem, domain_sem, team_url, sport, gender, school,
+                                 use_cache=True):
+    """
+    Async counterpart of scrape_schedule that reuses a shared browser.
+
+    Navigation runs on the event loop; the CPU-bound parser cascade runs in a
+    worker thread so other pages keep loading meanwhile.
+
+    Args:
+        browser: Playwright async Browser
+        sem (asyncio.Semaphore): Limits concurrently open pages overall
+        domain_sem (asyncio.Semaphore): Limits concurrently open pages on this team's site
+        team_url (str): Team page URL
+        sport (str): Sport name
+        gender (str): Gender (Men/Women)
+        school (str): School name
+        use_cache (bool): Reuse a fresh cached render (see scrape_schedule)
+
+    Returns:
+        dict: Result with games list and metadata (same shape as scrape_schedule)
+    """
+    if use_cache:
+        result = await asyncio.to_thread(_scrape_from_cache, team_url, sport, gender, school)
+        if result is not None:
+            return result
+
+    # Take the per-site slot first so a throttled site never holds a global slot
+    async with domain_sem, sem:
+        context = await browser.new_context(user_agent=USER_AGENT)
+        try:
+            page = await context.new_page()
+            await page.route("**/*", block_heavy_resources_async)
+            html_content, schedule_url, ready = await _render_schedule_async(page, team_url)
+        finally:
+            await context.close()
 
-            # Get page content (after JS rendering)
-            html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
+    return await _schedule_from_render_async(team_url, html_content, schedule_url, ready,
+                                             sport, gender, school)
+
+
+async def _render_schedule_async(page, team_url):
+    """
+    Load a team's schedule page on an open page and return the rendered DOM.
 
-            # Try to find schedule data in script tags (for JS-rendered pages)
-            games = extract_schedule_from_scripts(soup, schedule_url)
+    Args:
+        page: Playwright async Page (resource blocking already routed)
+        team_url (str): Team page URL
 
-            # If no games found, try parsing HTML table format
-            if not games:
-                games = parse_schedule_table(soup, schedule_url)
+    Returns:
+        tuple: (html_content, schedule_url, ready) - ready is False when no
+            schedule markup appeared before the wait timed out
+    """
+    schedule_url = find_schedule_page(page, team_url) or team_url
+    print(f"Loading schedule: {schedule_url}", file=sys.stderr)
+    await page.goto(schedule_url, wait_until='domcontentloaded', timeout=30000)
 
-            # If still no games, try list/card format (Sidearm)
-            if not games:
-                games = parse_schedule_list(soup, schedule_url)
+    ready = await wait_for_async(page, SCHEDULE_READY_SELECTOR,
+                                 fallback_delay=SCHEDULE_FALLBACK_DELAY)
 
-            # If still no games, try PrestoSports div-based format
-            if not games:
-                games = parse_prestosports_schedule(soup, schedule_url)
+    return await page.content(), schedule_url, ready
 
-            # Filter for academic year and future games
-            filtered_games = filter_games_by_academic_year(games)
 
-            # Add metadata to each game
-            for game in filtered_games:
-                game['school'] = school
-                game['sport'] = sport
-                game['gender'] = gender
+async def _schedule_from_render_async(team_url, html_content, schedule_url, ready,
+                                      sport, gender, school):
+    """Parse a rendered schedule page and cache it if usable (both off the event loop)."""
+    filtered_games = await asyncio.to_thread(
+        extract_games_from_html, html_content, schedule_url, sport, gender, school
+    )
+    # Timeouts, empty pages and interstitials are not cached
+    if ready and filtered_games:
+        await asyncio.to_thread(cache_page, team_url, html_content, schedule_url)
+    return _schedule_result(team_url, schedule_url, sport, gender, school, filtered_games)
 
-            # Close browser
-            browser.close()
 
-        result = {
-            "school": school,
-            "sport": sport,
-            "gender": gender,
-            "team_url": team_url,
-            "schedule_url": schedule_url,
-            "games_found": len(filtered_games),
-            "games": filtered_games,
-            "success": True,
-        }
+async def _scrape_schedules_async(teams, school, concurrency, per_domain, use_cache):
+    """Scrape all teams concurrently on one browser; see scrape_schedules."""
+    sem = asyncio.Semaphore(concurrency)
+    domain_sems = defaultdict(lambda: asyncio.Semaphore(per_domain))
 
-        return result
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            outcomes = await asyncio.gather(
+                *[_scrape_schedule_async(browser, sem,
+                                         domain_sems[urlparse(team.get('url', '')).netloc],
+                                         team.get('url', ''),
+                                         team.get('sport', 'Unknown'),
+                                         team.get('gender', 'Unknown'),
+                                         team.get('school', school), use_cache)
+                  for team in teams],
+                return_exceptions=True,
+            )
+        finally:
+            await browser.close()
 
-    except PlaywrightTimeout:
-        return {
-            "school": school,
-            "sport": sport,
-            "error": "Timeout loading schedule page",
-            "success": False,
-        }
-    except Exception as e:
-        return {
-            "school": school,
-            "sport": sport,
-            "error": f"Error scraping schedule: {str(e)}",
-            "success": False,
-        }
+    return [_error_result(team.get('sport', 'Unknown'), team.get('school', school), outcome)
+            if isinstance(outcome, Exception) else outcome
+            for team, outcome in zip(teams, outcomes)]
+
+
+def scrape_schedules(teams, school, concurrency=DEFAULT_CONCURRENCY,
+                     per_domain=PER_DOMAIN_CONCURRENCY, use_cache=True):
+    """
+    Scrape schedules for many teams concurrently.
+
+    Uses the async Playwright API with one shared browser (one context per
+    team), keeping up to `concurrency` pages in flight overall and at most
+    `per_domain` on any one athletics site. One failed team does not affect
+    the others.
+
+    Args:
+        teams (list): Team dicts with 'url', 'sport' and 'gender' (the 'teams'
+            list written by scrape_team_list.py); an optional 'school' key
+            overrides `school`, so one list can span several schools
+        school (str): School name
+        concurrency (int): Maximum number of pages loading at once
+        per_domain (int): Maximum number of pages loading at once per site
+        use_cache (bool): Reuse fresh cached renders (see scrape_schedule)
+
+    Returns:
+        list: One scrape_schedule-style result dict per team, in input order
+    """
+    return asyncio.run(_scrape_schedules_async(teams, school, concurrency, per_domain, use_cache))
 
 
 def main():
@@ -975,17 +1276,14 @@ def main():
     )
     parser.add_argument(
         "--team-url",
-        required=True,
         help="Team page URL (e.g., https://bceagles.com/sports/mens-soccer)"
     )
     parser.add_argument(
         "--sport",
-        required=True,
         help="Sport name (e.g., 'Soccer')"
     )
     parser.add_argument(
         "--gender",
-        required=True,
         help="Gender (Men/Women)"
     )
     parser.add_argument(
@@ -993,6 +1291,21 @@ def main():
         required=True,
         help="School name (e.g., 'Boston College')"
     )
+    parser.add_argument(
+        "--teams-file",
+        help="Batch mode: teams JSON from scrape_team_list.py (scrapes every team)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Batch mode: pages loaded in parallel (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always load pages live instead of reusing cached renders"
+    )
     parser.add_argument(
         "--output",
         help="Output JSON file path (default: stdout)"
@@ -1000,21 +1313,43 @@ def main():
 
     args = parser.parse_args()
 
-    # Scrape schedule
-    result = scrape_schedule(args.team_url, args.sport, args.gender, args.school)
+    if args.teams_file:
+        with open(args.teams_file) as f:
+            teams = json.load(f).get('teams', [])
+        results = scrape_schedules(teams, args.school, args.concurrency,
+                                   use_cache=not args.no_cache)
+        result = {
+            "school": args.school,
+            "teams_scraped": len(results),
+            "games_found": sum(r.get('games_found', 0) for r in results),
+            "results": results,
+            "success": any(r['success'] for r in results),
+        }
+    elif args.team_url and args.sport and args.gender:
+        # Scrape schedule
+        result = scrape_schedule(args.team_url, args.sport, args.gender, args.school,
+                                 use_cache=not args.no_cache)
+    else:
+        parser.error("--team-url, --sport and --gender are required without --teams-file")
+
+    output = dump_json(result)
 
     # Save to file if specified
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(output)
         print(f"Results saved to {args.output}", file=sys.stderr)
 
-        if result['success']:
+        if result['success'] and args.teams_file:
+            print(f"Found {result['games_found']} home games across "
+                  f"{result['teams_scraped']} teams", file=sys.stderr)
+        elif result['success']:
             print(f"Found {result['games_found']} home games for "
                   f"{args.gender}'s {args.sport}", file=sys.stderr)
 
     # Always output JSON to stdout for pipeline processing
-    print(json.dumps(result, indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(output + b'\n')
 
     # Exit with error code if scraping failed
     if not result['success']:
@@ -8,23 +8,101 @@ Usage:
     python tools/scrape_staff_directory.py --url "https://bceagles.com/staff-directory" \
         --school "Boston College" --output contacts.json
 
+    # Batch mode: many schools on one shared browser
+    python tools/scrape_staff_directory.py --schools-file .tmp/schools.json --concurrency 4
+
 Output: JSON of all staff with name, title, email, phone, sport assignment
 Note: Extracts ALL staff for caching, not just coaches for a specific sport
 """
 
 import argparse
+import asyncio
 import json
 import sys
 import re
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+import lxml.html
+from lxml import etree
 import os
 
+from html_cache import get_cached_page, cache_page
+from url_registry import forget_url, get_registered_url, register_url
+from scrape_common import (USER_AGENT, block_heavy_resources, block_heavy_resources_async,
+                           dump_json, persistent_context, wait_for, wait_for_async)
+
 load_dotenv()
 
+SPORT_KEYWORDS = {
+    "Baseball": ["baseball"],
+    "Basketball": ["basketball", "men's basketball", "women's basketball"],
+    "Field Hockey": ["field hockey"],
+    "Football": ["football"],
+    "Ice Hockey": ["ice hockey", "hockey"],
+    "Lacrosse": ["lacrosse", "men's lacrosse", "women's lacrosse"],
+    "Soccer": ["soccer", "men's soccer", "women's soccer"],
+    "Softball": ["softball"],
+    "Volleyball": ["volleyball"],
+    "Swimming & Diving": ["swimming", "diving"],
+    "Rowing": ["rowing", "crew"],
+}
+
+# All sport keywords in one alternation, scanned in a single pass. Longest
+# keywords go first so "field hockey" is not also read as (ice) "hockey".
+_KEYWORD_SPORT = {kw: (rank, sport)
+                  for rank, (sport, keywords) in enumerate(SPORT_KEYWORDS.items())
+                  for kw in keywords}
+_SPORT_KEYWORD_RE = re.compile('|'.join(
+    re.escape(kw) for kw in sorted(_KEYWORD_SPORT, key=len, reverse=True)))
+
+# Batch mode (--schools-file): schools scraped in parallel
+DEFAULT_CONCURRENCY = 4
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Scheme prefix stripped from mailto hrefs (matched case-insensitively, like the links)
+_MAILTO_RE = re.compile(r'^mailto:', re.IGNORECASE)
+
+def _has_class(*classes):
+    """XPath predicate: element carries any of `classes` (like CSS .class)."""
+    return ' or '.join(f"contains(concat(' ', normalize-space(@class), ' '), ' {c} ')"
+                       for c in classes)
+
+
+# Sidearm person cards, matched on lxml's tree (same as CSS '.s-person-card')
+_SIDEARM_CARD_XPATH = etree.XPath(f"//*[{_has_class('s-person-card')}]")
+_TEXT_NODES_XPATH = etree.XPath('.//text()')
+# Structured fields inside a person card (current and older Sidearm class names)
+_SIDEARM_NAME_XPATH = etree.XPath(
+    f".//*[{_has_class('s-person-details__personal-single-line', 's-person-card__name')}]")
+_SIDEARM_TITLE_XPATH = etree.XPath(
+    f".//*[{_has_class('s-person-details__position', 's-person-card__title')}]")
+_TEL_LINK_XPATH = etree.XPath(".//a[starts-with(translate(@href, 'TEL', 'tel'), 'tel:')]")
+# Directory tables (extract_staff_from_table); all descendant matches, like find_all
+_TABLES_XPATH = etree.XPath('//table')
+_TABLE_HEADERS_XPATH = etree.XPath('.//th')
+_TABLE_ROWS_XPATH = etree.XPath('.//tr')
+_ROW_CELLS_XPATH = etree.XPath('.//td | .//th')
+_MAILTO_HREF_XPATH = etree.XPath(
+    ".//a[starts-with(translate(@href, 'MAILTO', 'mailto'), 'mailto:')]/@href")
+
+# Markup that signals a rendered directory (containers used by extract_staff_from_page).
+# Tables count once they have header cells: a bare 'table' also matches layout tables.
+STAFF_READY_SELECTOR = ('.s-person-card, .staff-member, .coach, .staff-card, .bio-card, '
+                        '.person, table th, table a[href^="mailto:"], ul.staff-list, '
+                        'ol.staff-list, .directory-list')
+# Nav links find_staff_directory_url is looking for (:has-text is case-insensitive)
+DIRECTORY_LINK_SELECTOR = ('a:has-text("staff"), a:has-text("coaches"), '
+                           'a:has-text("directory"), a:has-text("personnel")')
+DIRECTORY_LINK_KEYWORDS = ('staff', 'coaches', 'directory', 'personnel')
+# Every anchor's text + raw href in one page.evaluate round-trip (vs. per-link IPC)
+_ANCHORS_JS = """() => Array.from(document.querySelectorAll('a'), a => ({
+    t: (a.innerText || '').toLowerCase().trim(),
+    h: a.getAttribute('href'),
+}))"""
 
 def find_staff_directory_url(page, base_url):
     """
@@ -38,104 +116,210 @@ def find_staff_directory_url(page, base_url):
         str: Staff directory URL or None
     """
     try:
-        # Look for staff/directory links
-        links = page.query_selector_all('a')
-
-        for link in links:
-            text = link.inner_text().lower().strip()
-            href = link.get_attribute('href')
-
-            if any(keyword in text for keyword in ['staff', 'coaches', 'directory', 'personnel']):
-                if href:
-                    full_url = urljoin(base_url, href)
-                    return full_url
-
-        # Try common URL patterns
-        parsed = urlparse(base_url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-
-        common_patterns = [
-            f"{base}/staff-directory",
-            f"{base}/staff",
-            f"{base}/coaches",
-            f"{base}/directory",
-            f"{base}/sports/staff",
-        ]
+        return _directory_url_from_anchors(page.evaluate(_ANCHORS_JS), base_url)
+    except Exception as e:
+        print(f"Error finding staff directory: {str(e)}", file=sys.stderr)
+        return None
 
-        return common_patterns[0]
 
+async def _find_staff_directory_url_async(page, base_url):
+    """Async counterpart of find_staff_directory_url."""
+    try:
+        return _directory_url_from_anchors(await page.evaluate(_ANCHORS_JS), base_url)
     except Exception as e:
         print(f"Error finding staff directory: {str(e)}", file=sys.stderr)
         return None
 
 
-def extract_staff_from_page(soup, page_url):
+def _directory_url_from_anchors(anchors, base_url):
+    """
+    Pick the staff directory URL from a page's links (registered for later runs).
+
+    Args:
+        anchors (list): [{'t': lowercased text, 'h': raw href}] from _ANCHORS_JS
+        base_url (str): Base athletics URL
+
+    Returns:
+        str: Linked directory URL, else the most common directory path
+    """
+    # Look for staff/directory links
+    full_url = _pick_directory_link(anchors, base_url)
+    if full_url:
+        register_url(base_url, 'staff', full_url)
+        return full_url
+
+    # Try common URL patterns
+    parsed = urlparse(base_url)
+    base = f"{parsed.scheme}://{parsed.netloc}"
+
+    common_patterns = [
+        f"{base}/staff-directory",
+        f"{base}/staff",
+        f"{base}/coaches",
+        f"{base}/directory",
+        f"{base}/sports/staff",
+    ]
+
+    return common_patterns[0]
+
+
+def _pick_directory_link(anchors, base_url):
+    """
+    Return the first anchor whose text names a staff directory.
+
+    Args:
+        anchors (list): [{'t': lowercased text, 'h': raw href}] from _ANCHORS_JS
+        base_url (str): Base athletics URL
+
+    Returns:
+        str: Absolute directory URL or None
+    """
+    for anchor in anchors:
+        if anchor['h'] and any(keyword in anchor['t'] for keyword in DIRECTORY_LINK_KEYWORDS):
+            return urljoin(base_url, anchor['h'])
+    return None
+
+
+def extract_staff_from_page(soup, page_url, tree=None):
     """
     Extract staff members from the directory page.
 
     Args:
         soup: BeautifulSoup object
         page_url (str): Current page URL
+        tree: Optional lxml document of the same page (parsed from soup when omitted)
 
     Returns:
-        list: List of staff dictionaries
+        list: List of staff dictionaries (unique by name, first occurrence wins)
     """
-    staff_members = []
+    if tree is None:
+        tree = lxml.html.document_fromstring(str(soup))
 
     # Try multiple parsing strategies
 
     # Strategy 0: Modern Sidearm format (.s-person-card) - try this first
-    sidearm_cards = soup.select('.s-person-card')
-    if sidearm_cards:
-        for card in sidearm_cards:
-            staff_info = extract_staff_from_sidearm_card(card)
-            if staff_info:
-                staff_members.append(staff_info)
-        if staff_members:
-            return staff_members
+    staff_members = _extract_sidearm_staff_lxml(tree)
+    if staff_members:
+        return staff_members
+    seen = set()  # Names already collected; later duplicates are skipped unparsed
 
     # Strategy 1: Look for staff cards/blocks (common in modern sites)
     staff_cards = soup.select('.staff-member, .coach, .staff-card, .bio-card, .person')
 
     for card in staff_cards:
-        staff_info = extract_staff_from_card(card)
-        if staff_info:
-            staff_members.append(staff_info)
+        _add_staff(staff_members, seen, extract_staff_from_card(card, seen))
+    if staff_members:
+        return staff_members
 
     # Strategy 2: Look for table-based directories
-    if not staff_members:
-        tables = soup.find_all('table')
-        for table in tables:
-            table_staff = extract_staff_from_table(table)
-            staff_members.extend(table_staff)
+    for table in _TABLES_XPATH(tree):
+        table_staff = extract_staff_from_table(table, seen)
+        staff_members.extend(table_staff)
+    if staff_members:
+        return staff_members
 
     # Strategy 3: Look for list-based directories
-    if not staff_members:
-        lists = soup.select('ul.staff-list, ol.staff-list, .directory-list')
-        for lst in lists:
-            list_items = lst.find_all('li')
-            for item in list_items:
-                staff_info = extract_staff_from_card(item)
-                if staff_info:
-                    staff_members.append(staff_info)
+    lists = soup.select('ul.staff-list, ol.staff-list, .directory-list')
+    for lst in lists:
+        list_items = lst.find_all('li')
+        for item in list_items:
+            _add_staff(staff_members, seen, extract_staff_from_card(item, seen))
 
     return staff_members
 
 
-def extract_staff_from_sidearm_card(card):
+def _add_staff(staff_members, seen, staff_info):
+    """Append staff_info (if any) unless someone with the same name was already added."""
+    if staff_info and staff_info['name'] not in seen:
+        seen.add(staff_info['name'])
+        staff_members.append(staff_info)
+
+
+def extract_staff_from_sidearm_card(card, seen=None):
     """
     Extract staff from modern Sidearm .s-person-card format.
-    Format: Name|Title|"Phone"|PhoneNumber|Email|...
+    Reads the name/title/mailto/tel elements, falling back to the
+    pipe-separated card text (Name|Title|"Phone"|PhoneNumber|Email|...)
+    for any field they do not provide.
 
     Args:
-        card: BeautifulSoup element
+        card: lxml element for the card
+        seen (set): Optional names already collected; returns None for these
+
+    Returns:
+        dict: Staff information or None
+    """
+    names = _SIDEARM_NAME_XPATH(card)
+    name = _spaced_text(names[0]) if names else None
+    if not name:
+        # Variant markup: same text as card.get_text(separator='|', strip=True)
+        return _staff_from_sidearm_text(_card_text(card), seen)
+
+    if seen is not None and name in seen:
+        return None
+
+    titles = _SIDEARM_TITLE_XPATH(card)
+    title = (_spaced_text(titles[0]) if titles else '') or 'Unknown'
+
+    email = 'Not Found'
+    for href in _MAILTO_HREF_XPATH(card):
+        address = _MAILTO_RE.sub('', href).split('?')[0].strip()
+        if address:
+            email = address
+            break
+
+    phone = 'Not Found'
+    for link in _TEL_LINK_XPATH(card):
+        # Link text is sometimes just a "Phone" label; the href always has the number
+        number = _spaced_text(link)
+        if not any(ch.isdigit() for ch in number):
+            number = link.get('href', '')[len('tel:'):].strip()
+        if number:
+            phone = number
+            break
+
+    if email == 'Not Found' or phone == 'Not Found':
+        # Plain-text email/phone (no mailto/tel link): read them off the card text
+        text_staff = _staff_from_sidearm_text(_card_text(card))
+        if text_staff:
+            if email == 'Not Found':
+                email = text_staff['email']
+            if phone == 'Not Found':
+                phone = text_staff['phone']
+
+    sport = extract_sport_from_text(title)
+
+    return {
+        'name': name,
+        'title': title,
+        'email': email,
+        'phone': phone,
+        'sport': sport or 'Unknown',
+    }
+
+
+def _spaced_text(el):
+    """lxml equivalent of BeautifulSoup's el.get_text(' ', strip=True)."""
+    return ' '.join(t.strip() for t in _TEXT_NODES_XPATH(el) if t.strip())
+
+
+def _card_text(el):
+    """lxml equivalent of BeautifulSoup's el.get_text(separator='|', strip=True)."""
+    return '|'.join(t.strip() for t in _TEXT_NODES_XPATH(el) if t.strip())
+
+
+def _staff_from_sidearm_text(card_text, seen=None):
+    """
+    Parse the pipe-joined text of a .s-person-card into a staff dict.
+
+    Args:
+        card_text (str): Card text joined with '|' (as get_text(separator='|', strip=True))
+        seen (set): Optional names already collected; returns None for these
 
     Returns:
         dict: Staff information or None
     """
     try:
-        # Get pipe-separated text
-        card_text = card.get_text(separator='|', strip=True)
         parts = [p.strip() for p in card_text.split('|')]
 
         if len(parts) < 3:
@@ -143,6 +327,8 @@ def extract_staff_from_sidearm_card(card):
 
         # Parse structure: Name|Title|"Phone"|PhoneNumber|Email|...
         name = parts[0] if len(parts) > 0 else None
+        if seen is not None and name in seen:
+            return None
         title = parts[1] if len(parts) > 1 else 'Unknown'
 
         # Find email (usually after phone number)
@@ -170,18 +356,19 @@ def extract_staff_from_sidearm_card(card):
                 'sport': sport or 'Unknown',
             }
 
-    except Exception as e:
+    except Exception:
         return None
 
     return None
 
 
-def extract_staff_from_card(card):
+def extract_staff_from_card(card, seen=None):
     """
     Extract staff information from a card/block element.
 
     Args:
         card: BeautifulSoup element
+        seen (set): Optional names already collected; returns None for these
 
     Returns:
         dict: Staff information or None
@@ -207,6 +394,9 @@ def extract_staff_from_card(card):
                 if lines:
                     name = lines[0].strip()
 
+        if seen is not None and name in seen:
+            return None
+
         # Extract title/role
         title = None
         title_selectors = [
@@ -221,17 +411,15 @@ def extract_staff_from_card(card):
 
         # Extract email
         email = None
-        email_links = card.select('a[href^="mailto:"]')
+        email_links = card.select('a[href^="mailto:" i]')
         if email_links:
             email_href = email_links[0].get('href', '')
-            email = email_href.replace('mailto:', '').strip()
+            email = _MAILTO_RE.sub('', email_href).strip()
         else:
             # Look for email pattern in text
-            card_text = card.get_text()
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_matches = re.findall(email_pattern, card_text)
-            if email_matches:
-                email = email_matches[0]
+            email_match = _EMAIL_RE.search(card.get_text())
+            if email_match:
+                email = email_match.group(0)
 
         # Extract phone
         phone = None
@@ -266,12 +454,14 @@ def extract_staff_from_card(card):
     return None
 
 
-def extract_staff_from_table(table):
+def extract_staff_from_table(table, seen=None):
     """
     Extract staff from table format.
 
     Args:
-        table: BeautifulSoup table element
+        table: lxml table element
+        seen (set): Optional names already collected; rows for these are
+            skipped and new names are added to it
 
     Returns:
         list: List of staff dictionaries
@@ -279,8 +469,11 @@ def extract_staff_from_table(table):
     staff_members = []
 
     try:
+        # Walk the table on lxml's C tree (one XPath per row) rather than
+        # BeautifulSoup's Python-level find_all/get_text
+
         # Find header row to identify columns
-        headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+        headers = [_cell_text(th).lower() for th in _TABLE_HEADERS_XPATH(table)]
 
         # Find column indices
         name_col = None
@@ -302,42 +495,45 @@ def extract_staff_from_table(table):
                 sport_col = i
 
         # Parse rows
-        for row in table.find_all('tr')[1:]:  # Skip header
-            cols = row.find_all(['td', 'th'])
+        for row in _TABLE_ROWS_XPATH(table)[1:]:  # Skip header
+            cols = _ROW_CELLS_XPATH(row)
 
             if not cols:
                 continue
 
             try:
-                name = cols[name_col].get_text(strip=True) if name_col is not None and len(cols) > name_col else None
-                title = cols[title_col].get_text(strip=True) if title_col is not None and len(cols) > title_col else 'Unknown'
+                name = _cell_text(cols[name_col]) if name_col is not None and len(cols) > name_col else None
+                if not name or (seen is not None and name in seen):
+                    continue
+                title = _cell_text(cols[title_col]) if title_col is not None and len(cols) > title_col else 'Unknown'
 
                 # Email extraction
                 email = 'Not Found'
                 if email_col is not None and len(cols) > email_col:
                     email_cell = cols[email_col]
-                    email_link = email_cell.find('a', href=re.compile('^mailto:'))
-                    if email_link:
-                        email = email_link.get('href', '').replace('mailto:', '').strip()
+                    email_hrefs = _MAILTO_HREF_XPATH(email_cell)
+                    if email_hrefs:
+                        email = _MAILTO_RE.sub('', email_hrefs[0]).strip()
                     else:
-                        email_text = email_cell.get_text(strip=True)
+                        email_text = _cell_text(email_cell)
                         if '@' in email_text:
                             email = email_text
 
-                phone = cols[phone_col].get_text(strip=True) if phone_col is not None and len(cols) > phone_col else 'Not Found'
-                sport = cols[sport_col].get_text(strip=True) if sport_col is not None and len(cols) > sport_col else None
+                phone = _cell_text(cols[phone_col]) if phone_col is not None and len(cols) > phone_col else 'Not Found'
+                sport = _cell_text(cols[sport_col]) if sport_col is not None and len(cols) > sport_col else None
 
                 if not sport:
-                    sport = extract_sport_from_text(row.get_text())
-
-                if name:
-                    staff_members.append({
-                        'name': name,
-                        'title': title,
-                        'email': email,
-                        'phone': phone,
-                        'sport': sport or 'Unknown',
-                    })
+                    sport = extract_sport_from_text(''.join(_TEXT_NODES_XPATH(row)))
+
+                if seen is not None:
+                    seen.add(name)
+                staff_members.append({
+                    'name': name,
+                    'title': title,
+                    'email': email,
+                    'phone': phone,
+                    'sport': sport or 'Unknown',
+                })
 
             except (IndexError, AttributeError):
                 continue
@@ -348,130 +544,322 @@ def extract_staff_from_table(table):
     return staff_members
 
 
+def _cell_text(el):
+    """lxml equivalent of BeautifulSoup's el.get_text(strip=True)."""
+    return ''.join(t.strip() for t in _TEXT_NODES_XPATH(el))
+
+
 def extract_sport_from_text(text):
     """
     Try to identify sport assignment from text.
 
+    When several sports are mentioned, the one listed first in SPORT_KEYWORDS wins.
+
     Args:
         text (str): Text to analyze
 
     Returns:
         str: Sport name or None
     """
-    text_lower = text.lower()
-
-    sport_keywords = {
-        "Baseball": ["baseball"],
-        "Basketball": ["basketball", "men's basketball", "women's basketball"],
-        "Field Hockey": ["field hockey"],
-        "Football": ["football"],
-        "Ice Hockey": ["ice hockey", "hockey"],
-        "Lacrosse": ["lacrosse", "men's lacrosse", "women's lacrosse"],
-        "Soccer": ["soccer", "men's soccer", "women's soccer"],
-        "Softball": ["softball"],
-        "Volleyball": ["volleyball"],
-        "Swimming & Diving": ["swimming", "diving"],
-        "Rowing": ["rowing", "crew"],
-    }
+    hits = {_KEYWORD_SPORT[kw] for kw in _SPORT_KEYWORD_RE.findall(text.lower())}
+    return min(hits)[1] if hits else None
 
-    for sport, keywords in sport_keywords.items():
-        if any(keyword in text_lower for keyword in keywords):
-            return sport
 
-    return None
+def _extract_sidearm_staff_lxml(tree):
+    """
+    Fast path for Sidearm directories: read .s-person-card fields straight
+    off lxml's C tree instead of building a BeautifulSoup tree.
+
+    Args:
+        tree: lxml document of the rendered directory
+
+    Returns:
+        list: Staff dictionaries (empty if the page has no parseable cards)
+    """
+    staff_members = []
+    seen = set()
+    for card in _SIDEARM_CARD_XPATH(tree):
+        _add_staff(staff_members, seen, extract_staff_from_sidearm_card(card, seen))
+    return staff_members
 
 
-def scrape_staff_directory(base_url, school_name, directory_url=None):
+def _staff_result(html_content, directory_url, school_name):
     """
-    Main function to scrape staff directory.
+    Parse a rendered directory page into the tool's result dict.
 
     Args:
-        base_url (str): Athletics website base URL
+        html_content (str): Rendered directory HTML
+        directory_url (str): Directory page URL
         school_name (str): School name
-        directory_url (str): Optional direct URL to staff directory
 
     Returns:
         dict: Result with staff list and metadata
     """
+    # Extract staff (already de-duplicated by name). The page is parsed by
+    # lxml once; BeautifulSoup is only built for non-Sidearm layouts
     try:
-        with sync_playwright() as p:
-            # Launch browser (headless=False for debugging if needed)
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
+        tree = lxml.html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        tree = None
+    staff_list = _extract_sidearm_staff_lxml(tree) if tree is not None else []
+    if not staff_list and tree is not None:
+        soup = BeautifulSoup(html_content, 'lxml')
+        staff_list = extract_staff_from_page(soup, directory_url, tree)
+
+    return {
+        "school": school_name,
+        "directory_url": directory_url,
+        "staff_found": len(staff_list),
+        "staff": staff_list,
+        "success": True,
+        "timestamp": str(datetime.now()),
+    }
+
+
+def _error_result(school_name, error):
+    """Failure result for a school (same shape for sync and batch runs)."""
+    if isinstance(error, PlaywrightTimeout):
+        message = "Timeout loading staff directory"
+    else:
+        message = f"Error scraping staff directory: {str(error)}"
+    return {
+        "school": school_name,
+        "error": message,
+        "success": False,
+    }
 
-            # Navigate to base URL first
+
+def _scrape_with_browser(browser, base_url, school_name, directory_url):
+    """Scrape one school's directory in a fresh context on an existing browser."""
+    context = browser.new_context(user_agent=USER_AGENT)
+    try:
+        return _scrape_in_context(context, base_url, school_name, directory_url)
+    finally:
+        context.close()
+
+
+def _scrape_in_context(context, base_url, school_name, directory_url):
+    """Scrape one school's directory on a new page in an open browser context."""
+    cache_key = directory_url or base_url
+    page = context.new_page()
+    try:
+        page.route("**/*", block_heavy_resources)
+
+        # Directory found on an earlier run skips the homepage entirely
+        if not directory_url:
+            directory_url = get_registered_url(base_url, 'staff')
+            if directory_url:
+                print(f"Using known staff directory: {directory_url}", file=sys.stderr)
+
+        # Find staff directory from the homepage links if not known
+        loaded_url = None
+        if not directory_url:
             print(f"Loading {base_url}...", file=sys.stderr)
             try:
                 page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
-                page.wait_for_timeout(2000)
             except Exception:
                 page.goto(base_url, wait_until='commit', timeout=30000)
-                page.wait_for_timeout(3000)
+            loaded_url = base_url
 
-            # Find staff directory if not provided
-            if not directory_url:
-                directory_url = find_staff_directory_url(page, base_url)
-                print(f"Found staff directory: {directory_url}", file=sys.stderr)
+            wait_for(page, DIRECTORY_LINK_SELECTOR, timeout=3000, fallback_delay=1500)
+            directory_url = find_staff_directory_url(page, base_url)
+            print(f"Found staff directory: {directory_url}", file=sys.stderr)
 
-            # Navigate to staff directory
-            if directory_url != base_url:
-                print(f"Navigating to {directory_url}...", file=sys.stderr)
+        # Navigate to staff directory
+        if directory_url != loaded_url:
+            print(f"Navigating to {directory_url}...", file=sys.stderr)
+            try:
+                page.goto(directory_url, wait_until='domcontentloaded', timeout=30000)
+            except Exception:
                 try:
-                    page.goto(directory_url, wait_until='domcontentloaded', timeout=30000)
-                    page.wait_for_timeout(2000)
-                except Exception:
                     page.goto(directory_url, wait_until='commit', timeout=30000)
-                    page.wait_for_timeout(3000)
-
-            # Additional wait for any lazy-loaded content
-            page.wait_for_timeout(2000)
+                except Exception:
+                    forget_url(base_url, 'staff', directory_url)
+                    raise
+
+        # Wait for staff markup (including lazy-loaded cards) rather than a fixed delay
+        ready = wait_for(page, STAFF_READY_SELECTOR, fallback_delay=1500)
+
+        # Get page content
+        html_content = page.content()
+    finally:
+        page.close()
+
+    result = _staff_result(html_content, directory_url, school_name)
+    # Timeouts, empty pages and interstitials are not cached
+    if ready and result['staff']:
+        cache_page(cache_key, html_content, directory_url)
+    elif not result['staff']:
+        forget_url(base_url, 'staff', directory_url)
+    return result
+
+
+def _scrape_from_cache(base_url, school_name, directory_url):
+    """Build the result from a fresh cached render of the directory, or None on miss."""
+    cached = get_cached_page(directory_url or base_url)
+    if cached is None:
+        return None
 
-            # Get page content
-            html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
+    print(f"Using cached staff directory: {cached['page_url']}", file=sys.stderr)
+    return _staff_result(cached['html'], cached['page_url'], school_name)
 
-            # Extract staff
-            staff_members = extract_staff_from_page(soup, directory_url)
 
-            # Close browser
-            browser.close()
+def scrape_staff_directory(base_url, school_name, directory_url=None, browser=None,
+                           use_cache=True):
+    """
+    Main function to scrape staff directory.
 
-        # Filter out duplicates (same name)
-        unique_staff = {}
-        for staff in staff_members:
-            if staff['name'] not in unique_staff:
-                unique_staff[staff['name']] = staff
+    Args:
+        base_url (str): Athletics website base URL
+        school_name (str): School name
+        directory_url (str): Optional direct URL to staff directory
+        browser: Optional running Playwright (sync) Browser to reuse; when
+            omitted the persistent Chromium profile is launched for this call
+        use_cache (bool): Reuse a rendered page from the disk cache when
+            fresh (see html_cache.py); usable renders are written back
 
-        staff_list = list(unique_staff.values())
+    Returns:
+        dict: Result with staff list and metadata
+    """
+    try:
+        if use_cache:
+            result = _scrape_from_cache(base_url, school_name, directory_url)
+            if result is not None:
+                return result
 
-        result = {
-            "school": school_name,
-            "directory_url": directory_url,
-            "staff_found": len(staff_list),
-            "staff": staff_list,
-            "success": True,
-            "timestamp": str(datetime.now()),
-        }
+        if browser is not None:
+            return _scrape_with_browser(browser, base_url, school_name, directory_url)
 
-        return result
+        # Persistent profile: Chromium's HTTP cache carries over between runs
+        with sync_playwright() as p, persistent_context(p) as context:
+            return _scrape_in_context(context, base_url, school_name, directory_url)
 
-    except PlaywrightTimeout:
-        return {
-            "school": school_name,
-            "error": "Timeout loading staff directory",
-            "success": False,
-        }
     except Exception as e:
-        return {
-            "school": school_name,
-            "error": f"Error scraping staff directory: {str(e)}",
-            "success": False,
-        }
+        return _error_result(school_name, e)
+
+
+async def _scrape_staff_directory_async(browser, sem, base_url, school_name, directory_url=None,
+                                        use_cache=True):
+    """
+    Async counterpart of scrape_staff_directory on a shared browser.
+
+    Each school gets its own context; parsing runs in a worker thread so
+    other schools keep loading meanwhile.
+    """
+    if use_cache:
+        result = await asyncio.to_thread(_scrape_from_cache, base_url, school_name, directory_url)
+        if result is not None:
+            return result
+
+    async with sem:
+        context = await browser.new_context(user_agent=USER_AGENT)
+        try:
+            page = await context.new_page()
+            await page.route("**/*", block_heavy_resources_async)
+            html_content, page_url, ready = await _render_staff_directory_async(
+                page, base_url, directory_url)
+        finally:
+            await context.close()
+
+    return await _staff_from_render_async(directory_url or base_url, html_content, page_url,
+                                          ready, school_name)
+
+
+async def _render_staff_directory_async(page, base_url, directory_url=None):
+    """
+    Load a school's staff directory on an open page and return the rendered DOM.
+
+    Args:
+        page: Playwright async Page (resource blocking already routed)
+        base_url (str): Athletics website base URL
+        directory_url (str): Optional direct URL to staff directory
+
+    Returns:
+        tuple: (html_content, directory_url, ready) - ready is False when no
+            staff markup appeared before the wait timed out
+    """
+    if not directory_url:
+        directory_url = get_registered_url(base_url, 'staff')
+        if directory_url:
+            print(f"Using known staff directory: {directory_url}", file=sys.stderr)
+
+    loaded_url = None
+    if not directory_url:
+        print(f"Loading {base_url}...", file=sys.stderr)
+        try:
+            await page.goto(base_url, wait_until='domcontentloaded', timeout=30000)
+        except Exception:
+            await page.goto(base_url, wait_until='commit', timeout=30000)
+        loaded_url = base_url
+
+        await wait_for_async(page, DIRECTORY_LINK_SELECTOR, timeout=3000, fallback_delay=1500)
+        directory_url = await _find_staff_directory_url_async(page, base_url)
+        print(f"Found staff directory: {directory_url}", file=sys.stderr)
+
+    if directory_url != loaded_url:
+        print(f"Navigating to {directory_url}...", file=sys.stderr)
+        try:
+            await page.goto(directory_url, wait_until='domcontentloaded', timeout=30000)
+        except Exception:
+            try:
+                await page.goto(directory_url, wait_until='commit', timeout=30000)
+            except Exception:
+                await asyncio.to_thread(forget_url, base_url, 'staff', directory_url)
+                raise
+
+    ready = await wait_for_async(page, STAFF_READY_SELECTOR, fallback_delay=1500)
+
+    return await page.content(), directory_url, ready
+
+
+async def _staff_from_render_async(cache_key, html_content, directory_url, ready, school_name):
+    """Parse a rendered directory page and cache it if usable (both off the event loop)."""
+    result = await asyncio.to_thread(_staff_result, html_content, directory_url, school_name)
+    # Timeouts, empty pages and interstitials are not cached
+    if ready and result['staff']:
+        await asyncio.to_thread(cache_page, cache_key, html_content, directory_url)
+    elif not result['staff']:
+        await asyncio.to_thread(forget_url, cache_key, 'staff', directory_url)
+    return result
+
+
+async def _scrape_staff_directories_async(schools, concurrency, use_cache):
+    """Scrape all schools concurrently on one browser; see scrape_staff_directories."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            outcomes = await asyncio.gather(
+                *[_scrape_staff_directory_async(browser, sem, school['url'], school['school'],
+                                                school.get('directory_url'), use_cache)
+                  for school in schools],
+                return_exceptions=True,
+            )
+        finally:
+            await browser.close()
+
+    return [_error_result(school['school'], outcome) if isinstance(outcome, Exception) else outcome
+            for school, outcome in zip(schools, outcomes)]
+
+
+def scrape_staff_directories(schools, concurrency=DEFAULT_CONCURRENCY, use_cache=True):
+    """
+    Scrape staff directories for many schools concurrently.
+
+    Uses the async Playwright API with one shared browser (one context per
+    school), keeping up to `concurrency` schools in flight. One failed
+    school does not affect the others.
+
+    Args:
+        schools (list): Dicts with 'school', 'url' and optional 'directory_url'
+        concurrency (int): Maximum number of schools loading at once
+        use_cache (bool): Reuse fresh cached renders (see scrape_staff_directory)
+
+    Returns:
+        list: One scrape_staff_directory-style result dict per school, in input order
+    """
+    return asyncio.run(_scrape_staff_directories_async(schools, concurrency, use_cache))
 
 
 def main():
@@ -480,18 +868,31 @@ def main():
     )
     parser.add_argument(
         "--url",
-        required=True,
         help="Athletics website base URL (e.g., https://bceagles.com)"
     )
     parser.add_argument(
         "--school",
-        required=True,
         help="School name (e.g., 'Boston College')"
     )
     parser.add_argument(
         "--directory-url",
         help="Optional direct URL to staff directory page"
     )
+    parser.add_argument(
+        "--schools-file",
+        help="Batch mode: JSON list of {school, url, directory_url?} objects"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Batch mode: schools scraped in parallel (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always load pages live instead of reusing cached renders"
+    )
     parser.add_argument(
         "--output",
         help="Output JSON file path (default: stdout)"
@@ -499,20 +900,39 @@ def main():
 
     args = parser.parse_args()
 
-    # Scrape staff directory
-    result = scrape_staff_directory(args.url, args.school, args.directory_url)
+    if args.schools_file:
+        with open(args.schools_file) as f:
+            schools = json.load(f)
+        results = scrape_staff_directories(schools, args.concurrency,
+                                           use_cache=not args.no_cache)
+        result = {
+            "schools_scraped": len(results),
+            "staff_found": sum(r.get('staff_found', 0) for r in results),
+            "results": results,
+            "success": any(r['success'] for r in results),
+        }
+    elif args.url and args.school:
+        # Scrape staff directory
+        result = scrape_staff_directory(args.url, args.school, args.directory_url,
+                                        use_cache=not args.no_cache)
+    else:
+        parser.error("--url and --school are required without --schools-file")
 
     # Output results
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(dump_json(result))
         print(f"Results saved to {args.output}", file=sys.stderr)
 
-        if result['success']:
+        if result['success'] and args.schools_file:
+            print(f"Found {result['staff_found']} staff members across "
+                  f"{result['schools_scraped']} schools", file=sys.stderr)
+        elif result['success']:
             print(f"Found {result['staff_found']} staff members for {args.school}",
                   file=sys.stderr)
     else:
-        print(json.dumps(result, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dump_json(result) + b'\n')
 
     # Exit with error code if scraping failed
     if not result['success']:
@@ -7,27 +7,147 @@ Usage:
     python tools/scrape_team_list.py --url "https://bceagles.com" --school "Boston College"
     python tools/scrape_team_list.py --url "https://bceagles.com" --school "Boston College" --output teams.json
 
+    # Batch mode: many schools in one shared browser context
+    python tools/scrape_team_list.py --schools-file .tmp/schools.json --concurrency 6
+
 Output: JSON list of teams with sport name, gender, schedule URL
 """
 
 import argparse
+import asyncio
 import json
 import sys
 import os
 import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
 from urllib.parse import urljoin, urlparse
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright
 from dotenv import load_dotenv
+from scrape_common import (USER_AGENT, block_heavy_resources, block_heavy_resources_async,
+                           dump_json, persistent_context, persistent_context_async,
+                           wait_for, wait_for_async)
+import requests
+import lxml.html
+from lxml import etree
 
 load_dotenv()
 
+# Batch mode (--schools-file): schools loaded in parallel
+DEFAULT_CONCURRENCY = 6
+
+# Teams a plain HTTP fetch must yield to skip the browser (server-rendered nav)
+MIN_STATIC_TEAMS = 5
+
 # Sports to exclude (no on-site games or very small participation)
-EXCLUDED_SPORTS = {
+EXCLUDED_SPORTS = frozenset({
     "skiing", "ski", "sailing", "golf", "tennis", "cross country",
     "cross-country", "track", "track and field", "track & field"
+})
+# Excluded sport names as whole words in a lowercased href ("cross country" also
+# as "cross-country"), so those links skip the classifier entirely
+_EXCLUDED_HREF_RE = re.compile(r'(?<![a-z])(?:' + '|'.join(
+    re.escape(name) for name in sorted(
+        EXCLUDED_SPORTS | {name.replace(' ', '-') for name in EXCLUDED_SPORTS},
+        key=len, reverse=True)
+) + r')(?![a-z])')
+
+
+# Lowercased href substrings: links to non-team pages, and paths that look sport-related
+SKIP_HREF_SUBSTRINGS = (
+    '/tickets', '/news', '/schedule', '/roster', '/stats',
+    '/video', '/camps', '/facilities', '/staff', 'recruiting',
+)
+SPORT_HREF_SUBSTRINGS = (
+    '/sport', '/team', 'baseball', 'basketball', 'football',
+    'soccer', 'hockey', 'lacrosse', 'volleyball', 'softball',
+    'field-hockey',
+)
+
+# parse_sport_name keywords (matched against lowercased "text url")
+WOMEN_KEYWORDS = ("women", "women's", "womens", "w-", "wsoc", "wlax", "/wbkb", "/wvball", "/wih", "wsb")
+MEN_KEYWORDS = ("men", "men's", "mens", "m-", "msoc", "mlax", "/mbkb", "/mvball", "/mih", "/bsb", "/fball")
+# Common NCAA sports; the first sport with a matching pattern wins
+SPORT_PATTERNS = {
+    "Baseball": ("baseball", "/bsb/", "/bsb"),
+    "Basketball": ("basketball", "bball", "hoops", "/mbkb/", "/wbkb/", "/mbkb", "/wbkb"),
+    "Field Hockey": ("field-hockey", "field hockey", "fhockey", "/fh/", "/fh"),
+    "Football": ("football", "/fball/", "/fball"),
+    "Ice Hockey": ("ice-hockey", "ice hockey", "hockey", "/mih/", "/wih/"),
+    "Lacrosse": ("lacrosse", "lax"),
+    "Soccer": ("soccer", "soc"),
+    "Softball": ("softball", "sball"),
+    "Volleyball": ("volleyball", "vball", "volley", "/mvball/", "/wvball/"),
+    "Swimming & Diving": ("swimming", "swim", "diving"),
+    "Rowing": ("rowing", "crew"),
+    "Water Polo": ("water-polo", "waterpolo", "wpolo"),
+    "Wrestling": ("wrestling",),
+    "Gymnastics": ("gymnastics",),
+    "Fencing": ("fencing",),
 }
 
+# One C-level regex scan per category instead of a Python `in` per keyword.
+# Gender stays two searches (any women's keyword beats "men", a substring of it).
+_WOMEN_RE = re.compile('|'.join(map(re.escape, WOMEN_KEYWORDS)))
+_MEN_RE = re.compile('|'.join(map(re.escape, MEN_KEYWORDS)))
+# Sports: one named group per SPORT_PATTERNS entry, in priority order, inside a
+# lookahead so every start position is tried (a match never hides another)
+_SPORT_NAMES = list(SPORT_PATTERNS)
+_SPORT_RE = re.compile('(?=' + '|'.join(
+    f"(?P<s{i}>{'|'.join(map(re.escape, patterns))})"
+    for i, patterns in enumerate(SPORT_PATTERNS.values())
+) + ')')
+
+# Team-page path markers, highest priority first: links matching an earlier
+# marker are considered before other links (first link per sport wins)
+SPORT_PATH_MARKERS = ('/sports/', '/sport/', '/teams/')
+
+# Team links on a rendered homepage; waiting for these replaces a fixed delay
+TEAM_LINK_READY_SELECTOR = ', '.join(f'a[href*="{marker}"]' for marker in SPORT_PATH_MARKERS)
+
+# Navigation containers whose links are candidates even without a path marker
+SPORT_MENU_CLASSES = ('sport-nav', 'sports-menu')
+
+
+def _has_class(cls):
+    """XPath predicate: element carries class `cls` (like CSS .cls)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+# Candidate team links, in document order: anchors whose href has a path
+# marker, or that sit in <nav> or a sports menu (not footers, news, ads)
+_HREF_ANCHORS_XPATH = etree.XPath('//a[@href != ""][{}]'.format(' or '.join(
+    [f'contains(@href, "{marker}")' for marker in SPORT_PATH_MARKERS]
+    + ['ancestor::nav']
+    + [f'ancestor::*[{_has_class(cls)}]' for cls in SPORT_MENU_CLASSES]
+)))
+_TEXT_NODES_XPATH = etree.XPath('.//text()')
+_ANCHORS_SELECTOR = ', '.join(
+    [f'a[href*="{marker}"]' for marker in SPORT_PATH_MARKERS]
+    + ['nav a[href]']
+    + [f'.{cls} a[href]' for cls in SPORT_MENU_CLASSES]
+)
+# Same [href, text] pairs collected in the page itself: one evaluate round-trip
+# instead of serializing the whole DOM. Text matches get_text(strip=True).
+_ANCHORS_JS = """() => Array.from(document.querySelectorAll('%s'), a => {
+    const parts = [];
+    const walker = document.createTreeWalker(a, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) parts.push(walker.currentNode.nodeValue.trim());
+    return [a.getAttribute('href'), parts.join('')];
+}).filter(([href]) => href)""" % _ANCHORS_SELECTOR
+# Only anchors and their text are read, so skip building comment/PI nodes
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+
+
+class Team(NamedTuple):
+    """One team found on the athletics site (a dict only in the JSON output)."""
+    sport: str
+    gender: str
+    name: str
+    url: str
+    schedule_url: Optional[str] = None  # Will be found by scrape_schedule.py
+
 
 def extract_teams_from_navigation(page, base_url, platform_hints):
     """
@@ -39,80 +159,139 @@ def extract_teams_from_navigation(page, base_url, platform_hints):
         platform_hints (dict): Platform-specific selectors
 
     Returns:
-        list: List of team dictionaries with name, url, sport, gender
+        list: Team tuples with sport, gender, name, url
     """
-    teams = []
+    try:
+        # Read the links in the page (page should already be loaded)
+        return extract_teams_from_anchors(page.evaluate(_ANCHORS_JS), base_url, platform_hints)
 
+    except Exception as e:
+        print(f"Error extracting teams from navigation: {str(e)}", file=sys.stderr)
+        return []
+
+
+def extract_teams_from_html(html_content, base_url, platform_hints):
+    """
+    Extract team links from rendered athletics homepage HTML.
+
+    Args:
+        html_content (str): Rendered homepage HTML
+        base_url (str): Base URL of the athletics site
+        platform_hints (dict): Platform-specific selectors
+
+    Returns:
+        list: Team tuples with sport, gender, name, url - one per
+            sport + gender (the first matching link wins)
+    """
     try:
-        # Get page content (page should already be loaded)
-        html_content = page.content()
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Find all navigation links that might be sports
-        sport_links = []
-
-        # Try multiple selectors to find sport links
-        selectors = [
-            'a[href*="/sports/"]',
-            'a[href*="/sport/"]',
-            'a[href*="/teams/"]',
-            'nav a',
-            '.sport-nav a',
-            '.sports-menu a',
-        ]
-
-        for selector in selectors:
-            links = soup.select(selector)
-            sport_links.extend(links)
-
-        # Remove duplicates by href
-        unique_links = {}
-        for link in sport_links:
-            href = link.get('href', '')
-            if href and href not in unique_links:
-                unique_links[href] = link
-
-        # Process each potential sport link
-        for href, link in unique_links.items():
+        tree = lxml.html.document_fromstring(html_content, parser=_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return []
+
+    anchors = [(link.get('href'), ''.join(t.strip() for t in _TEXT_NODES_XPATH(link)))
+               for link in _HREF_ANCHORS_XPATH(tree)]
+    return extract_teams_from_anchors(anchors, base_url, platform_hints)
+
+
+def extract_teams_from_anchors(anchors, base_url, platform_hints):
+    """
+    Classify a page's links into teams.
+
+    Args:
+        anchors (list): (href, link text) pairs in document order; href is
+            the raw attribute value
+        base_url (str): Base URL of the athletics site
+        platform_hints (dict): Platform-specific selectors
+
+    Returns:
+        list: Team tuples with sport, gender, name, url - one per
+            sport + gender (the first matching link wins)
+    """
+    teams_by_key = {}
+    seen_hrefs = set()
+    resolve = _url_resolver(base_url)
+
+    try:
+        # Find all links that might be sports, ordered by path marker
+        # (stable, so document order within a marker)
+        sport_links = sorted(anchors, key=lambda anchor: _link_priority(anchor[0]))
+
+        # Process each potential sport link (each href once)
+        for href, link_text in sport_links:
+            if not href or href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+
+            href_lower = href.lower()
+
             # Skip non-sport links
-            if any(skip in href.lower() for skip in [
-                '/tickets', '/news', '/schedule', '/roster', '/stats',
-                '/video', '/camps', '/facilities', '/staff', 'recruiting'
-            ]):
+            if any(skip in href_lower for skip in SKIP_HREF_SUBSTRINGS):
                 continue
 
             # Skip if it's not a sport-related path
-            if not any(pattern in href.lower() for pattern in [
-                '/sport', '/team', 'baseball', 'basketball', 'football',
-                'soccer', 'hockey', 'lacrosse', 'volleyball', 'softball',
-                'field-hockey'
-            ]):
+            if not any(pattern in href_lower for pattern in SPORT_HREF_SUBSTRINGS):
                 continue
 
-            # Get link text
-            link_text = link.get_text(strip=True)
+            # Skip excluded sports before classifying
+            if _EXCLUDED_HREF_RE.search(href_lower):
+                continue
 
             # Extract sport and gender from link text or URL
             sport_info = parse_sport_name(link_text, href)
 
-            if sport_info and not is_excluded_sport(sport_info['sport']):
-                full_url = urljoin(base_url, href)
+            if not sport_info or is_excluded_sport(sport_info[0]):
+                continue
+
+            # Deduplicate teams (same sport + gender)
+            if sport_info in teams_by_key:
+                continue
 
-                teams.append({
-                    'sport': sport_info['sport'],
-                    'gender': sport_info['gender'],
-                    'name': link_text,
-                    'url': full_url,
-                    'schedule_url': None,  # Will be found by scrape_schedule.py
-                })
+            teams_by_key[sport_info] = Team(sport_info[0], sport_info[1], link_text, resolve(href))
 
-        return teams
+        return list(teams_by_key.values())
 
     except Exception as e:
         print(f"Error extracting teams from navigation: {str(e)}", file=sys.stderr)
         return []
 
 
+def _url_resolver(base_url):
+    """
+    Return a function resolving hrefs against base_url like urljoin.
+
+    The base is parsed once; absolute http(s) and root-relative hrefs (the
+    usual nav links) are resolved by string concatenation, anything else
+    (relative paths, dot segments, protocol-relative) goes through urljoin.
+
+    Args:
+        base_url (str): Base URL of the athletics site
+
+    Returns:
+        callable: href -> absolute URL
+    """
+    parsed = urlparse(base_url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    fast = parsed.scheme in ('http', 'https')
+
+    def resolve(href):
+        if fast and '/.' not in href:
+            if href.startswith(('http://', 'https://')):
+                return href
+            if href.startswith('/') and not href.startswith('//'):
+                return origin + href
+        return urljoin(base_url, href)
+
+    return resolve
+
+
+def _link_priority(href):
+    """Rank of the first SPORT_PATH_MARKERS entry found in href (lower is better)."""
+    for rank, marker in enumerate(SPORT_PATH_MARKERS):
+        if marker in href:
+            return rank
+    return len(SPORT_PATH_MARKERS)
+
+
 def parse_sport_name(text, url):
     """
     Parse sport name and gender from link text or URL.
@@ -122,47 +301,37 @@ def parse_sport_name(text, url):
         url (str): URL path
 
     Returns:
-        dict: {'sport': str, 'gender': str} or None
+        tuple: (sport, gender) or None
     """
+    return _classify_sport(text, url)
+
+
+# Header, footer and mobile menus repeat the same links, so memoize per (text, url)
+@lru_cache(maxsize=1024)
+def _classify_sport(text, url):
+    """Memoized body of parse_sport_name."""
     combined = f"{text} {url}".lower()
 
     # Gender detection
     gender = "Unknown"
-    if any(w in combined for w in ["women", "women's", "womens", "w-", "wsoc", "wlax", "/wbkb", "/wvball", "/wih", "wsb"]):
+    if _WOMEN_RE.search(combined):
         gender = "Women"
-    elif any(w in combined for w in ["men", "men's", "mens", "m-", "msoc", "mlax", "/mbkb", "/mvball", "/mih", "/bsb", "/fball"]):
+    elif _MEN_RE.search(combined):
         gender = "Men"
 
-    # Sport detection (common NCAA sports)
-    sport_patterns = {
-        "Baseball": ["baseball", "/bsb/", "/bsb"],
-        "Basketball": ["basketball", "bball", "hoops", "/mbkb/", "/wbkb/", "/mbkb", "/wbkb"],
-        "Field Hockey": ["field-hockey", "field hockey", "fhockey", "/fh/", "/fh"],
-        "Football": ["football", "/fball/", "/fball"],
-        "Ice Hockey": ["ice-hockey", "ice hockey", "hockey", "/mih/", "/wih/"],
-        "Lacrosse": ["lacrosse", "lax"],
-        "Soccer": ["soccer", "soc"],
-        "Softball": ["softball", "sball"],
-        "Volleyball": ["volleyball", "vball", "volley", "/mvball/", "/wvball/"],
-        "Swimming & Diving": ["swimming", "swim", "diving"],
-        "Rowing": ["rowing", "crew"],
-        "Water Polo": ["water-polo", "waterpolo", "wpolo"],
-        "Wrestling": ["wrestling"],
-        "Gymnastics": ["gymnastics"],
-        "Fencing": ["fencing"],
-    }
-
-    detected_sport = None
-    for sport_name, patterns in sport_patterns.items():
-        if any(pattern in combined for pattern in patterns):
-            detected_sport = sport_name
-            break
+    # Sport detection (common NCAA sports): highest-priority sport matched anywhere.
+    # Sport i is group i + 1, and a top-priority match ends the scan early.
+    best = None
+    for m in _SPORT_RE.finditer(combined):
+        rank = m.lastindex - 1
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    detected_sport = _SPORT_NAMES[best] if best is not None else None
 
     if detected_sport:
-        return {
-            'sport': detected_sport,
-            'gender': gender
-        }
+        return detected_sport, gender
 
     return None
 
@@ -180,85 +349,216 @@ def is_excluded_sport(sport_name):
     return sport_name.lower() in EXCLUDED_SPORTS
 
 
-def scrape_team_list(url, school_name, platform=None):
+def _fetch_static(url):
+    """
+    Fetch the athletics homepage over plain HTTP (no browser, no scripts).
+
+    Args:
+        url (str): Athletics website URL
+
+    Returns:
+        str or None: Response HTML, or None on any network/HTTP error
+    """
+    try:
+        response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=10)
+    except requests.RequestException as e:
+        print(f"Static fetch failed for {url}: {str(e)}", file=sys.stderr)
+        return None
+    if response.status_code != 200:
+        return None
+    # Without a declared charset requests falls back to ISO-8859-1, which
+    # garbles UTF-8 team names; detect the encoding from the body instead
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = response.apparent_encoding or 'utf-8'
+    return response.text
+
+
+def _extract_static_teams(url):
+    """
+    Teams from the server-rendered homepage, or None if the browser is needed.
+
+    Many sites (Sidearm especially) ship the team nav in the initial HTML;
+    when it already yields MIN_STATIC_TEAMS teams, Playwright is skipped.
+    """
+    html = _fetch_static(url)
+    if html is None:
+        return None
+    teams = extract_teams_from_html(html, url, {})
+    if len(teams) < MIN_STATIC_TEAMS:
+        return None
+    print(f"Found {len(teams)} teams in static HTML, skipping browser", file=sys.stderr)
+    return teams
+
+
+def _scrape_with_browser(browser, url, platform):
+    """Load the athletics site in a fresh context on an existing browser and extract teams."""
+    context = browser.new_context(user_agent=USER_AGENT)
+    try:
+        return _scrape_in_context(context, url, platform)
+    finally:
+        context.close()
+
+
+def _scrape_in_context(context, url, platform):
+    """Load the athletics site on a new page in an open browser context and extract teams."""
+    page = context.new_page()
+    try:
+        page.route("**/*", block_heavy_resources)
+
+        # Navigate to athletics site
+        print(f"Loading {url}...", file=sys.stderr)
+        try:
+            page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        except PlaywrightTimeout as e:
+            # Fallback: the navigation has committed, keep waiting on it
+            # instead of loading the page a second time
+            print(f"DOMContentLoaded wait failed, waiting for load: {str(e)}", file=sys.stderr)
+            try:
+                page.wait_for_load_state('load', timeout=5000)
+            except PlaywrightTimeout:
+                pass
+
+        # Wait for team links to render (up to 3s) rather than a fixed delay
+        wait_for(page, TEAM_LINK_READY_SELECTOR, 3000)
+
+        # Get platform hints (could be enhanced with detect_athletics_platform.py)
+        platform_hints = {}
+
+        # Extract teams
+        return extract_teams_from_navigation(page, url, platform_hints)
+    finally:
+        page.close()
+
+
+def _team_list_result(url, school_name, teams):
+    """Build the tool's result dict from extracted (already deduplicated) Team tuples."""
+    return {
+        "school": school_name,
+        "athletics_url": url,
+        "teams_found": len(teams),
+        "teams": [team._asdict() for team in teams],
+        "success": True,
+    }
+
+
+def _error_result(url, school_name, error):
+    """Failure result for a school (same shape for single and batch runs)."""
+    if isinstance(error, PlaywrightTimeout):
+        message = "Timeout loading athletics website"
+    else:
+        message = f"Error scraping team list: {str(error)}"
+    return {
+        "school": school_name,
+        "athletics_url": url,
+        "error": message,
+        "success": False,
+    }
+
+
+def scrape_team_list(url, school_name, platform=None, browser=None):
     """
     Main function to scrape team list from athletics website.
 
+    Tries a plain HTTP fetch first and only renders the site in Chromium
+    when the static HTML does not contain the team nav.
+
     Args:
         url (str): Athletics website URL
         school_name (str): School name
         platform (str): Optional platform type for optimized scraping
+        browser: Optional running Playwright (sync) Browser to reuse across
+            schools; the persistent profile is opened and closed per call
+            when omitted
 
     Returns:
         dict: Result with teams list and metadata
     """
-    teams = []
-
     try:
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
-
-            # Navigate to athletics site
+        teams = _extract_static_teams(url)
+        if teams is not None:
+            return _team_list_result(url, school_name, teams)
+
+        if browser is not None:
+            teams = _scrape_with_browser(browser, url, platform)
+        else:
+            with sync_playwright() as p, persistent_context(p) as context:
+                teams = _scrape_in_context(context, url, platform)
+
+        return _team_list_result(url, school_name, teams)
+
+    except Exception as e:
+        return _error_result(url, school_name, e)
+
+
+async def _scrape_team_list_async(context, sem, url, school_name, platform=None):
+    """
+    Async counterpart of scrape_team_list on a shared browser context.
+
+    Each school gets its own page; link extraction runs in a worker
+    thread so other schools keep loading meanwhile.
+    """
+    async with sem:
+        teams = await asyncio.to_thread(_extract_static_teams, url)
+        if teams is not None:
+            return _team_list_result(url, school_name, teams)
+
+        page = await context.new_page()
+        try:
+            await page.route("**/*", block_heavy_resources_async)
+
             print(f"Loading {url}...", file=sys.stderr)
             try:
-                page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                # Wait a bit for additional content to load
-                page.wait_for_timeout(3000)
-            except Exception as e:
-                # Fallback: try with just commit
-                print(f"DOMContentLoaded wait failed, using commit: {str(e)}", file=sys.stderr)
-                page.goto(url, wait_until='commit', timeout=30000)
-                page.wait_for_timeout(5000)
+                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            except PlaywrightTimeout as e:
+                print(f"DOMContentLoaded wait failed, waiting for load: {str(e)}", file=sys.stderr)
+                try:
+                    await page.wait_for_load_state('load', timeout=5000)
+                except PlaywrightTimeout:
+                    pass
 
-            # Get platform hints (could be enhanced with detect_athletics_platform.py)
-            platform_hints = {}
+            await wait_for_async(page, TEAM_LINK_READY_SELECTOR, 3000)
 
-            # Extract teams
-            teams = extract_teams_from_navigation(page, url, platform_hints)
+            anchors = await page.evaluate(_ANCHORS_JS)
+        finally:
+            await page.close()
 
-            # Close browser
-            browser.close()
+    teams = await asyncio.to_thread(extract_teams_from_anchors, anchors, url, {})
+    return _team_list_result(url, school_name, teams)
 
-        # Deduplicate teams (same sport + gender)
-        unique_teams = {}
-        for team in teams:
-            key = f"{team['sport']}_{team['gender']}"
-            if key not in unique_teams:
-                unique_teams[key] = team
 
-        teams_list = list(unique_teams.values())
+async def _scrape_team_lists_async(schools, concurrency):
+    """Scrape all schools concurrently in one browser context; see scrape_team_lists."""
+    sem = asyncio.Semaphore(concurrency)
 
-        result = {
-            "school": school_name,
-            "athletics_url": url,
-            "teams_found": len(teams_list),
-            "teams": teams_list,
-            "success": True,
-        }
+    async with async_playwright() as p, persistent_context_async(p) as context:
+        outcomes = await asyncio.gather(
+            *[_scrape_team_list_async(context, sem, school['url'], school['school'],
+                                      school.get('platform'))
+              for school in schools],
+            return_exceptions=True,
+        )
 
-        return result
+    return [_error_result(school['url'], school['school'], outcome)
+            if isinstance(outcome, Exception) else outcome
+            for school, outcome in zip(schools, outcomes)]
 
-    except PlaywrightTimeout:
-        return {
-            "school": school_name,
-            "athletics_url": url,
-            "error": "Timeout loading athletics website",
-            "success": False,
-        }
-    except Exception as e:
-        return {
-            "school": school_name,
-            "athletics_url": url,
-            "error": f"Error scraping team list: {str(e)}",
-            "success": False,
-        }
+
+def scrape_team_lists(schools, concurrency=DEFAULT_CONCURRENCY):
+    """
+    Scrape team lists for many schools concurrently.
+
+    Uses the async Playwright API with one shared persistent browser context
+    (one page per school), keeping up to `concurrency` schools in flight. One failed
+    school does not affect the others.
+
+    Args:
+        schools (list): Dicts with 'school', 'url' and optional 'platform'
+        concurrency (int): Maximum number of schools loading at once
+
+    Returns:
+        list: One scrape_team_list-style result dict per school, in input order
+    """
+    return asyncio.run(_scrape_team_lists_async(schools, concurrency))
 
 
 def main():
@@ -267,18 +567,26 @@ def main():
     )
     parser.add_argument(
         "--url",
-        required=True,
         help="Athletics website URL (e.g., https://bceagles.com)"
     )
     parser.add_argument(
         "--school",
-        required=True,
         help="School name (e.g., 'Boston College')"
     )
     parser.add_argument(
         "--platform",
         help="Platform type (sidearm, presto, custom) for optimized scraping"
     )
+    parser.add_argument(
+        "--schools-file",
+        help="Batch mode: JSON list of {school, url, platform?} objects"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Batch mode: schools scraped in parallel (default: {DEFAULT_CONCURRENCY})"
+    )
     parser.add_argument(
         "--output",
         help="Output JSON file path (default: stdout)"
@@ -286,21 +594,38 @@ def main():
 
     args = parser.parse_args()
 
-    # Scrape teams
-    result = scrape_team_list(args.url, args.school, args.platform)
+    if args.schools_file:
+        with open(args.schools_file) as f:
+            schools = json.load(f)
+        results = scrape_team_lists(schools, args.concurrency)
+        result = {
+            "schools_scraped": len(results),
+            "teams_found": sum(r.get('teams_found', 0) for r in results),
+            "results": results,
+            "success": any(r['success'] for r in results),
+        }
+    elif args.url and args.school:
+        # Scrape teams
+        result = scrape_team_list(args.url, args.school, args.platform)
+    else:
+        parser.error("--url and --school are required without --schools-file")
 
     # Save to file if specified
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(dump_json(result))
         print(f"Results saved to {args.output}", file=sys.stderr)
 
-        if result['success']:
+        if result['success'] and args.schools_file:
+            print(f"Found {result['teams_found']} teams across "
+                  f"{result['schools_scraped']} schools", file=sys.stderr)
+        elif result['success']:
             print(f"Found {result['teams_found']} teams for {args.school}",
                   file=sys.stderr)
 
     # Always output JSON to stdout for pipeline processing
-    print(json.dumps(result, indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(result) + b'\n')
 
     # Exit with error code if scraping failed
     if not result['success']:
@@ -10,56 +10,400 @@ Usage:
     python tools/scrape_team_staff.py --team-url "https://bceagles.com/sports/baseball" \
         --sport "Baseball" --school "Boston College" --output staff.json
 
+    # Many teams in one browser (teams.json: [{"team_url", "sport", "school"}, ...])
+    python tools/scrape_team_staff.py --teams-file teams.json --output staff.json
+
+    # ...also saving each team to results/ as it finishes (<school>_<sport>_<hash>.json)
+    python tools/scrape_team_staff.py --teams-file teams.json --batch-output results/
+
 Output: JSON of staff with name, title, email, phone, sport (from URL)
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import sys
+import threading
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
 import os
 import re
+from scrape_coach_bio_pages import scrape_coach_bios_async
+from scrape_common import USER_AGENT, block_heavy_resources_async, dump_json, wait_for_async
 
 load_dotenv()
 
+# Bio pages loaded at once by enrich_emails_from_bio_pages
+BIO_PAGE_CONCURRENCY = 5
+
+# Pages open at once on one athletics host, across every team and bio tab
+# sharing a browser (scrape_many runs several teams of a school together)
+PER_HOST_CONCURRENCY = 4
+
+# Seconds allowed for the in-process bio page fallback (Fallback 2)
+BIO_FALLBACK_TIMEOUT = 120
+
+# Sync entry points reuse one warm Chromium per process (a fresh context per
+# call); it is relaunched after this many calls so long batches don't bloat
+MAX_CALLS_PER_BROWSER = 50
+
+# Per-table progress logs on stderr (set by --verbose); off by default
+VERBOSE = False
+
+# Chromium switches that skip work a headless scrape never needs (shorter cold start)
+CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage', '--disable-gpu', '--disable-extensions',
+    '--disable-background-networking', '--disable-sync',
+]
+
+# Markup that signals each page has rendered (waited on instead of networkidle).
+# Staff tables are recognised by their header row, so these wait for header
+# cells rather than any <table>, which layout tables would also match.
+COACHES_READY_SELECTOR = ('table.sidearm-table, table th, table a[href^="mailto:"], '
+                          '.card, .s-person-card')
+ROSTER_READY_SELECTOR = 'table.sidearm-table, table th'
+DIRECTORY_READY_SELECTOR = '.s-person-card, table th, a[href^="mailto:"]'
+
+# Plain-HTTP requests (static coaches page, directory probes) run in
+# asyncio.to_thread workers; requests.Session is not thread-safe, so each
+# worker thread keeps its own keep-alive session (see _http_session)
+_HTTP_LOCAL = threading.local()
+
+# Markup (lowercased) showing a coaches page was server-rendered with its staff
+STATIC_COACHES_MARKERS = ('card-title', 'col-coaches', 's-person-card', 'sidearm-table', 'coaching staff')
+# One case-insensitive scan for any marker, without lowercasing a copy of the page
+_STATIC_COACHES_MARKER_RE = re.compile('|'.join(map(re.escape, STATIC_COACHES_MARKERS)), re.IGNORECASE)
+# Cloudflare email obfuscation: addresses only exist after its script runs
+EMAIL_PROTECTION_PATH = '/cdn-cgi/l/email-protection'
+
+# Patterns used per row/cell/card, compiled once
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_PHONE_LIKE_RE = re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}')
+_DIGITS_RE = re.compile(r'\D')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_EMAIL_FULL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PRESTO_SEASON_RE = re.compile(r'(/sports/[a-z]+)/\d{4}-\d{2}$')
+_YEAR_SUFFIX_RE = re.compile(r"\s*'\d{2}$")
+# Runs of characters not allowed in --batch-output file names
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+# Tracking/placeholder addresses found on bio pages: one alternation instead of a substring scan per domain
+FAKE_EMAIL_DOMAINS = ('sentry.wmt.dev', 'example.com', 'domain.com',
+                      'email.com', 'sidearmstats.com', 'sidearmtech.com')
+_FAKE_DOMAIN_RE = re.compile('|'.join(map(re.escape, FAKE_EMAIL_DOMAINS)), re.IGNORECASE)
+
+# Staff-table XPaths (predicates evaluated in C instead of per-element Python lambdas)
+_TEXT_NODES_XPATH = etree.XPath('.//text()')
+_TABLE_ROWS_XPATH = etree.XPath('.//tr')
+_ROW_CELLS_XPATH = etree.XPath('.//td | .//th')
+_MAILTO_HREF_XPATH = etree.XPath(".//a[starts-with(@href, 'mailto:')]/@href")
+_HAS_MAILTO_XPATH = etree.XPath("boolean(.//a[contains(@href, 'mailto:')])")
+_LINK_HREF_XPATH = etree.XPath('.//a[@href]/@href')
+_TABLES_XPATH = etree.XPath('//table')
+
+# bio-link collection only needs anchors; the parser skips everything else
+_LINKS_ONLY = SoupStrainer('a', href=True)
+_FIRST_ROW_XPATH = etree.XPath('(.//tr)[1]')
+_FIRST_CAPTION_XPATH = etree.XPath('(.//caption)[1]')
+# Roster "Coaching Staff" heading (own text, any case), and everything after it
+_COACHING_HEADING_XPATH = etree.XPath(
+    "//*[self::h2 or self::h3 or self::div][text()[contains("
+    "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'coaching staff')]]")
+_ELEMENTS_AFTER_XPATH = etree.XPath('descendant::* | following::*')
+
+# PrestoSports card selectors (see extract_staff_from_presto_cards) as XPath
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_PRESTO_CARDS_XPATH = etree.XPath(
+    f"//div[{_has_class('card')} and {_has_class('flex-fill')}]"
+    f" | //*[{_has_class('coaches-content')}]//*[{_has_class('card')}]"
+    f" | //*[{_has_class('staff-content')}]//*[{_has_class('card')}]")
+_ANY_CARD_XPATH = etree.XPath(f"//*[{_has_class('card')}]")
+# h5.card-title a, h4.card-title a, .card-title a - the title inside the card,
+# not a .card-title wrapping the whole card list
+_CARD_NAME_LINK_XPATH = etree.XPath(f".//*[{_has_class('card-title')}]//a")
+# p.card-text.m-0, p.card-text:not(.text-muted)
+_CARD_TITLE_XPATH = etree.XPath(
+    f".//p[{_has_class('card-text')} and ({_has_class('m-0')} or not({_has_class('text-muted')}))]")
+# small .fa-phone, .fa-phone
+_PHONE_ICON_XPATH = etree.XPath(f".//*[{_has_class('fa-phone')}]")
+
+
+@dataclass(slots=True)
+class Staff:
+    """One staff member, as built by the extractors and filled in by enrichment."""
+    name: str
+    title: str
+    email: str
+    phone: str
+    sport: str
+    bio_url: str = ''
+
+
+class BrowserSession:
+    """
+    One headless Chromium browser + context shared by every phase of a team scrape.
+
+    Chromium is launched on the first new_page(), so phases that return
+    early (nothing missing, nothing to fall back to) never pay for it.
+    child() sessions get their own context on the same browser, so a batch
+    of teams pays for one launch while keeping cookies/storage per team.
+    host_limit() is shared the same way, so the teams together keep at
+    most PER_HOST_CONCURRENCY pages open on any one host, and so is
+    shared_load(), which runs per-school work (the staff directory) once.
+
+    Usage:
+        async with BrowserSession() as session:
+            page = await session.new_page()
+    """
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._playwright = None
+        self.browser = None
+        self.context = None
+        # Concurrent first new_page() calls must not each launch a browser
+        self._browser_lock = asyncio.Lock()
+        self._context_lock = asyncio.Lock()
+        # {host: Semaphore} and {key: Task}, kept on the root session only
+        self._host_sems = {}
+        self._shared_loads = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def child(self):
+        """A session with its own context on this session's browser."""
+        return BrowserSession(parent=self)
+
+    def host_limit(self, url):
+        """
+        Semaphore bounding the pages open on `url`'s host.
+
+        Hold it (async with) from opening a page on the host until it is
+        closed; every session on this browser shares the same semaphores.
+
+        Args:
+            url (str): Any URL on the host
+
+        Returns:
+            asyncio.Semaphore: PER_HOST_CONCURRENCY slots for the host
+        """
+        host_sems = (self._parent or self)._host_sems
+        host = urlparse(url).netloc
+        sem = host_sems.get(host)
+        if sem is None:
+            sem = host_sems[host] = asyncio.Semaphore(PER_HOST_CONCURRENCY)
+        return sem
+
+    def shared_load(self, key, load, *args):
+        """
+        Run `load(root_session, *args)` once per key for every session on this browser.
+
+        The first caller starts the load on the root session's own context
+        (so it outlives the team that started it); later callers await the
+        same result.
+
+        Args:
+            key: Hashable identity of the load (e.g. the school's base URL)
+            load: Coroutine function taking a BrowserSession first
+            *args: Further arguments for load
+
+        Returns:
+            Awaitable: The load's result (shielded, so one caller's
+                cancellation does not cancel it for the others)
+        """
+        root = self._parent or self
+        task = root._shared_loads.get(key)
+        if task is None:
+            task = root._shared_loads[key] = asyncio.ensure_future(load(root, *args))
+        return asyncio.shield(task)
+
+    async def new_page(self):
+        """Open a tab in this session's context, launching the browser on first use."""
+        async with self._context_lock:
+            if self.context is None:
+                browser = await (self._parent or self)._launch_browser()
+                context = await browser.new_context(user_agent=USER_AGENT)
+                await context.route("**/*", block_heavy_resources_async)
+                self.context = context
+        return await self.context.new_page()
+
+    async def _launch_browser(self):
+        """Start Playwright and Chromium once; later calls return the same browser."""
+        async with self._browser_lock:
+            if self.browser is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                # PW_CHROMIUM_PATH pins an installed Chromium instead of Playwright's bundled one
+                self.browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    executable_path=os.getenv('PW_CHROMIUM_PATH') or None,
+                    args=CHROMIUM_ARGS,
+                )
+        return self.browser
+
+    async def close(self):
+        """Close the browser and stop Playwright (a child only closes its context)."""
+        if self._parent is not None:
+            context, self.context = self.context, None
+            if context is not None:
+                await context.close()
+            return
+        try:
+            if self.browser is not None:
+                await self.browser.close()
+        finally:
+            if self._playwright is not None:
+                await self._playwright.stop()
+            self._playwright = self.browser = self.context = None
+
+
+_runner = None
+_warm_session = None
+_warm_session_calls = 0
+
+
+def _run_in_warm_session(phase, *args):
+    """
+    Run an async scrape phase `phase(session, *args)` from sync code.
+
+    The phase gets its own context on a process-wide browser that stays up on
+    one event loop between calls, so callers looping over teams (e.g.
+    backfill_contacts) pay Chromium's cold start once rather than per call.
+
+    Returns:
+        Whatever the phase returns
+    """
+    global _runner, _warm_session, _warm_session_calls
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_close_warm_session)
+    if _warm_session is not None and (
+            _warm_session_calls >= MAX_CALLS_PER_BROWSER
+            or (_warm_session.browser is not None and not _warm_session.browser.is_connected())):
+        try:
+            _runner.run(_warm_session.close())
+        except Exception as e:
+            print(f"Error closing browser: {e}", file=sys.stderr)
+        _warm_session = None
+    if _warm_session is None:
+        _warm_session = BrowserSession()
+        _warm_session_calls = 0
+    _warm_session_calls += 1
+    return _runner.run(_in_child_session(_warm_session, phase, *args))
+
+
+async def _in_child_session(session, phase, *args):
+    """Run `phase(child, *args)` in a child of `session`, closing its context after."""
+    async with session.child() as child:
+        return await phase(child, *args)
+
+
+def _close_warm_session():
+    """atexit hook: close the warm browser and its event loop."""
+    global _runner, _warm_session
+    if _runner is None:
+        return
+    try:
+        if _warm_session is not None:
+            _runner.run(_warm_session.close())
+    finally:
+        _runner.close()
+        _runner = _warm_session = None
+
+
+def _http_session():
+    """
+    This thread's requests.Session, created on first use.
+
+    Repeat hits on a school's host from the same worker reuse the open
+    connection instead of a new TLS handshake.
+
+    Returns:
+        requests.Session: Session with the scraper User-Agent
+    """
+    session = getattr(_HTTP_LOCAL, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=20)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _HTTP_LOCAL.session = session
+    return session
+
 
 def clean_phone(phone_text):
     """Extract a clean 10-digit phone number from text, handling duplicates."""
     if not phone_text or phone_text == 'Not Found':
         return 'Not Found'
-    # Deduplicate doubled phone text (e.g., "207-786-6362207-786-6362")
-    # by taking the first half if both halves match
-    text = phone_text.strip()
-    if len(text) >= 14:  # minimum doubled: "xxx-xxxxxxx-xxxx" = 24 chars
-        half = len(text) // 2
-        if text[:half] == text[half:]:
-            text = text[:half]
+    # Fast reject: a phone match needs 10 digits (most cells are names/titles/emails)
+    if sum(map(str.isdigit, phone_text)) < 10:
+        return 'Not Found'
+    text = _undouble(phone_text.strip())
     # Only match 10-digit phone numbers: (xxx) xxx-xxxx or xxx-xxx-xxxx
-    match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
+    match = _PHONE_RE.search(text)
     if match:
-        digits = re.sub(r'\D', '', match.group())
+        digits = _DIGITS_RE.sub('', match.group())
         if len(digits) == 10:
             return match.group()
     return 'Not Found'
 
 
+def _email_missing(staff):
+    """True if a staff record has no email yet (absent, None or 'Not Found')."""
+    return staff.email in (None, 'Not Found')
+
+
+def _undouble(text):
+    """
+    Deduplicate doubled cell text (e.g., "207-786-6362207-786-6362").
+
+    Returns the first half if both halves match, else the text unchanged.
+    Odd lengths can't be doubled, and comparing the first character of each
+    half rejects most other text before the halves are sliced and compared.
+    """
+    n = len(text)
+    if n >= 14 and not n & 1:  # minimum doubled: "xxx-xxxxxxx-xxxx" = 24 chars
+        half = n >> 1
+        if text[0] == text[half] and text[:half] == text[half:]:
+            return text[:half]
+    return text
+
+
 def find_coaches_page_url(page, team_url):
     """
     Find the coaches/staff page for a team.
 
     Args:
-        page: Playwright page object
+        page: Playwright page object (unused; the URL is derived from team_url)
         team_url (str): Team page URL (e.g., https://bceagles.com/sports/baseball)
 
     Returns:
         str: Coaches page URL
     """
-    import re
+    return _coaches_url(team_url)
+
 
+@lru_cache(maxsize=1024)
+def _coaches_url(team_url):
+    """Pure team URL -> coaches URL rewrite behind find_coaches_page_url (memoized)."""
     base_url = team_url.rstrip('/')
 
     # Strip trailing /index from PrestoSports URLs
@@ -68,7 +412,7 @@ def find_coaches_page_url(page, team_url):
 
     # Check if PrestoSports URL with season year (e.g., /sports/bsb/2025-26)
     # Strip the season from the URL for the coaches page
-    presto_match = re.search(r'(/sports/[a-z]+)/\d{4}-\d{2}$', base_url)
+    presto_match = _PRESTO_SEASON_RE.search(base_url)
     if presto_match:
         base_url = base_url[:presto_match.end(1)]
 
@@ -80,23 +424,24 @@ def extract_staff_from_table(table, sport_name):
     Extract staff from table format (used by Sidearm team pages).
 
     Args:
-        table: BeautifulSoup table element
+        table: lxml table element
         sport_name (str): Sport name from URL
 
     Returns:
-        list: List of staff dictionaries
+        list: Staff records
     """
     staff_members = []
-    import re
 
     try:
-        rows = table.find_all('tr')
+        # Walk the table on lxml's C tree (XPath per row) rather than
+        # BeautifulSoup's find_all/get_text with per-cell lambdas
+        rows = _TABLE_ROWS_XPATH(table)
         if not rows:
             return staff_members
 
         # Get header cells
-        header_cells = rows[0].find_all(['th', 'td'])
-        headers = [th.get_text(strip=True).lower() for th in header_cells]
+        header_cells = _ROW_CELLS_XPATH(rows[0])
+        headers = [_cell_text(th).lower() for th in header_cells]
 
         # Find column indices from header text first
         name_col = next((i for i, h in enumerate(headers) if 'name' in h), None)
@@ -120,12 +465,12 @@ def extract_staff_from_table(table, sport_name):
 
         # FALLBACK 2: If still can't find columns, infer from data patterns
         if name_col is None and len(rows) > 1:
-            data_cells = rows[1].find_all(['td', 'th'])
+            data_cells = _ROW_CELLS_XPATH(rows[1])
             for i, cell in enumerate(data_cells):
-                text = cell.get_text(strip=True)
-                if '@' in text or cell.find('a', href=lambda x: x and 'mailto:' in str(x)):
+                text = _cell_text(cell)
+                if '@' in text or _HAS_MAILTO_XPATH(cell):
                     email_col = i
-                elif re.search(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}', text):
+                elif _PHONE_LIKE_RE.search(text):
                     phone_col = i
             # Assume first non-email, non-phone column is name, second is title
             used = {email_col, phone_col}
@@ -138,60 +483,64 @@ def extract_staff_from_table(table, sport_name):
 
         # Parse data rows (skip header)
         for row in rows[1:]:
-            cells = row.find_all(['td', 'th'])
+            cells = _ROW_CELLS_XPATH(row)
 
             if not cells or len(cells) == 0:
                 continue
 
             try:
-                name = cells[name_col].get_text(strip=True) if name_col is not None and len(cells) > name_col else None
-                title = cells[title_col].get_text(strip=True) if title_col is not None and len(cells) > title_col else 'Unknown'
+                # Materialize each cell's text and first mailto once per row;
+                # the column lookups and ALL-cells fallbacks below reuse them
+                texts = [_cell_text(cell) for cell in cells]
+                mailtos = [next(iter(_MAILTO_HREF_XPATH(cell)), None) for cell in cells]
+
+                name = texts[name_col] if name_col is not None and len(cells) > name_col else None
+                title = texts[title_col] if title_col is not None and len(cells) > title_col else 'Unknown'
 
                 # Email extraction - try multiple approaches
                 email = 'Not Found'
 
                 # Approach 1: Check the designated email column
                 if email_col is not None and len(cells) > email_col:
-                    email_cell = cells[email_col]
-                    email_link = email_cell.find('a', href=lambda x: x and x.startswith('mailto:'))
-                    if email_link:
-                        email = email_link.get('href', '').replace('mailto:', '').strip()
-                    else:
-                        email_text = email_cell.get_text(strip=True)
-                        if '@' in email_text:
-                            email = email_text
+                    if mailtos[email_col]:
+                        email = mailtos[email_col].replace('mailto:', '').strip()
+                    elif _EMAIL_FULL_RE.match(texts[email_col]):
+                        email = texts[email_col]
 
                 # Approach 2: Search ALL cells in the row for mailto links or email text
                 if email == 'Not Found':
-                    for cell in cells:
-                        mailto = cell.find('a', href=lambda x: x and x.startswith('mailto:'))
+                    for mailto, cell_text in zip(mailtos, texts):
                         if mailto:
-                            email = mailto.get('href', '').replace('mailto:', '').strip()
+                            email = mailto.replace('mailto:', '').strip()
                             break
-                        cell_text = cell.get_text(strip=True)
-                        if '@' in cell_text and re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', cell_text):
+                        if '@' in cell_text and _EMAIL_FULL_RE.match(cell_text):
                             email = cell_text
                             break
 
-                phone = clean_phone(cells[phone_col].get_text(strip=True)) if phone_col is not None and len(cells) > phone_col else 'Not Found'
+                phone = clean_phone(texts[phone_col]) if phone_col is not None and len(cells) > phone_col else 'Not Found'
 
                 # Also search for phone in all cells if not found
                 if phone == 'Not Found':
-                    for cell in cells:
-                        cell_text = cell.get_text(strip=True)
+                    for cell_text in texts:
                         cleaned = clean_phone(cell_text)
                         if cleaned != 'Not Found':
                             phone = cleaned
                             break
 
+                # Name cells usually link to the coach's bio page (used for enrichment)
+                bio_url = ''
+                if name_col is not None and len(cells) > name_col:
+                    bio_url = next(iter(_LINK_HREF_XPATH(cells[name_col])), '')
+
                 if name and name != 'Name':  # Skip header row if it appears again
-                    staff_members.append({
-                        'name': name,
-                        'title': title,
-                        'email': email,
-                        'phone': phone if phone else 'Not Found',
-                        'sport': sport_name,  # Assign sport from team URL
-                    })
+                    staff_members.append(Staff(
+                        name=name,
+                        title=title,
+                        email=email,
+                        phone=phone if phone else 'Not Found',
+                        sport=sport_name,  # Assign sport from team URL
+                        bio_url=bio_url,
+                    ))
 
             except (IndexError, AttributeError) as e:
                 print(f"Error parsing row: {e}", file=sys.stderr)
@@ -203,7 +552,12 @@ def extract_staff_from_table(table, sport_name):
     return staff_members
 
 
-def extract_staff_from_presto_cards(soup, sport_name):
+def _cell_text(el):
+    """lxml equivalent of BeautifulSoup's el.get_text(strip=True)."""
+    return ''.join(t.strip() for t in _TEXT_NODES_XPATH(el))
+
+
+def extract_staff_from_presto_cards(html, sport_name):
     """
     Extract staff from PrestoSports card-based layout.
 
@@ -215,76 +569,92 @@ def extract_staff_from_presto_cards(soup, sport_name):
     - Phone: small with fa-phone icon
 
     Args:
-        soup: BeautifulSoup object
+        html (str): Coaches page HTML (an already-parsed lxml tree is also
+            accepted)
         sport_name (str): Sport name from URL
 
     Returns:
-        list: List of staff dictionaries
+        list: Staff records
     """
-    import re
     staff_members = []
 
+    # The selectors above are precompiled XPath run on lxml's C tree rather
+    # than soupsieve CSS matching over BeautifulSoup
+    if isinstance(html, lxml.html.HtmlElement):
+        tree = html
+    else:
+        try:
+            tree = lxml.html.fromstring(html)
+        except etree.ParserError:
+            return staff_members
+
     # Find coach cards
-    cards = soup.select('div.card.flex-fill, .coaches-content .card, .staff-content .card')
+    cards = _PRESTO_CARDS_XPATH(tree)
     if not cards:
         # Try broader card selection
-        cards = soup.select('.card')
+        cards = _ANY_CARD_XPATH(tree)
         # Filter to only cards that look like coach cards (have card-title with a link)
-        cards = [c for c in cards if c.select_one('h5.card-title a, h4.card-title a, .card-title a')]
+        cards = [c for c in cards if _CARD_NAME_LINK_XPATH(c)]
+    if not cards:
+        return staff_members
 
     for card in cards:
         try:
             # Extract name
-            name_elem = card.select_one('h5.card-title a, h4.card-title a, .card-title a')
-            if not name_elem:
+            name_links = _CARD_NAME_LINK_XPATH(card)
+            if not name_links:
                 continue
-            name = name_elem.get_text(strip=True)
+            name_elem = name_links[0]
+            name = _cell_text(name_elem)
             if not name:
                 continue
 
             # Extract title
-            title_elem = card.select_one('p.card-text.m-0, p.card-text:not(.text-muted)')
-            title = title_elem.get_text(strip=True) if title_elem else 'Unknown'
+            title_elems = _CARD_TITLE_XPATH(card)
+            title = _cell_text(title_elems[0]) if title_elems else 'Unknown'
+
+            card_text = None
 
             # Extract email
             email = 'Not Found'
-            email_link = card.find('a', href=lambda x: x and x.startswith('mailto:'))
-            if email_link:
-                email = email_link.get('href', '').replace('mailto:', '').strip()
+            mailtos = _MAILTO_HREF_XPATH(card)
+            if mailtos:
+                email = mailtos[0].replace('mailto:', '').strip()
             else:
                 # Check for email text in card
-                card_text = card.get_text()
-                email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', card_text)
+                card_text = ''.join(_TEXT_NODES_XPATH(card))
+                email_match = _EMAIL_RE.search(card_text)
                 if email_match:
                     email = email_match.group()
 
             # Extract phone
             phone = 'Not Found'
-            phone_elem = card.select_one('small .fa-phone, .fa-phone')
-            if phone_elem:
-                phone_container = phone_elem.parent
-                if phone_container:
-                    phone_text = phone_container.get_text(strip=True)
-                    phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', phone_text)
+            phone_elems = _PHONE_ICON_XPATH(card)
+            if phone_elems:
+                phone_container = phone_elems[0].getparent()
+                if phone_container is not None:
+                    phone_text = _cell_text(phone_container)
+                    phone_match = _PHONE_RE.search(phone_text)
                     if phone_match:
                         phone = phone_match.group()
             if phone == 'Not Found':
-                card_text = card.get_text()
-                phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', card_text)
+                if card_text is None:
+                    card_text = ''.join(_TEXT_NODES_XPATH(card))
+                phone_match = _PHONE_RE.search(card_text)
                 if phone_match:
                     phone = phone_match.group()
 
             # Get bio link for enrichment
             bio_url = name_elem.get('href', '')
 
-            staff_members.append({
-                'name': name,
-                'title': title,
-                'email': email,
-                'phone': phone,
-                'sport': sport_name,
-                'bio_url': bio_url,
-            })
+            staff_members.append(Staff(
+                name=name,
+                title=title,
+                email=email,
+                phone=phone,
+                sport=sport_name,
+                bio_url=bio_url,
+            ))
 
         except Exception as e:
             import sys
@@ -306,54 +676,53 @@ def scrape_roster_embedded_staff(team_url, sport_name, school_name):
         school_name (str): School name
 
     Returns:
-        list: Staff members or empty list
+        list: Staff records or empty list
     """
-    try:
-        from playwright.sync_api import sync_playwright
-        from bs4 import BeautifulSoup
+    return _run_in_warm_session(_scrape_roster_embedded_staff_async,
+                                team_url, sport_name, school_name)
 
-        print(f"  Fallback 1: Checking roster page for embedded coaching staff...", file=sys.stderr)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
+async def _scrape_roster_embedded_staff_async(session, team_url, sport_name, school_name,
+                                              page_cache=None):
+    """
+    Async body of scrape_roster_embedded_staff on a shared BrowserSession.
 
-            # Navigate to roster page
-            roster_url = f"{team_url.rstrip('/')}/roster"
+    The roster HTML is stored in page_cache (when given) for Fallback 2.
+    """
+    try:
+        print("  Fallback 1: Checking roster page for embedded coaching staff...", file=sys.stderr)
+
+        roster_url = f"{team_url.rstrip('/')}/roster"
+        async with session.host_limit(roster_url):
+            page = await session.new_page()
             try:
-                # Use networkidle to wait for JS rendering (like schedule scraper)
-                page.goto(roster_url, wait_until='networkidle', timeout=60000)
-            except Exception:
-                # Fallback if networkidle times out
-                page.goto(roster_url, wait_until='domcontentloaded', timeout=30000)
-                page.wait_for_timeout(5000)  # Extra time for JS
+                # Navigate to roster page
+                await page.goto(roster_url, wait_until='domcontentloaded', timeout=30000)
+                # Wait for the roster tables to render rather than for networkidle
+                await wait_for_async(page, ROSTER_READY_SELECTOR, timeout=8000)
 
-            html = page.content()
-            browser.close()
+                html = await page.content()
+            finally:
+                await page.close()
+        if page_cache is not None:
+            page_cache[roster_url] = html
 
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = lxml.html.fromstring(html)
 
         # Look for "COACHING STAFF" section
         staff_members = []
 
         # Find the coaching staff heading
-        coaching_heading = soup.find(['h2', 'h3', 'div'], string=lambda text: text and 'coaching staff' in text.lower())
-
-        if coaching_heading:
-            # Find the table after this heading
-            current = coaching_heading.find_next()
-            while current and current.name != 'table':
-                current = current.find_next()
-                if current and 'support staff' in current.get_text().lower():
-                    break  # Stop before support staff section
+        coaching_headings = _COACHING_HEADING_XPATH(tree)
 
-            if current and current.name == 'table':
-                staff_members = extract_staff_from_table(current, sport_name)
+        if coaching_headings:
+            # Find the table after this heading (document order)
+            for current in _ELEMENTS_AFTER_XPATH(coaching_headings[0]):
+                if current.tag == 'table':
+                    staff_members = extract_staff_from_table(current, sport_name)
+                    break
+                if 'support staff' in ''.join(_TEXT_NODES_XPATH(current)).lower():
+                    break  # Stop before support staff section
 
         if staff_members:
             print(f"  Found {len(staff_members)} staff in roster's coaching section", file=sys.stderr)
@@ -376,32 +745,37 @@ def scrape_bio_pages_fallback(team_url, sport_name, school_name):
         school_name (str): School name
 
     Returns:
-        list: Staff members or empty list
+        list: Staff records or empty list
+    """
+    return _run_in_warm_session(_scrape_bio_pages_fallback_async,
+                                team_url, sport_name, school_name)
+
+
+async def _scrape_bio_pages_fallback_async(session, team_url, sport_name, school_name,
+                                           page_cache=None):
+    """
+    Async body of scrape_bio_pages_fallback on a shared BrowserSession.
+
+    The roster from Fallback 1 (in page_cache) is reused only if it already has
+    bio links; otherwise it is reloaded and left to settle.
     """
     try:
-        import subprocess
-
-        print(f"  Fallback 2: Trying bio page scraping from roster...", file=sys.stderr)
-
-        # Call bio page scraper - pass team_url and it will auto-discover roster
-        result = subprocess.run(
-            [
-                'python3', 'tools/scrape_coach_bio_pages.py',
-                '--team-url', team_url,
-                '--sport', sport_name,
-                '--school', school_name
-            ],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
+        print("  Fallback 2: Trying bio page scraping from roster...", file=sys.stderr)
+
+        # Run the bio page scraper in-process on our browser - pass team_url
+        # and it will auto-discover the roster. It visits pages one at a time
+        # on a single tab, so it holds one of the host's slots throughout.
+        async with session.host_limit(team_url):
+            data = await asyncio.wait_for(
+                scrape_coach_bios_async(session, team_url, sport_name, school_name, team_url=team_url,
+                                        page_cache=page_cache),
+                timeout=BIO_FALLBACK_TIMEOUT,
+            )
 
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            if data.get('success'):
-                staff = data.get('staff', [])
-                print(f"  Fallback found {len(staff)} staff from bio pages", file=sys.stderr)
-                return staff
+        if data.get('success'):
+            staff = [Staff(**s) for s in data.get('staff', [])]
+            print(f"  Fallback found {len(staff)} staff from bio pages", file=sys.stderr)
+            return staff
 
         return []
 
@@ -410,121 +784,189 @@ def scrape_bio_pages_fallback(team_url, sport_name, school_name):
         return []
 
 
-def enrich_emails_from_bio_pages(staff_list, coaches_url, sport_name):
+def enrich_emails_from_bio_pages(staff_list, coaches_html, coaches_url, sport_name):
     """
     For staff members missing emails, visit their bio pages to find email addresses.
 
     Many Sidearm sites have bio page links like /sports/mens-lacrosse/roster/coaches/name/123
     The bio page often contains the email that's not shown in the table.
+    Bio pages are loaded concurrently (BIO_PAGE_CONCURRENCY tabs in one context).
 
     Args:
-        staff_list (list): Staff members (some may have 'Not Found' emails)
-        coaches_url (str): The coaches page URL
+        staff_list (list): Staff records (some may have 'Not Found' emails)
+        coaches_html (str): Coaches page HTML already loaded by the caller,
+            or None to load coaches_url here
+        coaches_url (str): The coaches page URL (base for relative bio links)
         sport_name (str): Sport name
 
     Returns:
         list: Updated staff list with enriched emails
     """
-    import re
+    return _run_in_warm_session(_enrich_emails_from_bio_pages_async,
+                                staff_list, coaches_html, coaches_url, sport_name)
+
 
+async def _enrich_emails_from_bio_pages_async(session, staff_list, coaches_html, coaches_url, sport_name):
+    """Async body of enrich_emails_from_bio_pages on a shared BrowserSession."""
     # Only enrich if there are staff with missing emails
-    missing = [s for s in staff_list if s.get('email', 'Not Found') == 'Not Found']
-    if not missing:
+    if not any(_email_missing(s) for s in staff_list):
         return staff_list
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
+        if coaches_html is None:
+            async with session.host_limit(coaches_url):
+                page = await session.new_page()
+                try:
+                    # Navigate to coaches page to find bio links
+                    try:
+                        await page.goto(coaches_url, wait_until='domcontentloaded', timeout=30000)
+                        await wait_for_async(page, COACHES_READY_SELECTOR, timeout=3000)
+                    except Exception:
+                        return staff_list
+
+                    coaches_html = await page.content()
+                finally:
+                    await page.close()
+
+        # Pair staff missing emails with their bio pages, preferring the link
+        # captured with each staff row/card over scanning the page's anchors
+        bio_links = None
+        targets = []
+        for staff in staff_list:
+            if not _email_missing(staff):
+                continue
 
-            # Navigate to coaches page to find bio links
-            try:
-                page.goto(coaches_url, wait_until='domcontentloaded', timeout=30000)
-                page.wait_for_timeout(3000)
-            except Exception:
-                browser.close()
-                return staff_list
-
-            html = page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find all bio page links
-            bio_links = {}
-            for link in soup.find_all('a', href=True):
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-                if '/coaches/' in href or '/staff/' in href:
-                    # Map name text to URL
-                    if text:
-                        bio_links[text.strip()] = urljoin(coaches_url, href)
-
-            # Visit bio pages for staff missing emails
-            for staff in staff_list:
-                if staff.get('email', 'Not Found') != 'Not Found':
-                    continue
-
-                name = staff.get('name', '')
-                bio_url = bio_links.get(name)
-
-                # Fuzzy match if exact match fails
-                if not bio_url:
-                    name_lower = name.lower().strip()
-                    for link_text, url in bio_links.items():
-                        if name_lower in link_text.lower() or link_text.lower() in name_lower:
-                            bio_url = url
-                            break
+            bio_href = staff.bio_url
+            if _is_bio_href(bio_href):
+                targets.append((staff, urljoin(coaches_url, bio_href)))
+                continue
 
-                if not bio_url:
-                    continue
+            if bio_links is None:
+                bio_links = _collect_bio_links(coaches_html, coaches_url)
 
-                try:
-                    print(f"  Checking bio page for {name}: {bio_url}", file=sys.stderr)
-                    page.goto(bio_url, wait_until='domcontentloaded', timeout=15000)
-                    page.wait_for_timeout(2000)
-
-                    bio_html = page.content()
-
-                    # Search for email in the bio page HTML
-                    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-                    emails_found = re.findall(email_pattern, bio_html)
-
-                    # Filter out fake/tracking emails
-                    fake_domains = ['sentry.wmt.dev', 'example.com', 'domain.com',
-                                    'email.com', 'sidearmstats.com', 'sidearmtech.com']
-                    valid_emails = [e for e in emails_found
-                                    if not any(fake in e.lower() for fake in fake_domains)]
-
-                    if valid_emails:
-                        # Prefer .edu emails
-                        edu_emails = [e for e in valid_emails if '.edu' in e.lower()]
-                        best_email = edu_emails[0] if edu_emails else valid_emails[0]
-                        staff['email'] = best_email
-                        print(f"    Found email: {best_email}", file=sys.stderr)
-
-                    # Also check for phone if missing
-                    if staff.get('phone', 'Not Found') == 'Not Found':
-                        bio_text = BeautifulSoup(bio_html, 'html.parser').get_text()
-                        phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', bio_text)
-                        if phone_match:
-                            staff['phone'] = phone_match.group()
-
-                except Exception as e:
-                    print(f"    Bio page error: {e}", file=sys.stderr)
-                    continue
-
-            browser.close()
+            name = staff.name
+            bio_url = bio_links.get(name)
+
+            # Fuzzy match if exact match fails
+            if not bio_url:
+                name_lower = name.lower().strip()
+                for link_text, url in bio_links.items():
+                    if name_lower in link_text.lower() or link_text.lower() in name_lower:
+                        bio_url = url
+                        break
 
+            if bio_url:
+                targets.append((staff, bio_url))
+
+        # Load every bio page at once (bounded), then apply results in staff order
+        sem = asyncio.Semaphore(BIO_PAGE_CONCURRENCY)
+        bio_pages = await asyncio.gather(
+            *[_fetch_bio_page(session, sem, staff.name, bio_url)
+              for staff, bio_url in targets]
+        )
+        for (staff, _), bio_html in zip(targets, bio_pages):
+            if bio_html is not None:
+                _apply_bio_page(staff, bio_html)
     except Exception as e:
         print(f"  Bio enrichment failed: {e}", file=sys.stderr)
 
     return staff_list
 
 
+def _is_bio_href(href):
+    """True if an href looks like a coach/staff bio page link."""
+    return '/coaches/' in href or '/staff/' in href
+
+
+def _collect_bio_links(coaches_html, coaches_url):
+    """
+    Map link text to absolute URL for every bio page link on the coaches page.
+
+    Args:
+        coaches_html (str): Coaches page HTML
+        coaches_url (str): Coaches page URL (base for relative links)
+
+    Returns:
+        dict: {link text: bio page URL}
+    """
+    # Only <a href> elements (and their text) are built into the tree
+    soup = BeautifulSoup(coaches_html, 'lxml', parse_only=_LINKS_ONLY)
+
+    # Find all bio page links
+    bio_links = {}
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '')
+        text = link.get_text(strip=True)
+        if _is_bio_href(href):
+            # Map name text to URL
+            if text:
+                bio_links[text.strip()] = urljoin(coaches_url, href)
+    return bio_links
+
+
+async def _fetch_bio_page(session, sem, name, bio_url):
+    """
+    Load one bio page in its own tab.
+
+    Args:
+        session (BrowserSession): Shared browser session
+        sem (asyncio.Semaphore): Limits concurrently open bio pages for the
+            team (the host-wide limit applies on top)
+        name (str): Staff member name (for logging)
+        bio_url (str): Bio page URL
+
+    Returns:
+        str or None: Page HTML, or None if loading failed
+    """
+    async with sem, session.host_limit(bio_url):
+        page = await session.new_page()
+        try:
+            print(f"  Checking bio page for {name}: {bio_url}", file=sys.stderr)
+            await page.goto(bio_url, wait_until='domcontentloaded', timeout=15000)
+            # Return as soon as the page has content instead of a fixed delay
+            try:
+                await page.wait_for_selector('a[href^="mailto:"], body', state='attached',
+                                             timeout=5000)
+            except PlaywrightTimeout:
+                pass
+            return await page.content()
+        except Exception as e:
+            print(f"    Bio page error: {e}", file=sys.stderr)
+            return None
+        finally:
+            await page.close()
+
+
+def _apply_bio_page(staff, bio_html):
+    """Fill a staff member's missing email (and phone) from their bio page HTML."""
+    # Search for email in the bio page HTML (a plain '@' check skips the
+    # regex on pages that can't contain one)
+    emails_found = _EMAIL_RE.findall(bio_html) if '@' in bio_html else []
+
+    # Filter out fake/tracking emails, noting .edu ones in the same pass
+    valid_emails = []
+    edu_emails = []
+    for e in emails_found:
+        if _FAKE_DOMAIN_RE.search(e):
+            continue
+        valid_emails.append(e)
+        if '.edu' in e.lower():
+            edu_emails.append(e)
+
+    if valid_emails:
+        # Prefer .edu emails
+        best_email = edu_emails[0] if edu_emails else valid_emails[0]
+        staff.email = best_email
+        print(f"    Found email: {best_email}", file=sys.stderr)
+
+    # Also check for phone if missing
+    if staff.phone == 'Not Found':
+        bio_text = BeautifulSoup(bio_html, 'lxml').get_text()
+        phone_match = _PHONE_RE.search(bio_text)
+        if phone_match:
+            staff.phone = phone_match.group()
+
+
 def enrich_emails_from_staff_directory(staff_list, team_url, sport_name):
     """
     For staff members still missing emails after bio page enrichment,
@@ -534,169 +976,282 @@ def enrich_emails_from_staff_directory(staff_list, team_url, sport_name):
     with emails, even when the team coaches page doesn't show them.
 
     Args:
-        staff_list (list): Staff members (some may have 'Not Found' emails)
+        staff_list (list): Staff records (some may have 'Not Found' emails)
         team_url (str): The team page URL (used to derive base athletics URL)
         sport_name (str): Sport name
 
     Returns:
         list: Updated staff list with enriched emails
     """
-    import re
+    return _run_in_warm_session(_enrich_emails_from_staff_directory_async,
+                                staff_list, team_url, sport_name)
 
-    missing = [s for s in staff_list if s.get('email', 'Not Found') == 'Not Found']
-    if not missing:
+
+async def _enrich_emails_from_staff_directory_async(session, staff_list, team_url, sport_name):
+    """Async body of enrich_emails_from_staff_directory on a shared BrowserSession."""
+    if not any(_email_missing(s) for s in staff_list):
         return staff_list
 
+    directory_entries = await _load_directory_entries(session, team_url)
+    _apply_directory_entries(staff_list, directory_entries)
+    return staff_list
+
+
+async def _load_directory_entries(session, team_url):
+    """
+    Load and parse the school's general staff directory.
+
+    Every team of a school shares one directory, so it is loaded once per
+    browser session and the entries are reused for the school's other teams.
+
+    Args:
+        session (BrowserSession): Shared browser session
+        team_url (str): The team page URL (used to derive base athletics URL)
+
+    Returns:
+        list: {'name', 'email'} dicts (empty if no directory was found)
+    """
     # Derive base athletics URL from team URL
     parsed = urlparse(team_url)
     base_url = f"{parsed.scheme}://{parsed.netloc}"
+    return await session.shared_load(('staff-directory', base_url),
+                                     _fetch_directory_entries, base_url)
 
-    # Common staff directory URL patterns
+
+async def _fetch_directory_entries(session, base_url):
+    """Load and parse the staff directory at base_url (see _load_directory_entries)."""
+    # Common staff directory URL patterns, minus any the server says don't exist
     directory_urls = [
         f"{base_url}/staff-directory",
         f"{base_url}/staff",
         f"{base_url}/directory",
     ]
+    exists = await asyncio.gather(*[asyncio.to_thread(_url_may_exist, url) for url in directory_urls])
+    directory_urls = [url for url, ok in zip(directory_urls, exists) if ok]
+    if not directory_urls:
+        print("  No staff directory page found", file=sys.stderr)
+        return []
 
+    directory_entries = []
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
-
-            directory_entries = []
-
-            for dir_url in directory_urls:
-                try:
-                    page.goto(dir_url, wait_until='networkidle', timeout=30000)
-                except Exception:
+        async with session.host_limit(base_url):
+            page = await session.new_page()
+            try:
+                for dir_url in directory_urls:
                     try:
-                        page.goto(dir_url, wait_until='domcontentloaded', timeout=15000)
-                        page.wait_for_timeout(3000)
+                        await page.goto(dir_url, wait_until='domcontentloaded', timeout=15000)
                     except Exception:
                         continue
+                    await wait_for_async(page, DIRECTORY_READY_SELECTOR, timeout=8000)
 
-                html = page.content()
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Strategy 1: Sidearm .s-person-card format
-                sidearm_cards = soup.select('.s-person-card')
-                if sidearm_cards:
-                    for card in sidearm_cards:
-                        card_text = card.get_text(separator='|', strip=True)
-                        parts = [pt.strip() for pt in card_text.split('|')]
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            email = 'Not Found'
-                            for part in parts[2:]:
-                                if '@' in part and '.' in part:
-                                    email = part
-                                    break
-                            if email != 'Not Found':
-                                directory_entries.append({'name': name, 'email': email})
+                    directory_entries = _parse_directory_entries(await page.content())
                     if directory_entries:
                         break
+            finally:
+                await page.close()
+    except Exception as e:
+        print(f"  Staff directory enrichment failed: {e}", file=sys.stderr)
+        return []
 
-                # Strategy 2: Table-based directory
-                tables = soup.find_all('table')
-                for table in tables:
-                    headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
-                    name_col = None
-                    email_col = None
-                    for i, h in enumerate(headers):
-                        if 'name' in h:
-                            name_col = i
-                        elif 'email' in h or 'e-mail' in h:
-                            email_col = i
-                    if name_col is not None and email_col is not None:
-                        for row in table.find_all('tr')[1:]:
-                            cells = row.find_all(['td', 'th'])
-                            if len(cells) > max(name_col, email_col):
-                                name = cells[name_col].get_text(strip=True)
-                                # Check for mailto link first
-                                email_link = cells[email_col].find('a', href=lambda h: h and 'mailto:' in h)
-                                if email_link:
-                                    email = email_link['href'].replace('mailto:', '').strip()
-                                else:
-                                    cell_text = cells[email_col].get_text(strip=True)
-                                    email_match = re.search(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', cell_text)
-                                    email = email_match.group() if email_match else None
-                                if name and email:
-                                    directory_entries.append({'name': name, 'email': email})
-                if directory_entries:
-                    break
+    if not directory_entries:
+        print("  No staff directory entries found", file=sys.stderr)
+    return directory_entries
 
-                # Strategy 3: Any mailto links paired with nearby text
-                if not directory_entries:
-                    mailto_links = soup.select('a[href^="mailto:"]')
-                    for link in mailto_links:
-                        email = link['href'].replace('mailto:', '').strip()
-                        # Look for name in parent or sibling elements
-                        parent = link.find_parent(['div', 'li', 'tr', 'td', 'p'])
-                        if parent:
-                            parent_text = parent.get_text(strip=True)
-                            # Remove the email from text to get the name
-                            name_text = parent_text.replace(email, '').replace(link.get_text(strip=True), '').strip(' ,-|')
-                            if name_text and len(name_text) > 3:
-                                directory_entries.append({'name': name_text, 'email': email})
-                    if directory_entries:
-                        break
 
-            browser.close()
+def _apply_directory_entries(staff_list, directory_entries):
+    """
+    Fill missing emails in staff_list (in place) from matching directory entries.
 
-            if not directory_entries:
-                print(f"  No staff directory entries found", file=sys.stderr)
-                return staff_list
+    Args:
+        staff_list (list): Staff records (some may have 'Not Found' emails)
+        directory_entries (list): {'name', 'email'} dicts from _load_directory_entries
+    """
+    if not directory_entries:
+        return
 
-            print(f"  Found {len(directory_entries)} directory entries, matching names...", file=sys.stderr)
+    print(f"  Found {len(directory_entries)} directory entries, matching names...", file=sys.stderr)
 
-            # Match missing-email staff to directory entries
-            matched = 0
-            for staff in staff_list:
-                if staff.get('email', 'Not Found') != 'Not Found':
-                    continue
+    # Match missing-email staff to directory entries
+    directory_index = _index_directory_entries(directory_entries)
+    matched = 0
+    for staff in staff_list:
+        if not _email_missing(staff):
+            continue
 
-                name = staff.get('name', '').strip()
-                name_lower = name.lower()
-                # Strip year suffixes like "'13", "'19"
-                name_clean = re.sub(r"\s*'\d{2}$", '', name_lower).strip()
+        name = staff.name.strip()
+        name_lower = name.lower()
+        # Strip year suffixes like "'13", "'19"
+        name_clean = _YEAR_SUFFIX_RE.sub('', name_lower).strip()
 
-                best_match = None
-                for entry in directory_entries:
-                    entry_name = entry['name'].strip().lower()
-                    entry_clean = re.sub(r"\s*'\d{2}$", '', entry_name).strip()
+        best_match = _match_directory_entry(name_clean, directory_entries, directory_index)
 
-                    # Exact match
-                    if name_clean == entry_clean:
-                        best_match = entry
-                        break
-                    # Substring containment (handles "John Smith" matching "John A. Smith")
-                    if name_clean in entry_clean or entry_clean in name_clean:
-                        best_match = entry
-                        break
-                    # Last name + first initial match
-                    name_parts = name_clean.split()
-                    entry_parts = entry_clean.split()
-                    if len(name_parts) >= 2 and len(entry_parts) >= 2:
-                        if name_parts[-1] == entry_parts[-1] and name_parts[0][0] == entry_parts[0][0]:
-                            best_match = entry
-                            break
+        if best_match:
+            staff.email = best_match['email']
+            matched += 1
+            print(f"    Directory match: {name} → {best_match['email']}", file=sys.stderr)
 
-                if best_match:
-                    staff['email'] = best_match['email']
-                    matched += 1
-                    print(f"    Directory match: {name} → {best_match['email']}", file=sys.stderr)
+    print(f"  Matched {matched} emails from staff directory", file=sys.stderr)
 
-            print(f"  Matched {matched} emails from staff directory", file=sys.stderr)
 
-    except Exception as e:
-        print(f"  Staff directory enrichment failed: {e}", file=sys.stderr)
+def _index_directory_entries(directory_entries):
+    """
+    Clean directory names once and index them for _match_directory_entry.
 
-    return staff_list
+    Args:
+        directory_entries (list): {'name', 'email'} dicts in page order
+
+    Returns:
+        tuple: (cleaned names, {clean name: first index},
+                {(last name, first initial): first index})
+    """
+    cleaned = []
+    by_clean = {}
+    by_last_initial = {}
+    for i, entry in enumerate(directory_entries):
+        entry_clean = _YEAR_SUFFIX_RE.sub('', entry['name'].strip().lower()).strip()
+        cleaned.append(entry_clean)
+        by_clean.setdefault(entry_clean, i)
+        entry_parts = entry_clean.split()
+        if len(entry_parts) >= 2:
+            by_last_initial.setdefault((entry_parts[-1], entry_parts[0][0]), i)
+    return cleaned, by_clean, by_last_initial
+
+
+def _match_directory_entry(name_clean, directory_entries, directory_index):
+    """
+    First directory entry (in page order) matching a cleaned staff name.
+
+    An entry matches on an exact name, substring containment either way
+    (handles "John Smith" vs "John A. Smith"), or last name + first initial.
+    The exact and last-name/initial matches are dict lookups; only entries
+    ahead of the earliest indexed hit are scanned for containment.
+
+    Args:
+        name_clean (str): Lowercased staff name without year suffix
+        directory_entries (list): {'name', 'email'} dicts in page order
+        directory_index (tuple): Result of _index_directory_entries
+
+    Returns:
+        dict: Matching directory entry or None
+    """
+    cleaned, by_clean, by_last_initial = directory_index
+
+    hits = []
+    if name_clean in by_clean:
+        hits.append(by_clean[name_clean])
+    name_parts = name_clean.split()
+    if len(name_parts) >= 2:
+        key = (name_parts[-1], name_parts[0][0])
+        if key in by_last_initial:
+            hits.append(by_last_initial[key])
+    first_hit = min(hits) if hits else len(cleaned)
+
+    for i in range(first_hit):
+        entry_clean = cleaned[i]
+        if name_clean in entry_clean or entry_clean in name_clean:
+            return directory_entries[i]
+
+    return directory_entries[first_hit] if hits else None
+
+
+def _url_may_exist(url):
+    """
+    Cheap HEAD probe so missing directory pages are skipped without a browser load.
+
+    Only a definite 404/410 rules a URL out; network errors and servers that
+    reject HEAD keep it as a candidate.
+
+    Args:
+        url (str): Candidate page URL
+
+    Returns:
+        bool: False if the page is known not to exist
+    """
+    try:
+        response = _http_session().head(url, allow_redirects=True, timeout=5)
+    except requests.RequestException:
+        return True
+    return response.status_code not in (404, 410)
+
+
+def _parse_directory_entries(html):
+    """
+    Collect (name, email) entries from a rendered staff directory page.
+
+    Tries Sidearm person cards, then name/email tables, then any mailto
+    link paired with its surrounding text; the first strategy that finds
+    entries wins.
+
+    Args:
+        html (str): Rendered directory page HTML
+
+    Returns:
+        list: {'name', 'email'} dicts (empty if none found)
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    directory_entries = []
+
+    # Strategy 1: Sidearm .s-person-card format
+    sidearm_cards = soup.select('.s-person-card')
+    if sidearm_cards:
+        for card in sidearm_cards:
+            card_text = card.get_text(separator='|', strip=True)
+            parts = [pt.strip() for pt in card_text.split('|')]
+            if len(parts) >= 2:
+                name = parts[0]
+                email = 'Not Found'
+                for part in parts[2:]:
+                    if '@' in part and '.' in part:
+                        email = part
+                        break
+                if email != 'Not Found':
+                    directory_entries.append({'name': name, 'email': email})
+        if directory_entries:
+            return directory_entries
+
+    # Strategy 2: Table-based directory
+    tables = soup.find_all('table')
+    for table in tables:
+        headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
+        name_col = None
+        email_col = None
+        for i, h in enumerate(headers):
+            if 'name' in h:
+                name_col = i
+            elif 'email' in h or 'e-mail' in h:
+                email_col = i
+        if name_col is not None and email_col is not None:
+            for row in table.find_all('tr')[1:]:
+                cells = row.find_all(['td', 'th'])
+                if len(cells) > max(name_col, email_col):
+                    name = cells[name_col].get_text(strip=True)
+                    # Check for mailto link first
+                    email_link = cells[email_col].find('a', href=lambda h: h and 'mailto:' in h)
+                    if email_link:
+                        email = email_link['href'].replace('mailto:', '').strip()
+                    else:
+                        cell_text = cells[email_col].get_text(strip=True)
+                        email_match = _EMAIL_RE.search(cell_text)
+                        email = email_match.group() if email_match else None
+                    if name and email:
+                        directory_entries.append({'name': name, 'email': email})
+    if directory_entries:
+        return directory_entries
+
+    # Strategy 3: Any mailto links paired with nearby text
+    mailto_links = soup.select('a[href^="mailto:"]')
+    for link in mailto_links:
+        email = link['href'].replace('mailto:', '').strip()
+        # Look for name in parent or sibling elements
+        parent = link.find_parent(['div', 'li', 'tr', 'td', 'p'])
+        if parent:
+            parent_text = parent.get_text(strip=True)
+            # Remove the email from text to get the name
+            name_text = parent_text.replace(email, '').replace(link.get_text(strip=True), '').strip(' ,-|')
+            if name_text and len(name_text) > 3:
+                directory_entries.append({'name': name_text, 'email': email})
+
+    return directory_entries
 
 
 def scrape_team_staff(team_url, sport_name, school_name):
@@ -707,6 +1262,9 @@ def scrape_team_staff(team_url, sport_name, school_name):
     1. Table-based scraping from /coaches page (fast, works for most schools)
     2. Bio page scraping from /roster page (fallback for Georgia Tech-style sites)
 
+    The coaches page, enrichment passes and roster fallback all run in one
+    browser context, on a Chromium kept warm across calls in this process.
+
     Args:
         team_url (str): Team page URL
         sport_name (str): Sport name (e.g., "Baseball")
@@ -716,143 +1274,333 @@ def scrape_team_staff(team_url, sport_name, school_name):
         dict: Result with staff list and metadata
     """
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                           "AppleWebKit/537.36 (KHTML, like Gecko) "
-                           "Chrome/120.0.0.0 Safari/537.36"
-            )
-            page = context.new_page()
+        return _run_in_warm_session(_scrape_team_staff_in_session, team_url, sport_name, school_name)
+    except Exception as e:
+        return _team_staff_error(school_name, sport_name, e)
 
-            # Find coaches page URL
-            coaches_url = find_coaches_page_url(page, team_url)
-            print(f"Navigating to coaches page: {coaches_url}", file=sys.stderr)
 
-            # Navigate to coaches page (use networkidle for JS rendering)
-            try:
-                page.goto(coaches_url, wait_until='networkidle', timeout=60000)
-                print("Page loaded (networkidle)", file=sys.stderr)
-            except Exception as e:
-                print(f"networkidle timeout, falling back: {e}", file=sys.stderr)
-                try:
-                    page.goto(coaches_url, wait_until='domcontentloaded', timeout=30000)
-                    page.wait_for_timeout(5000)
-                    print("Page loaded (domcontentloaded + wait)", file=sys.stderr)
-                except Exception as e2:
-                    print(f"Error loading page: {e2}", file=sys.stderr)
-                    page.goto(coaches_url, wait_until='commit', timeout=30000)
-                    page.wait_for_timeout(5000)
-
-            # Get page content
-            html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
-
-            # Close browser
-            browser.close()
-
-        # Extract staff from tables
-        staff_members = []
-        tables = soup.find_all('table')
+async def scrape_many(teams, max_concurrency=4, batch_dir=None):
+    """
+    Scrape coaching staff for several teams in one browser session.
 
+    Chromium starts once for the whole batch instead of once per team; each
+    team gets its own context on it, and up to max_concurrency teams are
+    scraped at a time.
+
+    Args:
+        teams (list): Dicts with 'team_url', 'sport' and 'school' keys
+        max_concurrency (int): Teams scraped at once
+        batch_dir (str): Optional directory; each team's result is written
+            there as <school>_<sport>_<hash>.json as soon as that team finishes
+            (hash of team_url, so men's and women's teams don't collide)
+
+    Returns:
+        list: One scrape_team_staff result dict per team, in input order
+    """
+    if batch_dir:
+        os.makedirs(batch_dir, exist_ok=True)
+    sem = asyncio.Semaphore(max_concurrency)
+    async with BrowserSession() as session:
+        return await asyncio.gather(*[_scrape_one(session, sem, team, batch_dir) for team in teams])
+
+
+async def _scrape_one(session, sem, team, batch_dir=None):
+    """One scrape_many team in its own context on the shared browser."""
+    async with sem:
+        print(f"Scraping {team['school']} {team['sport']}: {team['team_url']}", file=sys.stderr)
+        try:
+            async with session.child() as team_session:
+                result = await _scrape_team_staff_in_session(team_session, team['team_url'],
+                                                             team['sport'], team['school'])
+        except Exception as e:
+            result = _team_staff_error(team['school'], team['sport'], e)
+    if batch_dir:
+        # Written off the event loop so the other teams keep scraping
+        await asyncio.to_thread(_write_batch_result, batch_dir, team['team_url'], result)
+    return result
+
+
+def _write_batch_result(batch_dir, team_url, result):
+    """
+    Write one team's result to batch_dir/<school>_<sport>_<hash>.json.
+
+    A write failure is logged rather than raised, so it never aborts the
+    other teams still scraping.
+
+    Args:
+        batch_dir (str): --batch-output directory
+        team_url (str): Team page URL (its hash keeps file names unique)
+        result (dict): Team result
+    """
+    slug = _SLUG_RE.sub('_', f"{result['school']}_{result['sport']}".lower()).strip('_')
+    url_hash = hashlib.sha1(team_url.encode('utf-8')).hexdigest()[:8]
+    path = os.path.join(batch_dir, f"{slug}_{url_hash}.json")
+    try:
+        with open(path, 'wb') as f:
+            f.write(dump_json(result))
+    except OSError as e:
+        print(f"Could not write {path}: {e}", file=sys.stderr)
+
+
+def _team_staff_error(school_name, sport_name, error):
+    """Failure result for a team scrape (timeouts reported separately)."""
+    if isinstance(error, PlaywrightTimeout):
+        message = "Timeout loading coaches page"
+    else:
+        message = f"Error scraping team staff: {str(error)}"
+    return {
+        "school": school_name,
+        "sport": sport_name,
+        "error": message,
+        "success": False,
+    }
+
+
+def _is_staff_table(table):
+    """
+    Whether an lxml table looks like a coaching staff table.
+
+    Tables without rows never qualify.
+
+    Args:
+        table: lxml table element
+
+    Returns:
+        bool: True for a staff table
+    """
+    first_row = _FIRST_ROW_XPATH(table)
+    if not first_row:
+        return False
+    first_row = first_row[0]
+
+    # Strategy 1: Header text contains staff-related keywords
+    headers_text = _cell_text(first_row).lower()
+    if any(keyword in headers_text for keyword in ['name', 'title', 'email', 'coach', 'e-mail']):
+        return True
+
+    # Strategy 2: Check th/td id attributes (Sidearm empty headers)
+    header_ids = ' '.join((th.get('id') or '') for th in _ROW_CELLS_XPATH(first_row)).lower()
+    if any(kw in header_ids for kw in ['fullname', 'staff_title', 'staff_email', 'coaches']):
+        return True
+
+    # Strategy 3: Check for sidearm-table class
+    if 'sidearm-table' in (table.get('class') or ''):
+        return True
+
+    # Strategy 4: Caption text
+    caption = _FIRST_CAPTION_XPATH(table)
+    return bool(caption) and 'staff' in _cell_text(caption[0]).lower()
+
+
+def _fetch_static_coaches_page(coaches_url):
+    """
+    Fetch the coaches page over plain HTTP (no browser, no scripts).
+
+    Args:
+        coaches_url (str): Coaches page URL
+
+    Returns:
+        str or None: Response HTML, or None on any network/HTTP error, when
+            the staff markup isn't in the server-rendered page, or when its
+            emails are obfuscated for the browser to decode
+    """
+    try:
+        response = _http_session().get(coaches_url, timeout=15)
+    except requests.RequestException as e:
+        print(f"Static fetch failed for {coaches_url}: {str(e)}", file=sys.stderr)
+        return None
+    if response.status_code != 200:
+        return None
+    html = response.text
+    if not _STATIC_COACHES_MARKER_RE.search(html) or EMAIL_PROTECTION_PATH in html:
+        return None
+    return html
+
+
+def _static_emails_usable(staff_members):
+    """
+    Whether staff parsed from the server-rendered page can skip the browser.
+
+    Every email found must be a real address, and at least one must be
+    found; otherwise the rendered page may carry the addresses (scripts
+    that decode or inject them), so it is loaded instead.
+
+    Args:
+        staff_members (list): Staff records from the static page
+
+    Returns:
+        bool: True if the static result stands
+    """
+    emails = [s.email for s in staff_members if not _email_missing(s)]
+    return bool(emails) and all(_EMAIL_FULL_RE.match(email) for email in emails)
+
+
+def _extract_coaches_page_staff(html_content, sport_name):
+    """
+    Staff from a coaches page: staff tables first, then PrestoSports cards.
+
+    Args:
+        html_content (str): Coaches page HTML
+        sport_name (str): Sport name from URL
+
+    Returns:
+        list: Staff records (may contain duplicate names)
+    """
+    # One lxml parse serves table detection, table extraction and the card
+    # fallback; every per-table signal is a precompiled XPath
+    try:
+        tree = lxml.html.fromstring(html_content)
+    except etree.ParserError:
+        tree = None
+
+    # Extract staff from tables
+    staff_members = []
+    tables = _TABLES_XPATH(tree) if tree is not None else []
+
+    if VERBOSE:
         print(f"Found {len(tables)} tables", file=sys.stderr)
 
-        for table in tables:
-            # Check if it's a staff table - multiple detection strategies
-            first_row = table.find('tr')
-            is_staff_table = False
-            if first_row:
-                headers_text = first_row.get_text(strip=True).lower()
-                # Strategy 1: Header text contains staff-related keywords
-                if any(keyword in headers_text for keyword in ['name', 'title', 'email', 'coach', 'e-mail']):
-                    is_staff_table = True
-                # Strategy 2: Check th/td id attributes (Sidearm empty headers)
-                if not is_staff_table:
-                    header_ids = ' '.join((th.get('id') or '') for th in first_row.find_all(['th', 'td']))
-                    if any(kw in header_ids.lower() for kw in ['fullname', 'staff_title', 'staff_email', 'coaches']):
-                        is_staff_table = True
-                # Strategy 3: Check for sidearm-table class
-                if not is_staff_table:
-                    table_classes = ' '.join(table.get('class', []))
-                    if 'sidearm-table' in table_classes:
-                        is_staff_table = True
-                # Strategy 4: Caption text
-                if not is_staff_table:
-                    caption = table.find('caption')
-                    if caption and 'staff' in caption.get_text(strip=True).lower():
-                        is_staff_table = True
-
-            if is_staff_table:
-                table_staff = extract_staff_from_table(table, sport_name)
-                staff_members.extend(table_staff)
+    for table in tables:
+        if _is_staff_table(table):
+            table_staff = extract_staff_from_table(table, sport_name)
+            staff_members.extend(table_staff)
+            if VERBOSE:
                 print(f"Extracted {len(table_staff)} staff from table", file=sys.stderr)
 
-        # If no staff found from tables, try PrestoSports card-based layout
-        if len(staff_members) == 0:
-            print("No staff in tables, trying PrestoSports card layout...", file=sys.stderr)
-            card_staff = extract_staff_from_presto_cards(soup, sport_name)
-            if card_staff:
-                print(f"Found {len(card_staff)} staff from PrestoSports cards", file=sys.stderr)
-                staff_members.extend(card_staff)
+    # If no staff found from tables, try PrestoSports card-based layout
+    if len(staff_members) == 0:
+        print("No staff in tables, trying PrestoSports card layout...", file=sys.stderr)
+        card_staff = extract_staff_from_presto_cards(tree if tree is not None else html_content,
+                                                     sport_name)
+        if card_staff:
+            print(f"Found {len(card_staff)} staff from PrestoSports cards", file=sys.stderr)
+            staff_members.extend(card_staff)
 
-        # Remove duplicates
-        unique_staff = {}
-        for staff in staff_members:
-            if staff['name'] not in unique_staff:
-                unique_staff[staff['name']] = staff
+    return staff_members
 
-        staff_list = list(unique_staff.values())
 
-        # ENRICHMENT: If we have staff but many lack emails, try bio page links
-        missing_emails = sum(1 for s in staff_list if s.get('email', 'Not Found') == 'Not Found')
-        if staff_list and missing_emails > 0:
-            print(f"{missing_emails}/{len(staff_list)} staff missing emails, checking bio pages...", file=sys.stderr)
-            staff_list = enrich_emails_from_bio_pages(staff_list, coaches_url, sport_name)
+async def _scrape_team_staff_in_session(session, team_url, sport_name, school_name):
+    """Scrape one team's staff on an open BrowserSession (see scrape_team_staff)."""
+    # Find coaches page URL
+    coaches_url = _coaches_url(team_url)
+
+    # Server-rendered coaches pages need no browser at all
+    html_content = await asyncio.to_thread(_fetch_static_coaches_page, coaches_url)
+    staff_members = []
+    # Static result kept in case the rendered page yields nothing better
+    static_html, static_staff = None, []
+    if html_content is not None:
+        print(f"Parsing server-rendered coaches page: {coaches_url}", file=sys.stderr)
+        staff_members = _extract_coaches_page_staff(html_content, sport_name)
+        if staff_members and not _static_emails_usable(staff_members):
+            print("Server-rendered emails missing or invalid, loading the page in the browser",
+                  file=sys.stderr)
+            static_html, static_staff = html_content, staff_members
+            staff_members = []
+
+    if not staff_members:
+        async with session.host_limit(coaches_url):
+            page = await session.new_page()
+            try:
+                print(f"Navigating to coaches page: {coaches_url}", file=sys.stderr)
+
+                # Navigate to coaches page once, then wait for the staff markup
+                # (networkidle stalls on trackers/long-polls). A slow page is
+                # parsed as far as it got rather than navigated to again.
+                try:
+                    await page.goto(coaches_url, wait_until='domcontentloaded', timeout=20000)
+                    print("Page loaded (domcontentloaded)", file=sys.stderr)
+                except PlaywrightTimeout as e:
+                    print(f"Error loading page: {e}", file=sys.stderr)
+                await wait_for_async(page, COACHES_READY_SELECTOR, timeout=10000)
+
+                # Only copy the DOM out of the browser when it has tables or cards
+                # to extract; otherwise the fallbacks below take over anyway
+                if await page.locator(COACHES_READY_SELECTOR).count():
+                    html_content = await page.content()
+                else:
+                    print("No tables or cards on coaches page", file=sys.stderr)
+                    html_content = None
+            finally:
+                await page.close()
+
+        if html_content is not None:
+            staff_members = _extract_coaches_page_staff(html_content, sport_name)
+        if not staff_members and static_staff:
+            html_content, staff_members = static_html, static_staff
+
+    # Remove duplicates (one record per name, ignoring case and outer whitespace).
+    # The first record is kept unless a later duplicate has the email it lacks,
+    # which then takes its place - enrichment needn't look that email up again.
+    # Zero or one record can't hold a duplicate.
+    if len(staff_members) < 2:
+        staff_list = staff_members
+    else:
+        positions = {}
+        staff_list = []
+        for staff in staff_members:
+            name_key = staff.name.strip().lower()
+            i = positions.get(name_key)
+            if i is None:
+                positions[name_key] = len(staff_list)
+                staff_list.append(staff)
+            elif _email_missing(staff_list[i]) and not _email_missing(staff):
+                staff_list[i] = staff
+
+    # ENRICHMENT: If we have staff but many lack emails, try bio page links and
+    # the school staff directory. Both load concurrently; directory matches
+    # (ENRICHMENT 2) only fill emails the bio pages didn't find.
+    if any(_email_missing(s) for s in staff_list):
+        missing_emails = sum(map(_email_missing, staff_list))
+        print(f"{missing_emails}/{len(staff_list)} staff missing emails, checking bio pages "
+              f"and staff directory...", file=sys.stderr)
+        staff_list, directory_entries = await asyncio.gather(
+            _enrich_emails_from_bio_pages_async(session, staff_list, html_content,
+                                                coaches_url, sport_name),
+            _load_directory_entries(session, team_url),
+        )
 
-        # ENRICHMENT 2: If still missing emails, check school staff directory
-        still_missing = sum(1 for s in staff_list if s.get('email', 'Not Found') == 'Not Found')
-        if staff_list and still_missing > 0:
+        if any(_email_missing(s) for s in staff_list):
+            still_missing = sum(map(_email_missing, staff_list))
             print(f"  Still {still_missing} staff missing emails, checking staff directory...", file=sys.stderr)
-            staff_list = enrich_emails_from_staff_directory(staff_list, team_url, sport_name)
-
-        # FALLBACK 1: If no staff found via tables, check roster page for embedded coaching section
-        if len(staff_list) == 0:
-            print("No staff found in tables, checking roster page...", file=sys.stderr)
-            roster_staff = scrape_roster_embedded_staff(team_url, sport_name, school_name)
-            staff_list.extend(roster_staff)
-
-        # FALLBACK 2: If still no staff, try bio page scraping
-        if len(staff_list) == 0:
-            print("No staff found in roster, trying bio page fallback...", file=sys.stderr)
-            bio_staff = scrape_bio_pages_fallback(team_url, sport_name, school_name)
-            staff_list.extend(bio_staff)
-
-        result = {
-            "school": school_name,
-            "sport": sport_name,
-            "coaches_url": coaches_url,
-            "staff_found": len(staff_list),
-            "staff": staff_list,
-            "success": True,
-            "timestamp": str(datetime.now()),
-        }
-
-        return result
-
-    except PlaywrightTimeout:
-        return {
-            "school": school_name,
-            "sport": sport_name,
-            "error": "Timeout loading coaches page",
-            "success": False,
-        }
-    except Exception as e:
-        return {
-            "school": school_name,
-            "sport": sport_name,
-            "error": f"Error scraping team staff: {str(e)}",
-            "success": False,
-        }
+            _apply_directory_entries(staff_list, directory_entries)
+
+    # Pages one fallback loads that a later one would otherwise load again
+    # ({url without trailing slash: HTML}; Fallback 1's roster for Fallback 2)
+    page_cache = {}
+
+    # FALLBACK 1: If no staff found via tables, check roster page for embedded coaching section
+    if len(staff_list) == 0:
+        print("No staff found in tables, checking roster page...", file=sys.stderr)
+        roster_staff = await _scrape_roster_embedded_staff_async(session, team_url, sport_name, school_name,
+                                                                 page_cache=page_cache)
+        staff_list.extend(roster_staff)
+
+    # FALLBACK 2: If still no staff, try bio page scraping
+    if len(staff_list) == 0:
+        print("No staff found in roster, trying bio page fallback...", file=sys.stderr)
+        bio_staff = await _scrape_bio_pages_fallback_async(session, team_url, sport_name, school_name,
+                                                           page_cache=page_cache)
+        staff_list.extend(bio_staff)
+
+    result = {
+        "school": school_name,
+        "sport": sport_name,
+        "coaches_url": coaches_url,
+        "staff_found": len(staff_list),
+        "staff": [asdict(staff) for staff in staff_list],
+        "success": True,
+        "timestamp": str(datetime.now()),
+    }
+
+    return result
+
+
+def _write_stdout(payload):
+    """Write encoded JSON plus a newline to stdout (as print() did)."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload + b'\n')
+    sys.stdout.flush()
 
 
 def main():
@@ -861,33 +1609,77 @@ def main():
     )
     parser.add_argument(
         "--team-url",
-        required=True,
         help="Team page URL (e.g., https://bceagles.com/sports/baseball)"
     )
     parser.add_argument(
         "--sport",
-        required=True,
         help="Sport name (e.g., 'Baseball')"
     )
     parser.add_argument(
         "--school",
-        required=True,
         help="School name (e.g., 'Boston College')"
     )
+    parser.add_argument(
+        "--teams-file",
+        help="JSON list of {team_url, sport, school} objects to scrape in one browser "
+             "(replaces --team-url/--sport/--school; outputs a JSON array)"
+    )
+    parser.add_argument(
+        "--batch-output",
+        help="With --teams-file, also write each team's result to this directory "
+             "as soon as it finishes (<school>_<sport>.json)"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Teams scraped at once with --teams-file (default: 4)"
+    )
     parser.add_argument(
         "--output",
         help="Output JSON file path (default: stdout)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log per-table progress to stderr"
+    )
 
     args = parser.parse_args()
 
+    global VERBOSE
+    VERBOSE = args.verbose
+
+    if args.teams_file:
+        with open(args.teams_file) as f:
+            teams = json.load(f)
+        results = asyncio.run(scrape_many(teams, max_concurrency=args.max_concurrency,
+                                          batch_dir=args.batch_output))
+        payload = dump_json(results)
+
+        if args.output:
+            with open(args.output, 'wb') as f:
+                f.write(payload)
+            print(f"Results saved to {args.output}", file=sys.stderr)
+
+        _write_stdout(payload)
+
+        # Exit with error code if every team failed
+        if results and not any(r['success'] for r in results):
+            sys.exit(1)
+        return
+
+    if not (args.team_url and args.sport and args.school):
+        parser.error("--team-url, --sport and --school are required without --teams-file")
+
     # Scrape team staff
     result = scrape_team_staff(args.team_url, args.sport, args.school)
+    payload = dump_json(result)
 
     # Save to file if specified
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(payload)
         print(f"Results saved to {args.output}", file=sys.stderr)
 
         if result['success']:
@@ -895,7 +1687,7 @@ def main():
                   file=sys.stderr)
 
     # Always output JSON to stdout for pipeline processing
-    print(json.dumps(result, indent=2))
+    _write_stdout(payload)
 
     # Exit with error code if scraping failed
     if not result['success']:
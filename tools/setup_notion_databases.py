@@ -23,7 +23,9 @@ import argparse
 import json
 import os
 import sys
-import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 try:
     from notion_client import Client
@@ -36,6 +38,51 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Boston-area schools marked Local (matched case-insensitively anywhere in the name)
+LOCAL_SCHOOLS = [
+    "Boston College", "Boston University", "Northeastern", "Harvard",
+    "Tufts", "MIT", "Bentley", "Babson", "Brandeis", "Emerson",
+    "Emmanuel", "Simmons", "Wentworth", "Stonehill", "Suffolk",
+    "Regis", "Wellesley", "UMass Boston", "Fisher College",
+]
+LOCAL_SCHOOLS_LOWER = tuple(local.lower() for local in LOCAL_SCHOOLS)
+
+# Notion allows an average of 3 requests/second per integration
+NOTION_RATE_PER_SEC = 3
+# Worker threads issuing Notion calls; _notion_rate, not the pool size, keeps
+# them under NOTION_RATE_PER_SEC
+NOTION_MAX_WORKERS = 3
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: acquire() blocks so calls average `rate` per second.
+
+    Args:
+        rate (float): Calls allowed per second (and the burst size)
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve a token now (the bucket may go negative) and sleep off any deficit
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+# Acquired before every Notion API call, from any thread
+_notion_rate = RateLimiter(NOTION_RATE_PER_SEC)
+
 
 def get_notion_client():
     api_key = os.getenv('NOTION_API_KEY')
@@ -50,6 +97,7 @@ def create_schools_database(notion, parent_id):
     print("Creating Schools database...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         response = notion.databases.create(
             parent={"type": "page_id", "page_id": parent_id},
             title=[{"type": "text", "text": {"content": "Schools"}}],
@@ -96,6 +144,7 @@ def create_contacts_database(notion, parent_id, schools_db_id):
     print("Creating Contacts database...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         response = notion.databases.create(
             parent={"type": "page_id", "page_id": parent_id},
             title=[{"type": "text", "text": {"content": "Contacts"}}],
@@ -143,6 +192,7 @@ def create_templates_database(notion, parent_id):
     print("Creating Email Templates database...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         response = notion.databases.create(
             parent={"type": "page_id", "page_id": parent_id},
             title=[{"type": "text", "text": {"content": "Email Templates"}}],
@@ -179,6 +229,7 @@ def create_games_database(notion, parent_id, schools_db_id, contacts_db_id):
     print("Creating Games database...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         response = notion.databases.create(
             parent={"type": "page_id", "page_id": parent_id},
             title=[{"type": "text", "text": {"content": "Games"}}],
@@ -254,6 +305,7 @@ def create_email_queue_database(notion, parent_id, games_db_id, contacts_db_id,
     print("Creating Email Queue database...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         response = notion.databases.create(
             parent={"type": "page_id", "page_id": parent_id},
             title=[{"type": "text", "text": {"content": "Email Queue"}}],
@@ -350,42 +402,67 @@ Livite Sports Catering"""
         },
     ]
 
-    for template in templates:
-        try:
-            notion.pages.create(
-                parent={"database_id": templates_db_id},
-                properties={
-                    "Template Name": {"title": [{"text": {"content": template["name"]}}]},
-                    "Sport": {"select": {"name": template["sport"]}},
-                    "Sequence Step": {"number": template["sequence_step"]},
-                    "Days After Previous": {"number": template["days_after"]},
-                    "Subject Line": {"rich_text": [{"text": {"content": template["subject"]}}]},
-                    "Body": {"rich_text": [{"text": {"content": template["body"]}}]},
-                }
-            )
-            print(f"  Created template: {template['name']}", file=sys.stderr)
-        except APIResponseError as e:
-            print(f"  Error creating template {template['name']}: {e}", file=sys.stderr)
+    # The templates don't depend on each other, so they're created concurrently
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as pool:
+        futures = {pool.submit(_create_template_page, notion, templates_db_id, template): template
+                   for template in templates}
+        for future in as_completed(futures):
+            template = futures[future]
+            try:
+                future.result()
+                print(f"  Created template: {template['name']}", file=sys.stderr)
+            except APIResponseError as e:
+                print(f"  Error creating template {template['name']}: {e}", file=sys.stderr)
+
+
+def _create_template_page(notion, templates_db_id, template):
+    """Create one Email Templates page from a create_initial_templates entry."""
+    _notion_rate.acquire()
+    return notion.pages.create(
+        parent={"database_id": templates_db_id},
+        properties={
+            "Template Name": {"title": [{"text": {"content": template["name"]}}]},
+            "Sport": {"select": {"name": template["sport"]}},
+            "Sequence Step": {"number": template["sequence_step"]},
+            "Days After Previous": {"number": template["days_after"]},
+            "Subject Line": {"rich_text": [{"text": {"content": template["subject"]}}]},
+            "Body": {"rich_text": [{"text": {"content": template["body"]}}]},
+        }
+    )
 
 
 def update_env_file(db_ids):
-    """Update .env file with database IDs."""
+    """Update .env file with database IDs (replacing KEY= lines, appending missing keys)."""
     env_path = ".env"
 
     try:
-        with open(env_path, 'r') as f:
-            content = f.read()
-
-        # Update each database ID
+        try:
+            with open(env_path, 'r') as f:
+                lines = f.read().splitlines(keepends=True)
+        except FileNotFoundError:
+            lines = []
+
+        # Index KEY= lines in one pass
+        key_lines = {}
+        for i, line in enumerate(lines):
+            key, sep, _ = line.partition('=')
+            if sep:
+                key_lines.setdefault(key, []).append(i)
+
+        # Update each database ID in place, or append it
         for key, value in db_ids.items():
-            if value:
-                # Replace the line
-                pattern = rf'^{key}=.*$'
-                replacement = f'{key}={value}'
-                content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+            if not value:
+                continue
+            if key in key_lines:
+                for i in key_lines[key]:
+                    lines[i] = f'{key}={value}\n'
+            else:
+                if lines and not lines[-1].endswith('\n'):
+                    lines[-1] += '\n'
+                lines.append(f'{key}={value}\n')
 
         with open(env_path, 'w') as f:
-            f.write(content)
+            f.write(''.join(lines))
 
         print(f"\nUpdated {env_path} with database IDs", file=sys.stderr)
         return True
@@ -405,6 +482,7 @@ def add_response_tracking_properties(notion, email_queue_db_id):
     print("Adding response tracking properties to Email Queue...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         notion.databases.update(
             database_id=email_queue_db_id,
             properties={
@@ -425,6 +503,7 @@ def add_game_date_property(notion, email_queue_db_id):
     print("Adding Game Date to Email Queue...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         notion.databases.update(
             database_id=email_queue_db_id,
             properties={
@@ -443,6 +522,7 @@ def add_convert_to_order_property(notion, email_queue_db_id):
     print("Adding Convert to Order checkbox to Email Queue...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         notion.databases.update(
             database_id=email_queue_db_id,
             properties={
@@ -461,6 +541,7 @@ def add_local_property(notion, schools_db_id):
     print("Adding Local checkbox to Schools...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         notion.databases.update(
             database_id=schools_db_id,
             properties={
@@ -479,6 +560,7 @@ def add_local_game_property(notion, games_db_id):
     print("Adding Local Game checkbox to Games...", file=sys.stderr)
 
     try:
+        _notion_rate.acquire()
         notion.databases.update(
             database_id=games_db_id,
             properties={
@@ -492,15 +574,14 @@ def add_local_game_property(notion, games_db_id):
         return False
 
 
+def _update_page(notion, page_id, props):
+    """Rate-limited notion.pages.update, safe to call from worker threads."""
+    _notion_rate.acquire()
+    return notion.pages.update(page_id=page_id, properties=props)
+
+
 def mark_local_schools(notion, schools_db_id):
     """Set Local=True for Boston-area schools."""
-    LOCAL_SCHOOLS = [
-        "Boston College", "Boston University", "Northeastern", "Harvard",
-        "Tufts", "MIT", "Bentley", "Babson", "Brandeis", "Emerson",
-        "Emmanuel", "Simmons", "Wentworth", "Stonehill", "Suffolk",
-        "Regis", "Wellesley", "UMass Boston", "Fisher College",
-    ]
-
     print(f"Marking {len(LOCAL_SCHOOLS)} Boston-area schools as Local...", file=sys.stderr)
 
     # Query all schools
@@ -511,26 +592,34 @@ def mark_local_schools(notion, schools_db_id):
         kwargs = {"database_id": schools_db_id}
         if start_cursor:
             kwargs["start_cursor"] = start_cursor
+        _notion_rate.acquire()
         response = notion.databases.query(**kwargs)
         all_schools.extend(response['results'])
         has_more = response.get('has_more', False)
         start_cursor = response.get('next_cursor')
 
     print(f"  Found {len(all_schools)} schools total", file=sys.stderr)
-    marked = 0
 
+    matches = []
     for school in all_schools:
         props = school['properties']
         name = ''
         if props.get('School Name', {}).get('title'):
             name = ''.join(t.get('plain_text', '') for t in props['School Name']['title'])
 
-        if any(local.lower() in name.lower() for local in LOCAL_SCHOOLS):
+        name_lower = name.lower()
+        if any(local in name_lower for local in LOCAL_SCHOOLS_LOWER):
+            matches.append((school['id'], name))
+
+    # Update the matched pages concurrently (rate-limited to Notion's 3 req/s)
+    marked = 0
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as pool:
+        futures = {pool.submit(_update_page, notion, page_id, {"Local": {"checkbox": True}}): name
+                   for page_id, name in matches}
+        for future in as_completed(futures):
+            name = futures[future]
             try:
-                notion.pages.update(
-                    page_id=school['id'],
-                    properties={"Local": {"checkbox": True}}
-                )
+                future.result()
                 print(f"  Marked: {name}", file=sys.stderr)
                 marked += 1
             except APIResponseError as e:
@@ -545,6 +634,7 @@ def backfill_local_games(notion, games_db_id, schools_db_id):
     print("Backfilling Local Game flag on Games...", file=sys.stderr)
 
     # First, get all local school IDs
+    _notion_rate.acquire()
     local_response = notion.databases.query(
         database_id=schools_db_id,
         filter={"property": "Local", "checkbox": {"equals": True}}
@@ -564,31 +654,53 @@ def backfill_local_games(notion, games_db_id, schools_db_id):
         kwargs = {"database_id": games_db_id}
         if start_cursor:
             kwargs["start_cursor"] = start_cursor
+        _notion_rate.acquire()
         response = notion.databases.query(**kwargs)
         all_games.extend(response['results'])
         has_more = response.get('has_more', False)
         start_cursor = response.get('next_cursor')
 
     print(f"  Found {len(all_games)} games total", file=sys.stderr)
-    marked = 0
 
+    local_game_ids = []
     for game in all_games:
         props = game['properties']
         home_rel = props.get('Home Team', {}).get('relation', [])
         if home_rel and home_rel[0]['id'] in local_school_ids:
+            local_game_ids.append(game['id'])
+
+    # Update the matched pages concurrently (rate-limited to Notion's 3 req/s)
+    marked = 0
+    with ThreadPoolExecutor(max_workers=NOTION_MAX_WORKERS) as pool:
+        futures = {pool.submit(_update_page, notion, game_id, {"Local Game": {"checkbox": True}}): game_id
+                   for game_id in local_game_ids}
+        for future in as_completed(futures):
             try:
-                notion.pages.update(
-                    page_id=game['id'],
-                    properties={"Local Game": {"checkbox": True}}
-                )
+                future.result()
                 marked += 1
             except APIResponseError as e:
-                print(f"  Error updating game {game['id']}: {e}", file=sys.stderr)
+                print(f"  Error updating game {futures[future]}: {e}", file=sys.stderr)
 
     print(f"  Marked {marked} games as Local Game", file=sys.stderr)
     return marked
 
 
+def _abort_setup(failed_name, created):
+    """
+    Exit after a failed database create, listing the databases already made.
+
+    Args:
+        failed_name (str): Database that could not be created
+        created (dict): {database name: ID} created so far in this run
+    """
+    print(f"\nFailed to create {failed_name} database. Aborting.", file=sys.stderr)
+    if created:
+        print("Already created (archive these in Notion before re-running):", file=sys.stderr)
+        for name, db_id in created.items():
+            print(f"  {name}: {db_id}", file=sys.stderr)
+    sys.exit(1)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Set up Notion CRM databases")
     parser.add_argument(
@@ -725,36 +837,47 @@ def main():
 
     notion = get_notion_client()
 
-    # Create databases in order (respecting dependencies)
+    # Create databases in order (respecting dependencies). Email Templates has
+    # no relations, so once Schools exists (the parent page is writable) it's
+    # created alongside the Contacts → Games chain, and its initial templates
+    # alongside the Email Queue database.
     schools_db_id = create_schools_database(notion, parent_id)
     if not schools_db_id:
         print("\nFailed to create Schools database. Aborting.", file=sys.stderr)
         sys.exit(1)
-
-    contacts_db_id = create_contacts_database(notion, parent_id, schools_db_id)
-    if not contacts_db_id:
-        print("\nFailed to create Contacts database. Aborting.", file=sys.stderr)
-        sys.exit(1)
-
-    templates_db_id = create_templates_database(notion, parent_id)
-    if not templates_db_id:
-        print("\nFailed to create Templates database. Aborting.", file=sys.stderr)
-        sys.exit(1)
-
-    games_db_id = create_games_database(notion, parent_id, schools_db_id, contacts_db_id)
-    if not games_db_id:
-        print("\nFailed to create Games database. Aborting.", file=sys.stderr)
-        sys.exit(1)
-
-    email_queue_db_id = create_email_queue_database(
-        notion, parent_id, games_db_id, contacts_db_id, templates_db_id
-    )
-    if not email_queue_db_id:
-        print("\nFailed to create Email Queue database. Aborting.", file=sys.stderr)
-        sys.exit(1)
-
-    # Create initial templates
-    create_initial_templates(notion, templates_db_id)
+    created = {"Schools": schools_db_id}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        templates_future = pool.submit(create_templates_database, notion, parent_id)
+
+        contacts_db_id = create_contacts_database(notion, parent_id, schools_db_id)
+        if contacts_db_id:
+            created["Contacts"] = contacts_db_id
+            games_db_id = create_games_database(notion, parent_id, schools_db_id, contacts_db_id)
+        else:
+            games_db_id = None
+        if games_db_id:
+            created["Games"] = games_db_id
+
+        # Wait for Templates even when aborting, so its ID can be reported
+        templates_db_id = templates_future.result()
+        if templates_db_id:
+            created["Templates"] = templates_db_id
+
+        for name, db_id in (("Contacts", contacts_db_id), ("Games", games_db_id),
+                            ("Templates", templates_db_id)):
+            if not db_id:
+                _abort_setup(name, created)
+
+        # Create initial templates
+        initial_templates = pool.submit(create_initial_templates, notion, templates_db_id)
+
+        email_queue_db_id = create_email_queue_database(
+            notion, parent_id, games_db_id, contacts_db_id, templates_db_id
+        )
+        initial_templates.result()
+        if not email_queue_db_id:
+            _abort_setup("Email Queue", created)
 
     # Update .env file
     db_ids = {
@@ -0,0 +1,133 @@
+"""
+Registry of resolved athletics page URLs per site (e.g. staff directory).
+
+Discovering a staff directory means loading the athletics homepage and
+scanning its links; for a fixed set of schools the answer almost never
+changes. The registry remembers it per domain so later scrapes navigate
+straight to the directory. Entries expire after a TTL, and callers drop an
+entry as soon as its URL errors or yields no data, so a moved page is
+rediscovered.
+
+Usage:
+    from url_registry import get_registered_url, register_url, forget_url
+
+    directory_url = get_registered_url(base_url, 'staff')
+    if directory_url is None:
+        directory_url = find_staff_directory_url(page, base_url)
+        register_url(base_url, 'staff', directory_url)
+    ...
+    if not staff:
+        forget_url(base_url, 'staff', directory_url)
+
+Config:
+    URL_REGISTRY_TTL_DAYS (env, default 30) - 0 disables registry reads
+
+Storage: .tmp/cache/url_registry.json  {netloc: {kind: {url, registered_at}}}
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+from html_cache import CACHE_ROOT
+
+REGISTRY_PATH = os.path.join(CACHE_ROOT, 'url_registry.json')
+DEFAULT_TTL_DAYS = 30
+
+_registry = None
+_lock = threading.Lock()
+
+
+def _load():
+    """Load the registry file once per process (empty on first run)."""
+    global _registry
+    if _registry is None:
+        try:
+            with open(REGISTRY_PATH) as f:
+                _registry = json.load(f)
+        except (OSError, ValueError):
+            _registry = {}
+    return _registry
+
+
+def _save(registry):
+    """Write the registry (atomic replace so concurrent tools never read a half-written file)."""
+    os.makedirs(os.path.dirname(REGISTRY_PATH), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(REGISTRY_PATH), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(registry, f, indent=2)
+        os.replace(tmp_path, REGISTRY_PATH)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def _fresh_url(entry):
+    """URL of a registry entry if it is younger than the TTL, else None."""
+    # Read at call time so a .env loaded by the calling tool applies
+    ttl_days = float(os.getenv('URL_REGISTRY_TTL_DAYS', DEFAULT_TTL_DAYS))
+    # Entries without a timestamp (older registry files) count as expired
+    if not isinstance(entry, dict) or ttl_days <= 0:
+        return None
+    if time.time() - entry.get('registered_at', 0) > ttl_days * 86400:
+        return None
+    return entry.get('url')
+
+
+def get_registered_url(site_url, kind):
+    """
+    Return the remembered URL of `kind` for the site hosting `site_url`.
+
+    Args:
+        site_url (str): Any URL on the athletics site
+        kind (str): Page kind, e.g. 'staff'
+
+    Returns:
+        str or None: Registered URL, or None if unknown or expired
+    """
+    with _lock:
+        return _fresh_url(_load().get(urlparse(site_url).netloc, {}).get(kind))
+
+
+def register_url(site_url, kind, url):
+    """
+    Remember `url` as the page of `kind` for the site hosting `site_url`.
+
+    Args:
+        site_url (str): Any URL on the athletics site
+        kind (str): Page kind, e.g. 'staff'
+        url (str): Resolved page URL
+    """
+    with _lock:
+        registry = _load()
+        entries = registry.setdefault(urlparse(site_url).netloc, {})
+        if _fresh_url(entries.get(kind)) == url:
+            return
+        entries[kind] = {'url': url, 'registered_at': time.time()}
+        _save(registry)
+
+
+def forget_url(site_url, kind, url=None):
+    """
+    Drop the page of `kind` for the site hosting `site_url` (it errored or
+    yielded no data), so the next scrape rediscovers it.
+
+    Args:
+        site_url (str): Any URL on the athletics site
+        kind (str): Page kind, e.g. 'staff'
+        url (str): Only forget the entry if it still points at this URL
+    """
+    with _lock:
+        registry = _load()
+        entries = registry.get(urlparse(site_url).netloc, {})
+        entry = entries.get(kind)
+        if entry is None:
+            return
+        if url is not None and (entry.get('url') if isinstance(entry, dict) else entry) != url:
+            return
+        del entries[kind]
+        _save(registry)